@@ -0,0 +1,32 @@
+"""
+core/clock.py — Shared Wall-clock Snapshot
+===========================================
+Intent parsers that run against the same utterance read "now" from here,
+so they agree on one instant and pay for a single datetime.now() call.
+
+Exported functions:
+    now_cached() → datetime   (refreshed at most every _MAX_AGE seconds)
+
+Code that schedules against the clock (alarm_thread, timers) keeps calling
+datetime.now() / time.time() directly.
+"""
+
+import time
+from datetime import datetime
+
+_MAX_AGE = 0.05   # seconds a snapshot stays valid
+
+# (monotonic stamp, datetime) — replaced as one tuple so readers never see
+# a stamp paired with the wrong datetime.
+_cached: tuple[float, datetime | None] = (float("-inf"), None)
+
+
+def now_cached() -> datetime:
+    """Return datetime.now(), reusing a snapshot taken within the last 50 ms."""
+    global _cached
+    stamp, now = _cached
+    mono = time.monotonic()
+    if mono - stamp > _MAX_AGE:
+        now     = datetime.now()
+        _cached = (mono, now)
+    return now
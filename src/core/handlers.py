@@ -8,33 +8,77 @@ Exported functions:
     handle_active_command(text)    → State
     handle_pin_input(text)         → State
     handle_notice_recording(text)  → State
+
+Exported constants:
+    PROMPTS  — every fixed (non-formatted) string the assistant speaks,
+               pre-synthesised into the TTS cache at startup.
 """
 
+from __future__ import annotations
+
+import sys
 import time
-import numpy as np
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple
 
 from core.state import State
 from core.tts   import speak
 
 from utils.constants       import EXIT_WORD, PIN_PROMPT_TIMEOUT
 from utils.alarm_thread    import get_alarm, cancel_alarm
-from utils.timer_thread    import start_timer, cancel_timer, is_running, format_remaining
-from utils.auth            import authenticate_user
+from utils.keyword_matcher import KeywordMatcher
 
+from intents import time_intent, timer_intent, math_intent, notice_intent, volume_intent
 from intents.time_intent      import check_time_query, check_date_query
-from intents.remainder_intent import extract_alarm_intent
+from intents.remainder_intent import extract_alarm_intent, ALARM_KEYWORDS
 from intents.timer_intent     import extract_timer_intent
 from intents.math_intent      import extract_math_intent
 from intents.notice_intent    import extract_notice_intent
 from intents.volume_intent    import extract_volume_intent
 
-from utils.notice_thread import (
-    record_notice, schedule_notice,
-    cancel_notice, get_notice_status, format_notice_remaining,
-)
-from utils.volume_control import (
-    get_volume, set_volume, increase_volume, decrease_volume,
-    mute, unmute, is_muted,
+# The action back-ends (timer/notice threads, volume control, voice auth)
+# pull in sounddevice, pycaw/ALSA and the MFCC front-end.  They are
+# imported inside the handler that first needs them, so start-up only pays
+# for the lightweight intent parsers that run on every command.
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# ── Fixed prompts (pre-warmed into the TTS cache by main.py) ─────────────────
+# Keep in sync with the literal speak() calls below and in the background
+# alarm/timer threads.  Formatted strings (f"...") cannot be pre-synthesised.
+PROMPTS: tuple[str, ...] = (
+    # Timer
+    "टाइमर रद्द कर दिया।",
+    "कोई टाइमर नहीं चल रहा।",
+    "समय समझ नहीं आया। कृपया दोबारा बोलें।",
+    "उदाहरण: दस मिनट का टाइमर लगाओ।",
+    "टाइमर खत्म हो गया।",
+    # Alarm
+    "कोई अलार्म सेट नहीं है।",
+    "अलार्म सेट करने के लिए पासवर्ड बोलिए। कृपया अपना पिन बोलें।",
+    "अलार्म रद्द कर दिया गया।",
+    "अलार्म बज रहा है। समय हो गया।",
+    # Notice
+    "नोटिस रद्द कर दिया।",
+    "कोई नोटिस नहीं है।",
+    "नोटिस का समय समझ नहीं आया। दोबारा बोलें।",
+    "उदाहरण: दस मिनट बाद नोटिस लगाओ।",
+    "अब अपना नोटिस बोलिए। आपके पास 7 सेकंड हैं।",
+    "नोटिस रिकॉर्ड नहीं हो सका। दोबारा कोशिश करें।",
+    # Volume
+    "आवाज़ बंद कर दी।",
+    "वॉल्यूम कमांड समझ नहीं आया। कहिए: वॉल्यूम बढ़ाओ या वॉल्यूम कम करो।",
+    # Exit
+    "ठीक है, मैं सो रहा हूँ। धन्यवाद!",
+    # PIN / auth
+    "समय समाप्त। अलार्म सेट नहीं हुआ।",
+    "ठीक है, अलार्म रद्द।",
+    "प्रमाणीकरण सफल! अलार्म सेट हो रहा है।",
+    "अलार्म का समय समझ नहीं आया। कृपया दोबारा बोलें।",
+    "❌ गलत पासवर्ड (Wrong PIN)",
+    "अलार्म सेट नहीं हुआ।",
 )
 
 
@@ -48,19 +92,26 @@ assistant_ctx: dict = {
 }
 
 
+# Reused worker for notice recordings — no thread start-up per notice.  One
+# worker is enough: the mic can only serve one sd.rec() at a time anyway.
+_notice_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="NoticeRecorder")
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Timer handler
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _handle_timer(text: str) -> bool:
+def _handle_timer(text: str, lower: str, tokens: tuple[str, ...]) -> bool:
     """
     Parse and execute a timer command.
     Returns True if text was a timer command (caller should skip further checks).
     """
-    intent = extract_timer_intent(text)
+    intent = extract_timer_intent(text, lower, tokens)
     if intent is None:
         return False
 
+    from utils.timer_thread import start_timer, cancel_timer, is_running, format_remaining
+
     action = intent["action"]
 
     if action == "start":
@@ -90,12 +141,12 @@ def _handle_timer(text: str) -> bool:
 # Math handler
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _handle_math(text: str) -> bool:
+def _handle_math(text: str, lower: str) -> bool:
     """
     Parse and execute a math calculation command.
     Returns True if text was a math command.
     """
-    intent = extract_math_intent(text)
+    intent = extract_math_intent(text, lower)
     if intent is None:
         return False
 
@@ -108,11 +159,34 @@ def _handle_math(text: str) -> bool:
 # Alarm handlers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _handle_alarm_cancel(text: str) -> bool:
+# Keywords are matched against the lower-cased text (Devanagari is
+# unaffected by lower(), so one pass covers both Hindi and English forms).
+_ALARM_KWS     = ("अलार्म", "alarm")
+_CANCEL_KWS    = ("रद्द", "बंद", "cancel")
+_STATUS_KWS    = ("कब", "क्या", "बताओ", "status")
+_ALARM_SET_KWS = ALARM_KEYWORDS
+
+# One automaton over every dispatcher keyword and every intent module's
+# TRIGGERS — scanned once per utterance in handle_active_command().  Routes
+# branch on the resulting tag set and only call a parser whose triggers hit.
+_KEYWORDS = KeywordMatcher({
+    "exit":      (EXIT_WORD,),
+    "alarm":     _ALARM_KWS,
+    "cancel":    _CANCEL_KWS,
+    "status":    _STATUS_KWS,
+    "alarm_set": _ALARM_SET_KWS,
+    "time":      time_intent.TIME_TRIGGERS,
+    "date":      time_intent.DATE_TRIGGERS,
+    "volume":    volume_intent.TRIGGERS,
+    "timer":     timer_intent.TRIGGERS,
+    "math":      math_intent.TRIGGERS,
+    "notice":    notice_intent.TRIGGERS,
+})
+
+
+def _handle_alarm_cancel(text: str, hits: frozenset[str]) -> bool:
     """Handle 'alarm cancel' commands. Returns True if matched."""
-    if not ("अलार्म" in text or "alarm" in text.lower()):
-        return False
-    if not ("रद्द" in text or "बंद" in text or "cancel" in text.lower()):
+    if not ("alarm" in hits and "cancel" in hits):
         return False
 
     if get_alarm():
@@ -122,11 +196,9 @@ def _handle_alarm_cancel(text: str) -> bool:
     return True
 
 
-def _handle_alarm_status(text: str) -> bool:
+def _handle_alarm_status(text: str, hits: frozenset[str]) -> bool:
     """Handle 'alarm status' commands. Returns True if matched."""
-    if not ("अलार्म" in text or "alarm" in text.lower()):
-        return False
-    if not ("कब" in text or "क्या" in text or "बताओ" in text or "status" in text.lower()):
+    if not ("alarm" in hits and "status" in hits):
         return False
 
     current = get_alarm()
@@ -134,13 +206,12 @@ def _handle_alarm_status(text: str) -> bool:
     return True
 
 
-def _handle_alarm_set(text: str) -> State:
+def _handle_alarm_set(text: str, hits: frozenset[str]) -> State:
     """
     Detect alarm-set intent and transition to AWAITING_PIN.
     Returns AWAITING_PIN if triggered, else ACTIVE.
     """
-    alarm_keywords = ["अलार्म", "जगाना", "उठाना", "याद"]
-    if not any(kw in text for kw in alarm_keywords):
+    if "alarm_set" not in hits:
         return State.ACTIVE
 
     assistant_ctx["pending_alarm_text"] = text
@@ -154,15 +225,19 @@ def _handle_alarm_set(text: str) -> State:
 # Notice handler
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _handle_notice(text: str) -> State:
+def _handle_notice(text: str, lower: str, tokens: tuple[str, ...]) -> tuple[State, bool]:
     """
     Parse and begin handling a notice command.
     If a start intent is detected, transitions to RECORDING_NOTICE.
-    Returns ACTIVE for cancel/status/no-match.
+
+    Returns (next_state, matched).  matched is False when the text is not
+    a notice command, so the caller never has to parse the text again.
     """
-    intent = extract_notice_intent(text)
+    intent = extract_notice_intent(text, lower, tokens)
     if intent is None:
-        return State.ACTIVE   # not a notice command — signal no-match
+        return State.ACTIVE, False   # not a notice command
+
+    from utils.notice_thread import cancel_notice, format_notice_remaining
 
     action = intent["action"]
 
@@ -171,16 +246,16 @@ def _handle_notice(text: str) -> State:
             speak("नोटिस रद्द कर दिया।")
         else:
             speak("कोई नोटिस नहीं है।")
-        return State.ACTIVE
+        return State.ACTIVE, True
 
     if action == "status":
         speak(format_notice_remaining())
-        return State.ACTIVE
+        return State.ACTIVE, True
 
     if action == "unclear":
         speak("नोटिस का समय समझ नहीं आया। दोबारा बोलें।")
         speak("उदाहरण: दस मिनट बाद नोटिस लगाओ।")
-        return State.ACTIVE
+        return State.ACTIVE, True
 
     # start_duration or start_clock — store delay and go to recording state
     delay = intent["delay"]
@@ -191,17 +266,17 @@ def _handle_notice(text: str) -> State:
     speak(f"ठीक है। {label} का नोटिस सेट होगा।")
     speak("अब अपना नोटिस बोलिए। आपके पास 7 सेकंड हैं।")
     print(f"📢 Notice recording mode — delay={delay:.0f}s label='{label}'")
-    return State.RECORDING_NOTICE
+    return State.RECORDING_NOTICE, True
 
 
 def handle_notice_recording(text: str) -> State:
     """
     Called when state == RECORDING_NOTICE.
     The Vosk text is ignored — we record raw audio from the mic in a
-    background thread so the main loop is never blocked.
+    background worker so the main loop is never blocked.
     Returns ACTIVE immediately.
     """
-    import threading
+    from utils.notice_thread import record_notice, schedule_notice
 
     delay = assistant_ctx.get("pending_notice_delay") or 60.0
     label = assistant_ctx.get("pending_notice_label", "")
@@ -216,8 +291,7 @@ def handle_notice_recording(text: str) -> State:
         else:
             speak("नोटिस रिकॉर्ड नहीं हो सका। दोबारा कोशिश करें।")
 
-    threading.Thread(target=_record_and_schedule, daemon=True,
-                     name="NoticeRecorder").start()
+    _notice_pool.submit(_record_and_schedule)
     return State.ACTIVE
 
 
@@ -225,15 +299,20 @@ def handle_notice_recording(text: str) -> State:
 # Volume handler
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _handle_volume(text: str) -> bool:
+def _handle_volume(text: str, lower: str, tokens: tuple[str, ...]) -> bool:
     """
     Parse and execute a volume command.
     Returns True if text was a volume command.
     """
-    intent = extract_volume_intent(text)
+    intent = extract_volume_intent(text, lower, tokens)
     if intent is None:
         return False
 
+    from utils.volume_control import (
+        get_volume, set_volume, increase_volume, decrease_volume,
+        mute, unmute, is_muted,
+    )
+
     action = intent["action"]
     step   = intent["step"]
 
@@ -278,55 +357,112 @@ def _handle_volume(text: str) -> bool:
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Public: ACTIVE state dispatcher
+# Route table — one adapter per handler, evaluated in priority order
 # ─────────────────────────────────────────────────────────────────────────────
 
-def handle_active_command(text: str) -> State:
-    """
-    Route a recognized command to the appropriate handler.
+class Command(NamedTuple):
+    """One recognised utterance, normalised once in handle_active_command()."""
+    text:   str                 # raw Vosk transcript
+    lower:  str                 # text.lower().strip()
+    tokens: tuple[str, ...]     # lower.split(), interned (NUMBER_WORDS keys are)
+    hits:   frozenset[str]      # _KEYWORDS tags found in lower
 
-    Priority order:
-        1. Exit
-        2. Time query
-        3. Volume control
-        4. Timer
-        5. Math
-        6. Notice
-        7. Alarm cancel / status / set
-    """
-    # 1 — Exit
-    if EXIT_WORD in text:
-        speak("ठीक है, मैं सो रहा हूँ। धन्यवाद!")
-        print("🙏 Going back to sleep...\n")
-        return State.SLEEPING
 
-    # 2 — Time / Date query (non-exclusive)
-    check_time_query(text)
-    check_date_query(text)
+# A route takes the Command and returns (handled, next_state).
+# The first route that reports handled=True ends dispatch.
+Route = Callable[[Command], tuple[bool, State]]
 
-    # 3 — Volume control
-    if _handle_volume(text):
-        return State.ACTIVE
 
-    # 4 — Timer
-    if _handle_timer(text):
-        return State.ACTIVE
+def _route_exit(cmd: Command) -> tuple[bool, State]:
+    if "exit" not in cmd.hits:
+        return False, State.ACTIVE
+    speak("ठीक है, मैं सो रहा हूँ। धन्यवाद!")
+    print("🙏 Going back to sleep...\n")
+    return True, State.SLEEPING
 
-    # 5 — Math
-    if _handle_math(text):
-        return State.ACTIVE
 
-    # 6 — Notice (before alarm — 'याद' keyword shared)
-    notice_state = _handle_notice(text)
-    if notice_state != State.ACTIVE or extract_notice_intent(text) is not None:
-        return notice_state
+def _route_time(cmd: Command) -> tuple[bool, State]:
+    # Non-exclusive: answers time/date queries but never ends dispatch.
+    if "time" in cmd.hits:
+        check_time_query(cmd.text)
+    if "date" in cmd.hits:
+        check_date_query(cmd.text)
+    return False, State.ACTIVE
 
-    # 7 — Alarm cancel / status / set
-    if _handle_alarm_cancel(text):
-        return State.ACTIVE
-    if _handle_alarm_status(text):
-        return State.ACTIVE
-    return _handle_alarm_set(text)
+
+def _route_volume(cmd: Command) -> tuple[bool, State]:
+    if "volume" not in cmd.hits:
+        return False, State.ACTIVE
+    return _handle_volume(cmd.text, cmd.lower, cmd.tokens), State.ACTIVE
+
+
+def _route_timer(cmd: Command) -> tuple[bool, State]:
+    if "timer" not in cmd.hits:
+        return False, State.ACTIVE
+    return _handle_timer(cmd.text, cmd.lower, cmd.tokens), State.ACTIVE
+
+
+def _route_math(cmd: Command) -> tuple[bool, State]:
+    if "math" not in cmd.hits:
+        return False, State.ACTIVE
+    return _handle_math(cmd.text, cmd.lower), State.ACTIVE
+
+
+def _route_notice(cmd: Command) -> tuple[bool, State]:
+    if "notice" not in cmd.hits:
+        return False, State.ACTIVE
+    state, matched = _handle_notice(cmd.text, cmd.lower, cmd.tokens)
+    return matched, state
+
+
+def _route_alarm_cancel(cmd: Command) -> tuple[bool, State]:
+    return _handle_alarm_cancel(cmd.text, cmd.hits), State.ACTIVE
+
+
+def _route_alarm_status(cmd: Command) -> tuple[bool, State]:
+    return _handle_alarm_status(cmd.text, cmd.hits), State.ACTIVE
+
+
+def _route_alarm_set(cmd: Command) -> tuple[bool, State]:
+    # Last route — always ends dispatch (ACTIVE when nothing matched).
+    return True, _handle_alarm_set(cmd.text, cmd.hits)
+
+
+# Priority order.  Notice comes before alarm — the 'याद' keyword is shared.
+_ROUTES: tuple[Route, ...] = (
+    _route_exit,            # 1. Exit
+    _route_time,            # 2. Time / date query (non-exclusive)
+    _route_volume,          # 3. Volume control
+    _route_timer,           # 4. Timer
+    _route_math,            # 5. Math
+    _route_notice,          # 6. Notice
+    _route_alarm_cancel,    # 7. Alarm cancel / status / set
+    _route_alarm_status,
+    _route_alarm_set,
+)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Public: ACTIVE state dispatcher
+# ─────────────────────────────────────────────────────────────────────────────
+
+def handle_active_command(text: str) -> State:
+    """
+    Route a recognized command to the appropriate handler.
+
+    Dispatch is data-driven: the text is normalised and keyword-scanned
+    once, then each entry of _ROUTES is tried in priority order until one
+    handles it.
+    """
+    lower  = text.lower().strip()
+    tokens = tuple(map(sys.intern, lower.split()))
+    cmd    = Command(text, lower, tokens, _KEYWORDS.scan(lower))
+
+    for route in _ROUTES:
+        handled, state = route(cmd)
+        if handled:
+            return state
+    return State.ACTIVE
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -360,6 +496,7 @@ def handle_pin_input(text: str, audio: np.ndarray | None = None) -> State:
         return State.ACTIVE
 
     # Authenticate (pass pre-captured audio so we don't do a second recording)
+    from utils.auth import authenticate_user
     print(f"🔑 PIN attempt: '{text}'")
     auth = authenticate_user(spoken_pin=text, check_voice=True, audio=audio)
     print(f"   PIN ok={auth['pin_ok']}  Voice ok={auth['voice_ok']}")
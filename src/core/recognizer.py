@@ -1,48 +1,102 @@
 """
 core/recognizer.py — Vosk Speech Recognizer + Audio Callback
 =============================================================
-Loads the Vosk model once at import time and exposes:
-    - `recognizer`  : KaldiRecognizer instance (pre-loaded)
-    - `callback()`  : sounddevice RawInputStream callback
-
-The callback drives the state machine by calling handlers from core/handlers.py.
+Loads the Vosk model once at import time (main.py imports this module
+inside main(), so only a real run pays for it) and exposes:
+    - `recognizer`         : KaldiRecognizer instance (pre-loaded)
+                             (SLEEPING and AWAITING_PIN use separate
+                             grammar-restricted recognizers limited to the
+                             wake word / PIN digit words)
+    - `callback()`         : sounddevice RawInputStream callback
+    - `start_asr_thread()` : starts the ASR worker — call once at startup
+    - `set_input_rate()`   : declare the mic rate if it is not SAMPLE_RATE
+
+The callback runs on PortAudio's real-time thread, so it only enqueues the
+raw audio block.  The ASR worker thread feeds Vosk, parses results and
+drives the state machine by calling handlers from core/handlers.py — a
+handler blocking on speak() can no longer overflow the input stream.
 """
 
+import os
+import re
 import json
+import logging
+import queue
+import threading
+import unicodedata
 import numpy as np
-from vosk import Model, KaldiRecognizer
+
+# Must be set before libvosk (and its BLAS) loads.  Both are defaults only:
+# an explicit value in the environment wins.
+os.environ.setdefault("OMP_NUM_THREADS", str(min(4, os.cpu_count() or 1)))
+
+from vosk import Model, KaldiRecognizer, SetLogLevel
+
+SetLogLevel(-1)   # silence Kaldi's per-model/per-utterance log lines
+
+# ── Optional fast JSON parser (orjson) — falls back to stdlib json ────────────
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 from utils.constants  import (
-    MODEL_PATH, SAMPLE_RATE, WAKE_WORD,
+    MODEL_PATH, SAMPLE_RATE, WAKE_WORD, EXIT_WORD, HINDI_PIN_WORDS,
     ASR_CONFIDENCE_THRESHOLD, ASR_MIN_WORD_LENGTH,
 )
 from utils.get_greet  import get_greeting
+from utils.resample   import StreamResampler
 from core.state       import State
 from core.tts         import speak
 from core.handlers    import handle_active_command, handle_pin_input, handle_notice_recording
 
+logger = logging.getLogger(__name__)
+
 # ── Audio buffer — collects raw int16 PCM from the mic while in AWAITING_PIN ──
 # voice_auth.verify_voice_from_audio() reads this so it does NOT need to call
 # sd.rec() (which would conflict with the open RawInputStream in main.py).
-_pin_audio_buffer: list[bytes] = []
+# A single growing bytearray: blocks are appended in place and handed to
+# numpy without an intermediate b"".join() copy.
+_pin_audio_buffer = bytearray()
 
 
 def get_pin_audio() -> np.ndarray:
-    """Return all PCM bytes recorded during the last PIN utterance as int16 array."""
-    if not _pin_audio_buffer:
-        return np.array([], dtype=np.int16)
-    raw = b"".join(_pin_audio_buffer)
-    return np.frombuffer(raw, dtype=np.int16)
+    """
+    Return all PCM bytes recorded during the last PIN utterance as an int16
+    array.  The array is a zero-copy view of the buffer — call
+    clear_pin_audio() before any further audio is appended.
+    """
+    return np.frombuffer(_pin_audio_buffer, dtype=np.int16)
 
 
 def clear_pin_audio() -> None:
-    _pin_audio_buffer.clear()
+    # Rebind rather than clear(): a live numpy view from get_pin_audio()
+    # pins the old buffer, which cannot be resized while exported.
+    global _pin_audio_buffer
+    _pin_audio_buffer = bytearray()
 
 
 # ── Load model once (expensive — do at startup, not per-call) ─────────────────
 print("⏳ Loading Vosk model...")
 _model     = Model(MODEL_PATH)
 recognizer = KaldiRecognizer(_model, SAMPLE_RATE)
+recognizer.SetMaxAlternatives(0)   # single best hypothesis only
+
+# AWAITING_PIN only ever needs digit words + the exit word.  A grammar-
+# restricted recognizer prunes the search to that vocabulary: faster PIN
+# decoding and no non-digit hallucinations reaching verify_pin().
+_PIN_GRAMMAR    = json.dumps(
+    [*HINDI_PIN_WORDS, EXIT_WORD, "[unk]"], ensure_ascii=False
+)
+_pin_recognizer = KaldiRecognizer(_model, SAMPLE_RATE, _PIN_GRAMMAR)
+_pin_recognizer.SetMaxAlternatives(0)
+
+# SLEEPING only needs the wake word.  Same idea: a two-entry grammar decodes
+# far faster than the full vocabulary during the idle time, which is most
+# of the time.
+_WAKE_GRAMMAR    = json.dumps([WAKE_WORD, "[unk]"], ensure_ascii=False)
+_wake_recognizer = KaldiRecognizer(_model, SAMPLE_RATE, _WAKE_GRAMMAR)
+_wake_recognizer.SetMaxAlternatives(0)
 print("✅ Vosk model loaded.\n")
 
 
@@ -50,6 +104,11 @@ print("✅ Vosk model loaded.\n")
 # ASR quality filter
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Matches any run of ASR_MIN_WORD_LENGTH or more non-space characters,
+# i.e. at least one token that is long enough to count as real speech.
+_LONG_WORD_RE = re.compile(r"\S{%d,}" % max(1, ASR_MIN_WORD_LENGTH))
+
+
 def _is_meaningful(result: dict, text: str, check_word_length: bool = True) -> bool:
     """
     Return True only when the utterance clears both quality gates.
@@ -81,22 +140,27 @@ def _is_meaningful(result: dict, text: str, check_word_length: bool = True) -> b
     # ── Gate 1: per-word confidence ───────────────────────────────────────────
     word_results = result.get("result", [])   # list[{"conf": float, ...}]
     if word_results and ASR_CONFIDENCE_THRESHOLD > 0.0:
-        avg_conf = sum(w.get("conf", 1.0) for w in word_results) / len(word_results)
+        confs    = np.fromiter(
+            (w.get("conf", 1.0) for w in word_results),
+            dtype=np.float32, count=len(word_results),
+        )
+        avg_conf = float(confs.mean())
         if avg_conf < ASR_CONFIDENCE_THRESHOLD:
             print(f"🔇 Low confidence ({avg_conf:.2f} < {ASR_CONFIDENCE_THRESHOLD}) — ignored: '{text}'")
             return False
 
     # ── Gate 2: minimum word length ───────────────────────────────────────────
     if check_word_length and ASR_MIN_WORD_LENGTH > 1:
-        tokens = text.split()
-        if tokens and all(len(tok) < ASR_MIN_WORD_LENGTH for tok in tokens):
+        # One C-level scan that stops at the first long-enough word — no
+        # token list is built.  `text` is already stripped and non-empty.
+        if _LONG_WORD_RE.search(text) is None:
             print(f"🔇 Too short (all words < {ASR_MIN_WORD_LENGTH} chars) — ignored: '{text}'")
             return False
 
     return True
 
 
-# ── Mutable state (shared with callback via closure) ──────────────────────────
+# ── Mutable state (owned by the ASR worker thread) ────────────────────────────
 _state: State = State.SLEEPING
 
 
@@ -113,31 +177,94 @@ def set_state(s: State) -> None:
 # Audio callback — called by sounddevice on every audio block
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Blocks waiting for the ASR worker.  At blocksize=8000 (0.5 s) this holds
+# ~16 s of audio — enough to ride out a long speak() in a handler.
+_audio_q: queue.Queue[bytes] = queue.Queue(maxsize=32)
+
+# Blocks dropped because _audio_q was full.  Only callback() writes it; the
+# ASR worker reports the increase, so the audio thread never does I/O.
+_dropped = 0
+
+
 def callback(indata, frames, time_info, status) -> None:
     """
     sounddevice RawInputStream callback.
-    Feeds audio to Vosk; on a complete utterance, routes to the state machine.
+    Runs on the real-time audio thread — only copies the block and enqueues
+    it for the ASR worker.  Blocks are dropped (and counted) if the worker
+    falls behind.
     """
+    global _dropped
+    try:
+        _audio_q.put_nowait(bytes(indata))
+    except queue.Full:
+        _dropped += 1
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ASR worker — feeds Vosk and routes complete utterances to the state machine
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Exact substring Vosk emits for a finalized segment with no words.
+_EMPTY_TEXT_MARKER = '"text" : ""'
+
+
+def _drop(rec: KaldiRecognizer) -> None:
+    """Discard a rejected utterance and start the next one from a clean lattice."""
+    rec.Reset()
+
+
+def _normalize(text: str) -> str:
+    """
+    Bring a transcript to NFC, the form every keyword and number table is
+    written in.  Vosk may emit precomposed nukta letters (e.g. U+095B ज़)
+    that NFC decomposes.  ASCII text is already NFC.
+    """
+    if text.isascii():
+        return text
+    return unicodedata.normalize("NFC", text)
+
+
+def _process_block(buf: bytes) -> None:
+    """Feed one audio block to Vosk; on a complete utterance, route it."""
     global _state
 
+    in_pin   = (_state == State.AWAITING_PIN)
+    sleeping = (_state == State.SLEEPING)
+    rec      = _pin_recognizer if in_pin else _wake_recognizer if sleeping else recognizer
+
     # Accumulate raw audio while waiting for PIN (for voice verification)
-    if _state == State.AWAITING_PIN:
-        _pin_audio_buffer.append(bytes(indata))
+    if in_pin:
+        _pin_audio_buffer.extend(buf)
 
-    if not recognizer.AcceptWaveform(bytes(indata)):
+    if not rec.AcceptWaveform(buf):
         return   # partial result — wait for more audio
 
-    result = json.loads(recognizer.Result())
+    raw = rec.Result()
+    # Silence-terminated segments come back as '{"text" : ""}' — skip the
+    # JSON parse entirely for them (the common case in a quiet room).
+    if _EMPTY_TEXT_MARKER in raw:
+        _drop(rec)
+        return
+    # Asleep, only the wake word matters; Vosk writes UTF-8 unescaped, so a
+    # substring test on the raw JSON rules out "[unk]"-only results.
+    if sleeping and WAKE_WORD not in raw:
+        _drop(rec)
+        return
+
+    result = _json.loads(raw)
     text   = result.get("text", "").strip()
 
     if not text:
+        _drop(rec)
         return
 
+    text = _normalize(text)
+
     # ── ASR quality gates — drop noise / hallucinations before state routing ──
     # In AWAITING_PIN, disable the word-length gate because PIN tokens like
     # "एक", "दो" (2 chars) would otherwise be incorrectly filtered out.
-    skip_len_check = (_state == State.AWAITING_PIN)
-    if not _is_meaningful(result, text, check_word_length=not skip_len_check):
+    if not _is_meaningful(result, text, check_word_length=not in_pin):
+        _drop(rec)
         return
 
     # ── SLEEPING: only listen for wake word ───────────────────────────────────
@@ -157,6 +284,7 @@ def callback(indata, frames, time_info, status) -> None:
         audio_arr = get_pin_audio()
         clear_pin_audio()
         _state = handle_pin_input(text, audio_arr)
+        _pin_recognizer.Reset()   # next PIN prompt starts from a clean lattice
         return
 
     # ── RECORDING_NOTICE: any speech triggers the notice recording ────────────
@@ -170,3 +298,51 @@ def callback(indata, frames, time_info, status) -> None:
     # ── ACTIVE: route to command handlers ─────────────────────────────────────
     print(f"👂 Command mode | Heard: {text}")
     _state = handle_active_command(text)
+
+
+# Mic rate → SAMPLE_RATE converter; None when the mic already runs at it.
+# Owned by the ASR worker: its filter state runs across blocks.
+_resampler: StreamResampler | None = None
+
+
+def set_input_rate(rate: int) -> None:
+    """
+    Declare the rate the microphone stream actually runs at.  If it is not
+    SAMPLE_RATE, the ASR worker resamples the block stream before Vosk sees
+    it — otherwise Vosk would have to resample internally on every call.
+    """
+    global _resampler
+    if rate == SAMPLE_RATE:
+        _resampler = None
+        return
+    _resampler = StreamResampler(rate, SAMPLE_RATE)
+    print(f"⚠️  Microphone runs at {rate} Hz, not {SAMPLE_RATE} Hz — resampling.")
+
+
+def _to_model_rate(buf: bytes) -> bytes:
+    """Resample the next int16 block of the mic stream to SAMPLE_RATE."""
+    return _resampler.process(np.frombuffer(buf, dtype=np.int16)).tobytes()
+
+
+def _asr_worker() -> None:
+    reported = 0                        # _dropped as of the last warning
+    while True:
+        buf = _audio_q.get()
+        dropped = _dropped
+        if dropped != reported:
+            logger.warning("ASR queue full — %d audio block(s) dropped.", dropped - reported)
+            reported = dropped
+        try:
+            if _resampler is not None:
+                buf = _to_model_rate(buf)
+            _process_block(buf)
+        except Exception as exc:
+            # A handler error must never kill the recognition loop.
+            print(f"❌ ASR worker error: {exc}")
+
+
+def start_asr_thread() -> None:
+    """Start the background ASR worker. Call once at program startup."""
+    t = threading.Thread(target=_asr_worker, daemon=True, name="ASRWorker")
+    t.start()
+    print("🎧 ASR thread started.")
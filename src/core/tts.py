@@ -1,41 +1,63 @@
 """
 core/tts.py — Hindi Text-to-Speech (gTTS + pygame)
 ====================================================
-Primary path  : gTTS  → temp MP3  → pygame.mixer playback
-Fallback path : Windows SAPI (System.Speech) via PowerShell
+Primary path  : gTTS  → cached MP3 → pygame.mixer playback
+Fallback path : Windows SAPI (in-process via pywin32, else a persistent
+               PowerShell + System.Speech process) or espeak-ng on Linux
                — activated when gTTS/pygame is unavailable.
 
-Temp-file lifecycle
--------------------
-1. tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") creates a
-   uniquely-named file; we close it immediately so pygame can open it.
-2. pygame plays the file; we poll mixer.music.get_busy() instead of
-   sleeping a fixed amount — playback ends exactly when the audio ends.
-3. Cleanup happens in a finally block so the temp file is ALWAYS removed,
-   even if playback raises an exception.
+Cache lifecycle
+---------------
+1. Each text is keyed by sha1(text) → TTS_CACHE_DIR/<key>.mp3.
+2. On a hit the cached MP3 is loaded straight into pygame — no network.
+3. On a miss gTTS synthesises into memory and the MP3 bytes are played
+   directly.  The bytes are also written to a temp file inside the cache
+   dir, which is atomically renamed into place (os.replace) so a crash
+   mid-write never leaves a truncated MP3 behind.
+4. When the cache grows past TTS_CACHE_MAX_FILES, the least-recently
+   used files (oldest mtime) are pruned.  Hits touch the file's mtime.
+5. The MP3 is decoded into a pygame.mixer.Sound whose length is known
+   up front, so playback waits with a single sleep of exactly that length
+   instead of waking every 50 ms to poll mixer.music.get_busy().
 
 Thread safety
 -------------
-A threading.Lock() serialises concurrent speak() calls (e.g. the main
-callback thread + alarm/timer background threads).  Non-blocking callers
-should pass blocking=False to fire-and-forget in a daemon thread.
+All audio is played by a single "TTSWorker" daemon thread that drains a
+queue, so two threads never play audio simultaneously and producers (the
+ASR worker, alarm/timer threads) never contend on a lock.  speak() enqueues
+the text; blocking callers then wait on a per-utterance Event, non-blocking
+callers (blocking=False) return immediately.  If the same text is still
+waiting in the queue, the new request is coalesced onto it instead of being
+spoken twice in a row; a repeat of the text currently playing is spoken again.
 
 Usage:
-    from core.tts import speak
+    from core.tts import speak, prewarm_cache
     speak("नमस्ते!")                 # blocking (default)
     speak("पृष्ठभूमि में", blocking=False)  # fire-and-forget
+    prewarm_cache(PROMPTS)           # synthesise fixed prompts at startup
 """
 
+import io
 import os
 import time
+import hashlib
 import tempfile
+import queue
 import threading
 import platform
 import subprocess
+import base64
 import logging
+import itertools
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.constants import TTS_CACHE_DIR, TTS_CACHE_MAX_FILES
 
 logger = logging.getLogger(__name__)
 
+_IS_WINDOWS = platform.system() == "Windows"   # fixed for the process lifetime
+
 # ── Try importing optional TTS/audio dependencies ────────────────────────────
 try:
     from gtts import gTTS as _gTTS
@@ -52,105 +74,308 @@ except Exception:
     _PYGAME_AVAILABLE = False
     logger.warning("pygame not available. Hindi TTS will use Windows SAPI fallback.")
 
-# Serialise all speak() calls so two threads never play audio simultaneously.
-_tts_lock = threading.Lock()
+# pywin32 gives in-process SAPI (no PowerShell cold start).  Windows-only.
+try:
+    import pythoncom as _pythoncom
+    import win32com.client as _win32com
+    _WIN32COM_AVAILABLE = True
+except ImportError:
+    _WIN32COM_AVAILABLE = False
+
+# ── TTS worker queue ─────────────────────────────────────────────────────────
+# Texts still waiting in the queue, each with the Event its callers wait on.
+# Guarded by _pending_lock; used to coalesce duplicates.  The worker removes a
+# text when it dequeues it, so a repeat of a text that is already playing is
+# queued and spoken again rather than merged into the current playback.
+_tts_q: queue.Queue[str] = queue.Queue()
+_pending: dict[str, threading.Event] = {}
+_pending_lock = threading.Lock()
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Internal helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _speak_gtts(text: str) -> bool:
-    """
-    Speak `text` using gTTS → temp MP3 → pygame.
+def _cache_path(text: str) -> str:
+    """Return the cache file path for `text` (sha1-keyed MP3)."""
+    key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+    return os.path.join(TTS_CACHE_DIR, f"{key}.mp3")
 
-    Returns True on success, False on any failure (caller tries fallback).
-    Temp file is always deleted in the finally block.
-    """
-    if not (_GTTS_AVAILABLE and _PYGAME_AVAILABLE):
-        return False
 
+def _prune_cache() -> None:
+    """Delete the least-recently used MP3s once the cache exceeds its limit."""
+    try:
+        entries = [
+            os.path.join(TTS_CACHE_DIR, name)
+            for name in os.listdir(TTS_CACHE_DIR)
+            if name.endswith(".mp3")
+        ]
+        excess = len(entries) - TTS_CACHE_MAX_FILES
+        if excess <= 0:
+            return
+        entries.sort(key=os.path.getmtime)   # oldest first
+        for path in entries[:excess]:
+            os.remove(path)
+    except OSError as exc:
+        logger.debug("TTS cache prune failed: %s", exc)
+
+
+def _touch(path: str) -> None:
+    """Mark a cached MP3 as recently used (pruning is by mtime)."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _synthesize(text: str) -> bytes | None:
+    """Synthesise `text` with gTTS straight into memory. None on failure."""
+    try:
+        bio = io.BytesIO()
+        _gTTS(text=text, lang="hi", slow=False).write_to_fp(bio)
+        return bio.getvalue()
+    except Exception as exc:
+        logger.debug("gTTS synthesis failed: %s", exc)
+        return None
+
+
+def _store_in_cache(path: str, data: bytes) -> None:
+    """Atomically write `data` to the cache path, then prune the cache."""
     tmp_path = None
     try:
-        # 1. Generate Hindi MP3 into a named temp file.
-        #    delete=False so pygame can open it after we close the handle.
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        # Write into the cache dir so the final rename stays on one filesystem.
         with tempfile.NamedTemporaryFile(
-            delete=False, suffix=".mp3", prefix="tts_"
+            delete=False, suffix=".part", prefix="tts_", dir=TTS_CACHE_DIR
         ) as tmp:
-            tmp_path = tmp.name   # remember path for cleanup
+            tmp_path = tmp.name
+            tmp.write(data)
+        os.replace(tmp_path, path)   # atomic — never a half-written MP3
+        tmp_path = None
+    except OSError as exc:
+        logger.debug("TTS cache write failed: %s", exc)
+    finally:
+        # Remove the partial file if the write or the rename failed.
+        if tmp_path and os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
-        tts = _gTTS(text=text, lang="hi", slow=False)
-        tts.save(tmp_path)
+    _prune_cache()
 
-        # 2. Play via pygame mixer.
-        _pygame.mixer.music.load(tmp_path)
-        _pygame.mixer.music.play()
 
-        # 3. Wait for playback to finish — no fixed sleep.
-        while _pygame.mixer.music.get_busy():
-            time.sleep(0.05)
+def _synthesize_cached(text: str) -> bool:
+    """
+    Ensure `text` is in the cache, synthesising it on a miss (no playback).
+    Returns False if gTTS is unavailable or synthesis fails.
+    """
+    if not _GTTS_AVAILABLE:
+        return False
 
-        # 4. Unload so the file handle is released before deletion.
-        _pygame.mixer.music.unload()
+    path = _cache_path(text)
+    if os.path.exists(path):
+        _touch(path)
+        return True
+
+    data = _synthesize(text)
+    if data is None:
+        return False
+    _store_in_cache(path, data)
+    return True
+
+
+def _speak_gtts(text: str) -> bool:
+    """
+    Speak `text` using gTTS → pygame.
+
+    Cache hits are decoded straight from the cached file; misses are
+    synthesised into memory and played from the MP3 bytes directly (no
+    temp-file round-trip), then written to the cache for next time.
+
+    Returns True on success, False on any failure (caller tries fallback).
+    """
+    if not (_GTTS_AVAILABLE and _PYGAME_AVAILABLE):
+        return False
+
+    path = _cache_path(text)
+    if os.path.exists(path):
+        _touch(path)
+        source = path
+    else:
+        data = _synthesize(text)
+        if data is None:
+            return False
+        _store_in_cache(path, data)
+        source = io.BytesIO(data)
+
+    try:
+        # 1. Decode the whole clip (short prompts) — no open file handle is
+        #    kept, so the cache can prune the MP3 at any time.
+        sound   = _pygame.mixer.Sound(source)
+        channel = sound.play()
+
+        # 2. Sleep once for the clip's known length, then absorb the few ms
+        #    of mixer latency.  No 50 ms polling loop.
+        time.sleep(sound.get_length())
+        while channel is not None and channel.get_busy():
+            time.sleep(0.005)
         return True
 
     except Exception as exc:
         logger.debug("gTTS/pygame playback failed: %s", exc)
         try:
-            # Ensure mixer is stopped before cleanup
-            _pygame.mixer.music.stop()
-            _pygame.mixer.music.unload()
+            # Ensure nothing keeps playing before the fallback speaks
+            _pygame.mixer.stop()
         except Exception:
             pass
         return False
 
-    finally:
-        # Always delete the temp file, even on error.
-        if tmp_path and os.path.exists(tmp_path):
-            try:
-                os.remove(tmp_path)
-            except OSError:
-                pass  # if locked briefly, skip — OS will clean it on reboot
 
-    return False  # unreachable, but satisfies the return-type checker
+# ── Windows SAPI engines (created lazily on the thread that first speaks) ─────
+_sapi_voice = None                          # SAPI.SpVoice COM object (pywin32)
+_ps_proc: subprocess.Popen | None = None    # persistent PowerShell fallback
+_ps_seq = itertools.count()                 # unique end-of-utterance markers
+
+_PS_INIT = (
+    "Add-Type -AssemblyName System.Speech; "
+    "$s = New-Object System.Speech.Synthesis.SpeechSynthesizer\n"
+)
+
+
+def _get_sapi_voice():
+    """Return an in-process SAPI.SpVoice, or None if pywin32 is unavailable."""
+    global _sapi_voice
+    if _sapi_voice is None and _WIN32COM_AVAILABLE:
+        try:
+            _pythoncom.CoInitialize()   # COM must be initialised per thread
+            _sapi_voice = _win32com.Dispatch("SAPI.SpVoice")
+        except Exception as exc:
+            logger.debug("SAPI.SpVoice unavailable: %s", exc)
+    return _sapi_voice
+
+
+def _get_ps_proc() -> subprocess.Popen:
+    """
+    Return a long-lived PowerShell process with System.Speech already loaded,
+    (re)starting it if it has exited.  Commands are fed via stdin, so the
+    ~150–400 ms PowerShell start-up + Add-Type cost is paid only once.
+    """
+    global _ps_proc
+    if _ps_proc is None or _ps_proc.poll() is not None:
+        _ps_proc = subprocess.Popen(
+            ["powershell", "-NoLogo", "-NoProfile", "-NonInteractive", "-Command", "-"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding="utf-8",
+        )
+        _ps_proc.stdin.write(_PS_INIT)
+        _ps_proc.stdin.flush()
+    return _ps_proc
+
+
+def _speak_powershell(text: str, blocking: bool) -> None:
+    """Speak via the persistent PowerShell process."""
+    proc   = _get_ps_proc()
+    marker = f"__tts_done_{next(_ps_seq)}__"
+    # Base64 sidesteps both quoting and console code-page issues for Hindi.
+    b64    = base64.b64encode(text.encode("utf-8")).decode("ascii")
+    proc.stdin.write(
+        f"$s.Speak([Text.Encoding]::UTF8.GetString("
+        f"[Convert]::FromBase64String('{b64}'))); "
+        f"Write-Output '{marker}'\n"
+    )
+    proc.stdin.flush()
+
+    if blocking:
+        # Skip markers left behind by earlier non-blocking calls.
+        for line in proc.stdout:
+            if line.strip() == marker:
+                break
+
+
+# ── espeak-ng engine (Linux / Pi) ─────────────────────────────────────────────
+_espeak_proc: subprocess.Popen | None = None  # persistent line-reading espeak-ng
+_espeak_lock = threading.Lock()
+
+
+def _get_espeak_proc() -> subprocess.Popen:
+    """
+    Return a long-lived espeak-ng process, (re)starting it if it has exited.
+    Given neither text nor --stdin, espeak-ng speaks each stdin line as it
+    arrives (--stdin would buffer until EOF, i.e. never on a kept-open pipe),
+    so the fork/exec and voice-table load happen once instead of per call.
+    """
+    global _espeak_proc
+    if _espeak_proc is None or _espeak_proc.poll() is not None:
+        _espeak_proc = subprocess.Popen(
+            ["espeak-ng", "-v", "hi"],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+    return _espeak_proc
+
+
+def _speak_espeak(text: str, blocking: bool) -> None:
+    """
+    Speak via espeak-ng.
+
+    espeak-ng reports no end-of-utterance in line mode, so a blocking call
+    runs its own espeak-ng and returns when it exits — i.e. when the audio
+    has finished.  Non-blocking calls go to the persistent process.
+    """
+    line = " ".join(text.split())   # an embedded newline would split the utterance
+    if blocking:
+        subprocess.run(
+            ["espeak-ng", "-v", "hi", line],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        return
+    with _espeak_lock:
+        _get_espeak_proc().stdin.write((line + "\n").encode("utf-8"))
 
 
 def _speak_sapi(text: str, blocking: bool = True) -> None:
     """
-    Fallback TTS using Windows System.Speech (English voice) via PowerShell,
-    or espeak-ng on Linux/Pi.
+    Fallback TTS using Windows SAPI, or espeak-ng on Linux/Pi.
+
+    On Windows the in-process SAPI.SpVoice COM object (pywin32) is used when
+    available, otherwise a persistent PowerShell + System.Speech process.
 
     Note: SAPI does NOT produce correct Hindi pronunciation — it is a
     last-resort fallback used only when gTTS or pygame are unavailable.
     """
     try:
-        if platform.system() == "Windows":
-            safe = text.replace("'", "\\'").replace('"', '\\"')
-            cmd = [
-                "powershell", "-NonInteractive", "-Command",
-                (
-                    "Add-Type -AssemblyName System.Speech; "
-                    "$s = New-Object System.Speech.Synthesis.SpeechSynthesizer; "
-                    f'$s.Speak("{safe}")'
-                ),
-            ]
-        else:
-            cmd = ["espeak-ng", "-v", "hi", text]
-
-        if blocking:
-            subprocess.run(
-                cmd, check=False,
-                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-            )
-        else:
-            subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-            )
+        if _IS_WINDOWS:
+            voice = _get_sapi_voice()
+            if voice is not None:
+                # SVSFlagsDefault = 0 (synchronous), SVSFlagsAsync = 1
+                voice.Speak(text, 0 if blocking else 1)
+            else:
+                _speak_powershell(text, blocking)
+            return
+
+        _speak_espeak(text, blocking)
     except Exception as exc:
         logger.debug("SAPI fallback failed: %s", exc)
 
 
+def _warm_fallback() -> None:
+    """
+    Start the Windows fallback engine ahead of the first utterance when
+    gTTS/pygame are unavailable, so that utterance does not pay the
+    PowerShell start-up.  Runs on the TTS worker thread (SAPI's COM object is
+    per thread).  The worker speaks blocking, which espeak-ng does with a
+    fresh process per utterance, so there is nothing to warm on Linux.
+    """
+    if not _IS_WINDOWS or (_GTTS_AVAILABLE and _PYGAME_AVAILABLE):
+        return
+    try:
+        if _get_sapi_voice() is None:
+            _get_ps_proc()
+    except Exception as exc:
+        logger.debug("Fallback TTS warm-up failed: %s", exc)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Public API
 # ─────────────────────────────────────────────────────────────────────────────
@@ -161,32 +386,107 @@ def speak(text: str, blocking: bool = True) -> None:
 
     Engine priority
     ---------------
-    1. gTTS (online, native Hindi voice)  +  pygame playback
+    1. gTTS (online on cache miss, native Hindi voice)  +  pygame playback
     2. Windows SAPI / espeak-ng (offline, limited Hindi accuracy)
 
     Args:
         text:     Hindi (Devanagari or Roman) text to speak.
         blocking: If True (default), returns only after audio finishes.
-                  If False, starts a daemon thread and returns immediately.
+                  If False, enqueues the text and returns immediately.
     """
     print(f"🔊 {text}")
 
+    with _pending_lock:
+        done = _pending.get(text)
+        if done is None:
+            done = _pending[text] = threading.Event()
+            _tts_q.put(text)
+
     if blocking:
-        _do_speak(text)
-    else:
-        t = threading.Thread(
-            target=_do_speak, args=(text,), daemon=True, name="TTSThread"
-        )
-        t.start()
+        done.wait()
+
+
+def prewarm_cache(texts: Iterable[str]) -> None:
+    """
+    Synthesise every string in `texts` into the TTS cache in the background.
+
+    Runs in a daemon thread (up to 4 parallel gTTS requests) and returns
+    immediately, so the first live use of each fixed prompt is a cache hit
+    instead of a network round-trip.  No audio is played.
+    """
+    if not _GTTS_AVAILABLE:
+        return
+
+    pending = [t for t in dict.fromkeys(texts) if not os.path.exists(_cache_path(t))]
+    if not pending:
+        return
+
+    def _run() -> None:
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="TTSPrewarm") as pool:
+            done = sum(pool.map(_synthesize_cached, pending))
+        logger.debug("TTS cache pre-warmed: %d/%d prompts", done, len(pending))
+
+    threading.Thread(target=_run, daemon=True, name="TTSPrewarm").start()
 
 
 def _do_speak(text: str) -> None:
-    """Acquire TTS lock, try gTTS then SAPI fallback."""
-    with _tts_lock:
+    """Try gTTS then SAPI fallback."""
+    try:
+        success = _speak_gtts(text)
+        if not success:
+            _speak_sapi(text, blocking=True)
+    except Exception as exc:
+        logger.debug("speak() failed entirely: %s", exc)
+        # TTS failure must NEVER crash the assistant.
+
+
+def _is_cached(text: str) -> bool:
+    return _GTTS_AVAILABLE and os.path.exists(_cache_path(text))
+
+
+def _next_batch() -> tuple[list[str], list[threading.Event]]:
+    """
+    Block for the next queued text, then take everything else that queued up
+    meanwhile (typically while the previous utterance was playing).
+
+    The texts leave _pending here, on dequeue: from now on a speak() of the
+    same text queues a fresh utterance instead of joining this one.
+    """
+    texts = [_tts_q.get()]
+    while True:
         try:
-            success = _speak_gtts(text)
-            if not success:
-                _speak_sapi(text, blocking=True)
-        except Exception as exc:
-            logger.debug("speak() failed entirely: %s", exc)
-            # TTS failure must NEVER crash the assistant.
+            texts.append(_tts_q.get_nowait())
+        except queue.Empty:
+            break
+    with _pending_lock:
+        events = [_pending.pop(t) for t in texts]
+    return texts, events
+
+
+def _tts_worker() -> None:
+    """
+    Play queued texts, releasing each text's waiters once it has played.
+
+    When several texts not yet in the TTS cache back up, they are synthesised
+    in parallel first — each under its own cache key, so every one of them
+    is a hit next time — and then played back to back from the cache.
+    """
+    _warm_fallback()
+    while True:
+        texts, events = _next_batch()
+        try:
+            misses = [t for t in texts if not _is_cached(t)]
+            if len(misses) > 1 and _PYGAME_AVAILABLE:
+                with ThreadPoolExecutor(max_workers=4, thread_name_prefix="TTSFetch") as pool:
+                    list(pool.map(_synthesize_cached, misses))
+            # Each waiter is released as soon as its own text has played,
+            # not after the rest of the batch queued behind it
+            for text, done in zip(texts, events):
+                _do_speak(text)
+                done.set()
+        finally:
+            for done in events:         # texts an exception kept from playing
+                done.set()
+
+
+threading.Thread(target=_tts_worker, daemon=True, name="TTSWorker").start()
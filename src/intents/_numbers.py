@@ -0,0 +1,141 @@
+"""
+intents/_numbers.py — Shared Number-word Table
+================================================
+One read-only word → value table (Hindi + Hinglish + English, 0-1000)
+used by every intent parser, so the modules cannot drift out of sync.
+
+Exports:
+  NUMBER_WORDS      — full table (MappingProxyType, read-only)
+  HOUR_WORDS_HINDI  — Devanagari subset for 1-12 (alarm hours)
+"""
+
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Number word → value mapping  (Hindi + Hinglish + English)
+# ─────────────────────────────────────────────────────────────────────────────
+
+_NUMBER_WORDS: dict[str, int] = {
+    # ── zero ──
+    "शून्य": 0, "zero": 0, "sifar": 0, "सिफर": 0,
+    # ── 1-9 ──
+    "एक": 1,   "ek": 1,    "one": 1,
+    "दो": 2,   "do": 2,    "two": 2,
+    "तीन": 3,  "teen": 3,  "three": 3,
+    "चार": 4,  "char": 4,  "four": 4,
+    "पांच": 5, "पाँच": 5,  "paanch": 5, "panch": 5, "five": 5,
+    "छह": 6,   "chhe": 6,  "chhah": 6,  "six": 6,
+    "सात": 7,  "saat": 7,  "seven": 7,
+    "आठ": 8,   "aath": 8,  "eight": 8,
+    "नौ": 9,   "nau": 9,   "nine": 9,
+    # ── 10-19 ──
+    "दस": 10,     "das": 10,     "ten": 10,
+    "ग्यारह": 11, "gyarah": 11,  "eleven": 11,
+    "बारह": 12,   "barah": 12,   "twelve": 12,
+    "तेरह": 13,   "terah": 13,   "thirteen": 13,
+    "चौदह": 14,   "chaudah": 14, "fourteen": 14,
+    "पंद्रह": 15, "pandrah": 15, "fifteen": 15,
+    "सोलह": 16,   "solah": 16,   "sixteen": 16,
+    "सत्रह": 17,  "satrah": 17,  "seventeen": 17,
+    "अठारह": 18,  "atharah": 18, "eighteen": 18,
+    "उन्नीस": 19, "unnees": 19,  "nineteen": 19,
+    # ── 20-99 (tens) ──
+    "बीस": 20,    "bees": 20,    "twenty": 20,
+    "इक्कीस": 21, "ikkees": 21,  "twenty one": 21,
+    "बाईस": 22,   "baees": 22,   "twenty two": 22,
+    "तेईस": 23,   "teis": 23,
+    "चौबीस": 24,  "chaubees": 24,
+    "पच्चीस": 25, "pachchees": 25, "twenty five": 25,
+    "छब्बीस": 26, "chabbees": 26,
+    "सत्ताईस": 27,"sattaees": 27,
+    "अट्ठाईस": 28,"atthaees": 28,
+    "उनतीस": 29,  "untees": 29,
+    "तीस": 30,    "tees": 30,    "thirty": 30,
+    "इकतीस": 31,  "iktees": 31,
+    "बत्तीस": 32, "battees": 32,
+    "तैंतीस": 33, "taintees": 33,
+    "चौंतीस": 34, "chauntees": 34,
+    "पैंतीस": 35, "paintees": 35,
+    "छत्तीस": 36, "chattees": 36,
+    "सैंतीस": 37, "saintees": 37,
+    "अड़तीस": 38, "adtees": 38,
+    "उनतालीस": 39,"untaalees": 39,
+    "चालीस": 40,  "chalis": 40,  "forty": 40,
+    "इकतालीस": 41,"iktaalees": 41,
+    "बयालीस": 42, "bayalees": 42,
+    "तैंतालीस": 43,"taintaalees": 43,
+    "चवालीस": 44, "chavalees": 44,
+    "पैंतालीस": 45,"paintaalees": 45,
+    "छियालीस": 46,"chhiyalees": 46,
+    "सैंतालीस": 47,"saintaalees": 47,
+    "अड़तालीस": 48,"adtaalees": 48,
+    "उनचास": 49,  "unchaas": 49,
+    "पचास": 50,   "pachaas": 50, "fifty": 50,
+    "इक्यावन": 51,"ikyaavan": 51,
+    "बावन": 52,   "baavan": 52,
+    "तिरपन": 53,  "tirpan": 53,
+    "चौवन": 54,   "chauvan": 54,
+    "पचपन": 55,   "pachpan": 55,
+    "छप्पन": 56,  "chhappan": 56,
+    "सत्तावन": 57,"sattaavan": 57,
+    "अट्ठावन": 58,"atthaavan": 58,
+    "उनसठ": 59,   "unsath": 59,
+    "साठ": 60,    "saath": 60,   "sixty": 60,
+    "इकसठ": 61,   "iksath": 61,
+    "बासठ": 62,   "baasath": 62,
+    "तिरसठ": 63,  "tirsath": 63,
+    "चौंसठ": 64,  "chaunsath": 64,
+    "पैंसठ": 65,  "painsath": 65,
+    "छियासठ": 66, "chhiyasath": 66,
+    "सड़सठ": 67,  "sadsath": 67,
+    "अड़सठ": 68,  "adsath": 68,
+    "उनहत्तर": 69,"unhattar": 69,
+    "सत्तर": 70,  "sattar": 70,  "seventy": 70,
+    "इकहत्तर": 71,"ikhattar": 71,
+    "बहत्तर": 72, "bahattar": 72,
+    "तिहत्तर": 73,"tihattar": 73,
+    "चौहत्तर": 74,"chauhattar": 74,
+    "पचहत्तर": 75,"pachhattar": 75,
+    "छिहत्तर": 76,"chhihattar": 76,
+    "सतहत्तर": 77,"sathattar": 77,
+    "अठहत्तर": 78,"athhattar": 78,
+    "उनासी": 79,  "unaasi": 79,
+    "अस्सी": 80,  "assi": 80,    "eighty": 80,
+    "इक्यासी": 81,"ikyaasi": 81,
+    "बयासी": 82,  "bayaasi": 82,
+    "तिरासी": 83, "tiraasi": 83,
+    "चौरासी": 84, "chauraasi": 84,
+    "पचासी": 85,  "pachaasi": 85,
+    "छियासी": 86, "chhiyaasi": 86,
+    "सत्तासी": 87,"sattaasi": 87,
+    "अट्ठासी": 88,"atthaasi": 88,
+    "नवासी": 89,  "navaasi": 89,
+    "नब्बे": 90,  "nabbe": 90,   "ninety": 90,
+    "इक्यानवे": 91,"ikyaanave": 91,
+    "बानवे": 92,  "baanave": 92,
+    "तिरानवे": 93,"tiraanave": 93,
+    "चौरानवे": 94,"chauraanave": 94,
+    "पचानवे": 95, "pachaanave": 95,
+    "छियानवे": 96,"chhiyaanave": 96,
+    "सत्तानवे": 97,"sattaanave": 97,
+    "अट्ठानवे": 98,"atthaanave": 98,
+    "निन्यानवे": 99,"ninyaanave": 99,
+    # ── 100, 1000 ──
+    "सौ": 100,   "sau": 100,   "hundred": 100,
+    "हजार": 1000,"hajar": 1000,"thousand": 1000,
+}
+
+# Keys are interned: Devanagari literals are not interned automatically, and
+# parsers intern their tokens, so lookups hit on the identity check.
+NUMBER_WORDS: Mapping[str, int] = MappingProxyType({
+    sys.intern(w): v for w, v in _NUMBER_WORDS.items()
+})
+
+# Devanagari words for 1-12 — the hour words the alarm parser looks for.
+# Hinglish spellings are excluded there because that parser matches
+# substrings, and "do"/"ek" occur inside ordinary words.
+HOUR_WORDS_HINDI: Mapping[str, int] = MappingProxyType({
+    w: v for w, v in _NUMBER_WORDS.items() if 1 <= v <= 12 and not w.isascii()
+})
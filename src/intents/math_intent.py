@@ -14,6 +14,8 @@ Supported number forms:
   • Hindi words:  एक, दो, तीन … नब्बे, सौ, हजार
   • Hinglish:     ek, do, teen, char, paanch …
   • Digits:       1, 2, 3 … 999
+  • Compounds:    "दो सौ पांच" → 205, "एक हजार दो सौ" → 1200,
+                  multi-word keys like "twenty one"
 
 Returns:
   extract_math_intent(text) → dict | None
@@ -28,161 +30,79 @@ Returns:
   Returns None if text is not a math command.
 """
 
+import logging
 import re
+import sys
+import operator
+from collections.abc import Mapping
+from functools import lru_cache
+
+from intents._numbers      import NUMBER_WORDS
+from utils.keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Number word → value mapping  (Hindi + Hinglish + English)
+# Number words  (table shared via intents/_numbers.py)
 # ─────────────────────────────────────────────────────────────────────────────
 
-NUMBER_WORDS: dict[str, float] = {
-    # ── zero ──
-    "शून्य": 0, "zero": 0, "sifar": 0, "सिफर": 0,
-    # ── 1-9 ──
-    "एक": 1,   "ek": 1,    "one": 1,
-    "दो": 2,   "do": 2,    "two": 2,
-    "तीन": 3,  "teen": 3,  "three": 3,
-    "चार": 4,  "char": 4,  "four": 4,
-    "पांच": 5, "पाँच": 5,  "paanch": 5, "panch": 5, "five": 5,
-    "छह": 6,   "chhe": 6,  "chhah": 6,  "six": 6,
-    "सात": 7,  "saat": 7,  "seven": 7,
-    "आठ": 8,   "aath": 8,  "eight": 8,
-    "नौ": 9,   "nau": 9,   "nine": 9,
-    # ── 10-19 ──
-    "दस": 10,     "das": 10,     "ten": 10,
-    "ग्यारह": 11, "gyarah": 11,  "eleven": 11,
-    "बारह": 12,   "barah": 12,   "twelve": 12,
-    "तेरह": 13,   "terah": 13,   "thirteen": 13,
-    "चौदह": 14,   "chaudah": 14, "fourteen": 14,
-    "पंद्रह": 15, "pandrah": 15, "fifteen": 15,
-    "सोलह": 16,   "solah": 16,   "sixteen": 16,
-    "सत्रह": 17,  "satrah": 17,  "seventeen": 17,
-    "अठारह": 18,  "atharah": 18, "eighteen": 18,
-    "उन्नीस": 19, "unnees": 19,  "nineteen": 19,
-    # ── 20-99 (tens) ──
-    "बीस": 20,    "bees": 20,    "twenty": 20,
-    "इक्कीस": 21, "ikkees": 21,  "twenty one": 21,
-    "बाईस": 22,   "baees": 22,   "twenty two": 22,
-    "तेईस": 23,   "tees": 23,
-    "चौबीस": 24,  "chaubees": 24,
-    "पच्चीस": 25, "pachchees": 25,
-    "छब्बीस": 26, "chabbees": 26,
-    "सत्ताईस": 27,"sattaees": 27,
-    "अट्ठाईस": 28,"atthaees": 28,
-    "उनतीस": 29,  "untees": 29,
-    "तीस": 30,    "tees": 30,    "thirty": 30,
-    "इकतीस": 31,  "iktees": 31,
-    "बत्तीस": 32, "battees": 32,
-    "तैंतीस": 33, "taintees": 33,
-    "चौंतीस": 34, "chauntees": 34,
-    "पैंतीस": 35, "paintees": 35,
-    "छत्तीस": 36, "chattees": 36,
-    "सैंतीस": 37, "saintees": 37,
-    "अड़तीस": 38, "adtees": 38,
-    "उनतालीस": 39,"untaalees": 39,
-    "चालीस": 40,  "chalis": 40,  "forty": 40,
-    "इकतालीस": 41,"iktaalees": 41,
-    "बयालीस": 42, "bayalees": 42,
-    "तैंतालीस": 43,"taintaalees": 43,
-    "चवालीस": 44, "chavalees": 44,
-    "पैंतालीस": 45,"paintaalees": 45,
-    "छियालीस": 46,"chhiyalees": 46,
-    "सैंतालीस": 47,"saintaalees": 47,
-    "अड़तालीस": 48,"adtaalees": 48,
-    "उनचास": 49,  "unchaas": 49,
-    "पचास": 50,   "pachaas": 50, "fifty": 50,
-    "इक्यावन": 51,"ikyaavan": 51,
-    "बावन": 52,   "baavan": 52,
-    "तिरपन": 53,  "tirpan": 53,
-    "चौवन": 54,   "chauvan": 54,
-    "पचपन": 55,   "pachpan": 55,
-    "छप्पन": 56,  "chhappan": 56,
-    "सत्तावन": 57,"sattaavan": 57,
-    "अट्ठावन": 58,"atthaavan": 58,
-    "उनसठ": 59,   "unsath": 59,
-    "साठ": 60,    "saath": 60,   "sixty": 60,
-    "इकसठ": 61,   "iksath": 61,
-    "बासठ": 62,   "baasath": 62,
-    "तिरसठ": 63,  "tirsath": 63,
-    "चौंसठ": 64,  "chaunsath": 64,
-    "पैंसठ": 65,  "painsath": 65,
-    "छियासठ": 66, "chhiyasath": 66,
-    "सड़सठ": 67,  "sadsath": 67,
-    "अड़सठ": 68,  "adsath": 68,
-    "उनहत्तर": 69,"unhattar": 69,
-    "सत्तर": 70,  "sattar": 70,  "seventy": 70,
-    "इकहत्तर": 71,"ikhattar": 71,
-    "बहत्तर": 72, "bahattar": 72,
-    "तिहत्तर": 73,"tihattar": 73,
-    "चौहत्तर": 74,"chauhattar": 74,
-    "पचहत्तर": 75,"pachhattar": 75,
-    "छिहत्तर": 76,"chhihattar": 76,
-    "सतहत्तर": 77,"sathattar": 77,
-    "अठहत्तर": 78,"athhattar": 78,
-    "उनासी": 79,  "unaasi": 79,
-    "अस्सी": 80,  "assi": 80,    "eighty": 80,
-    "इक्यासी": 81,"ikyaasi": 81,
-    "बयासी": 82,  "bayaasi": 82,
-    "तिरासी": 83, "tiraasi": 83,
-    "चौरासी": 84, "chauraasi": 84,
-    "पचासी": 85,  "pachaasi": 85,
-    "छियासी": 86, "chhiyaasi": 86,
-    "सत्तासी": 87,"sattaasi": 87,
-    "अट्ठासी": 88,"atthaasi": 88,
-    "नवासी": 89,  "navaasi": 89,
-    "नब्बे": 90,  "nabbe": 90,   "ninety": 90,
-    "इक्यानवे": 91,"ikyaanave": 91,
-    "बानवे": 92,  "baanave": 92,
-    "तिरानवे": 93,"tiraanave": 93,
-    "चौरानवे": 94,"chauraanave": 94,
-    "पचानवे": 95, "pachaanave": 95,
-    "छियानवे": 96,"chhiyaanave": 96,
-    "सत्तानवे": 97,"sattaanave": 97,
-    "अट्ठानवे": 98,"atthaanave": 98,
-    "निन्यानवे": 99,"ninyaanave": 99,
-    # ── 100, 1000 ──
-    "सौ": 100,   "sau": 100,   "hundred": 100,
-    "हजार": 1000,"hajar": 1000,"thousand": 1000,
-}
+# Token trie over NUMBER_WORDS keys so multi-word keys ("twenty one") match.
+# Each node maps token → child node; _TRIE_VALUE holds a complete key's value.
+_TRIE_VALUE = None   # sentinel key — tokens are never None
+
+
+def _build_number_trie(words: Mapping[str, float]) -> dict:
+    root: dict = {}
+    for phrase, val in words.items():
+        node = root
+        for tok in phrase.split():
+            node = node.setdefault(sys.intern(tok), {})
+        node[_TRIE_VALUE] = val
+    return root
+
+
+_NUMBER_TRIE = _build_number_trie(NUMBER_WORDS)
+_MULTIPLIERS = frozenset({100, 1000})   # सौ / हजार
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Operator keyword sets  (all lowercase)
 # ─────────────────────────────────────────────────────────────────────────────
 
-ADD_WORDS = {
+ADD_WORDS = frozenset({
     # Hindi
     "जोड़", "जोड़ो", "जोड़ना", "जोड़कर", "जोड़ दो", "जोड़ें",
     "और", "धन", "योग", "प्लस",
     # Hinglish / English
     "plus", "add", "jod", "jodo", "jodan", "jodna", "aur",
     "addition", "sum",
-}
+})
 
-SUB_WORDS = {
+SUB_WORDS = frozenset({
     # Hindi
     "घटाओ", "घटा", "घटाना", "घटाकर", "घटा दो", "घटाएं",
     "माइनस", "ऋण", "अंतर", "कम",
     # Hinglish / English
     "minus", "ghatao", "ghata", "ghatana", "subtract", "subtraction",
     "difference", "kam",
-}
+})
 
-MUL_WORDS = {
+MUL_WORDS = frozenset({
     # Hindi
     "गुणा", "गुणित", "गुणा करो", "गुणा दो", "बार",
     "गुणनफल", "गुणांक",
     # Hinglish / English
     "times", "multiply", "multiplication", "guna", "gunna",
     "x", "into", "product",
-}
+})
 
-DIV_WORDS = {
+DIV_WORDS = frozenset({
     # Hindi
     "भाग", "भाग दो", "भाग करो", "बटा", "विभाजित",
     "भागफल",
     # Hinglish / English
     "divide", "divided", "division", "bhaag", "bata",
     "per", "by",
-}
+})
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Trigger: must contain at least one operator word to be a math command
@@ -190,43 +110,116 @@ DIV_WORDS = {
 
 ALL_OP_WORDS = ADD_WORDS | SUB_WORDS | MUL_WORDS | DIV_WORDS
 
+# One automaton over every operator word, tagged with its op
+_OP_MATCHER  = KeywordMatcher({
+    "add": ADD_WORDS,
+    "sub": SUB_WORDS,
+    "mul": MUL_WORDS,
+    "div": DIV_WORDS,
+})
+_OP_PRIORITY = ("add", "sub", "mul", "div")
+
 # Symbols that map directly to operators
 OP_SYMBOLS = {"+": "add", "-": "sub", "×": "mul", "÷": "div",
               "*": "mul", "/": "div", "x": "mul"}
 
+# Substrings at least one of which every math command contains
+# (used by core/handlers.py to skip parsing unrelated utterances)
+TRIGGERS = ALL_OP_WORDS | OP_SYMBOLS.keys()
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _parse_number(token: str) -> float | None:
+_NUM_RE = re.compile(r'\d+\.?\d*|\.\d+')   # "42", "3.5", "5.", ".5"
+
+
+def _match_number_word(tokens: list[str], i: int) -> tuple[float | None, int]:
     """
-    Try to parse a single token as a number.
-    Accepts: digit strings ("42"), float strings ("3.5"),
-             Hindi/Hinglish words ("तीन", "teen").
+    Match the longest number at tokens[i]: a digit token, or a (possibly
+    multi-word) NUMBER_WORDS key found by walking _NUMBER_TRIE.
+    Returns (value, tokens_consumed) or (None, 0).
     """
-    t = token.strip().lower()
-    # Pure digit / float
-    try:
-        return float(t)
-    except ValueError:
-        pass
-    # Word lookup
-    return NUMBER_WORDS.get(t)
+    tok = tokens[i]
+    if _NUM_RE.fullmatch(tok):
+        return float(tok), 1
+
+    # The trie already holds every NUMBER_WORDS key (one-word keys are
+    # depth-1 nodes), so words need no separate dict probe.
+    best, consumed = None, 0
+    trie_value     = _TRIE_VALUE
+    n_tokens       = len(tokens)
+    node = _NUMBER_TRIE.get(tok)
+    j    = i + 1
+    while node is not None:
+        if trie_value in node:
+            best, consumed = node[trie_value], j - i
+        if j >= n_tokens:
+            break
+        node = node.get(tokens[j])
+        j += 1
+    return best, consumed
+
+
+def _consume_number_phrase(tokens: list[str], i: int) -> tuple[float | None, int]:
+    """
+    Greedily read a compound number starting at tokens[i].
 
+    Units combine only through the सौ (100) / हजार (1000) multipliers, so
+    "दो सौ पांच" → 205 and "एक हजार दो सौ" → 1200, while two plain numbers
+    in a row ("पांच सात") stay separate.
+    Returns (value, tokens_consumed) or (None, 0) if tokens[i] is not a number.
+    """
+    val, n = _match_number_word(tokens, i)
+    if val is None:
+        return None, 0
+
+    total     = 0                       # completed thousands
+    cur       = val                     # current group (< 1000)
+    prev_mult = val in _MULTIPLIERS     # was the last piece a multiplier?
+    j         = i + n
+
+    while j < len(tokens):
+        nxt, n = _match_number_word(tokens, j)
+        if nxt is None:
+            break
+        if nxt in _MULTIPLIERS and not prev_mult:
+            if nxt == 1000:
+                total += cur * 1000
+                cur    = 0
+            elif cur < 100:
+                cur   *= 100
+            else:
+                break
+            prev_mult = True
+        elif nxt not in _MULTIPLIERS and prev_mult and nxt < 100:
+            cur      += nxt
+            prev_mult = False
+        else:
+            break
+        j += n
 
-def _tokenize(text: str) -> list[str]:
+    return total + cur, j - i
+
+
+# Operator symbols → spaced words.  str.translate accepts multi-character
+# replacements, so every symbol is rewritten in a single pass.
+_SYMBOL_TABLE = str.maketrans({
+    "×": " गुणा ", "÷": " भाग ", "+": " plus ",
+    "-": " minus ", "*": " multiply ", "/": " divide ",
+})
+
+
+def _tokenize(lower: str) -> list[str]:
     """
-    Lowercase, normalise, split into tokens.
+    Normalise and split already-lowercased text into tokens.
     Keeps Hindi Unicode intact; splits on spaces and common punctuation.
     """
-    text = text.lower().strip()
-    # Replace common symbols with spaced versions
-    for sym, word in [("×", " गुणा "), ("÷", " भाग "), ("+", " plus "),
-                      ("-", " minus "), ("*", " multiply "), ("/", " divide ")]:
-        text = text.replace(sym, word)
-    # Split on whitespace
-    return text.split()
+    # Replace common symbols with spaced versions (one translate pass),
+    # then split on whitespace.  Tokens are interned so the NUMBER_WORDS /
+    # trie lookups compare by identity.
+    return list(map(sys.intern, lower.translate(_SYMBOL_TABLE).split()))
 
 
 def _detect_operator(tokens: list[str], lower: str) -> str | None:
@@ -234,17 +227,12 @@ def _detect_operator(tokens: list[str], lower: str) -> str | None:
     Return 'add'|'sub'|'mul'|'div' if an operator keyword is found.
     Checks multi-word phrases first, then single tokens.
     """
-    # Multi-word operator phrases (check full string)
-    multi_ops = [
-        (ADD_WORDS, "add"),
-        (SUB_WORDS, "sub"),
-        (MUL_WORDS, "mul"),
-        (DIV_WORDS, "div"),
-    ]
-    for word_set, op in multi_ops:
-        for phrase in sorted(word_set, key=len, reverse=True):  # longest first
-            if phrase in lower:
-                return op
+    # Operator words/phrases — one automaton pass over the full string.
+    # If several operators occur, the first in _OP_PRIORITY wins.
+    hits = _OP_MATCHER.scan(lower)
+    for op in _OP_PRIORITY:
+        if op in hits:
+            return op
 
     # Single-token symbols
     for tok in tokens:
@@ -260,12 +248,14 @@ def _extract_two_numbers(tokens: list[str]) -> tuple[float | None, float | None]
     skipping operator/filler words.
     """
     nums: list[float] = []
-    for tok in tokens:
-        val = _parse_number(tok)
-        if val is not None:
-            nums.append(val)
-            if len(nums) == 2:
-                break
+    i = 0
+    while i < len(tokens) and len(nums) < 2:
+        val, n = _consume_number_phrase(tokens, i)
+        if val is None:
+            i += 1
+            continue
+        nums.append(val)
+        i += n
     if len(nums) == 2:
         return nums[0], nums[1]
     if len(nums) == 1:
@@ -273,6 +263,7 @@ def _extract_two_numbers(tokens: list[str]) -> tuple[float | None, float | None]
     return None, None
 
 
+@lru_cache(maxsize=1024)   # small integer results repeat across a session
 def _format_result(val: float) -> str:
     """Return int string if whole number, else 2 decimal places."""
     if val == int(val):
@@ -280,17 +271,20 @@ def _format_result(val: float) -> str:
     return f"{val:.2f}"
 
 
+_OP_SYMBOL_MAP = {"add": "+", "sub": "−", "mul": "×", "div": "÷"}
+_OP_FUNCS      = {"add": operator.add, "sub": operator.sub,
+                  "mul": operator.mul, "div": operator.truediv}
+
+
 def _op_symbol(op: str) -> str:
-    return {
-        "add": "+", "sub": "−", "mul": "×", "div": "÷"
-    }.get(op, "?")
+    return _OP_SYMBOL_MAP.get(op, "?")
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Main parser
 # ─────────────────────────────────────────────────────────────────────────────
 
-def extract_math_intent(text: str) -> dict | None:
+def extract_math_intent(text: str, lower: str | None = None) -> dict | None:
     """
     Parse Hindi/Hinglish text for a math command.
 
@@ -302,9 +296,13 @@ def extract_math_intent(text: str) -> dict | None:
         result       : float
         answer       : Hindi TTS string
         equation     : human-readable equation string
+
+    `lower` (text.lower().strip()) may be passed in when the caller already
+    has it.  Math tokenizes on its own — operator symbols are spelled out.
     """
-    lower  = text.lower().strip()
-    tokens = _tokenize(text)
+    if lower is None:
+        lower = text.lower().strip()
+    tokens = _tokenize(lower)
 
     # ── Gate: must contain an operator keyword ────────────────────────────────
     op = _detect_operator(tokens, lower)
@@ -331,24 +329,15 @@ def extract_math_intent(text: str) -> dict | None:
         }
 
     # ── Calculate ─────────────────────────────────────────────────────────────
+    if op == "div" and num2 == 0:
+        return {
+            "num1": num1, "num2": 0, "op": "div",
+            "result": None,
+            "answer": "शून्य से भाग संभव नहीं।",
+            "equation": f"{int(num1)} ÷ 0 = ∞",
+        }
     try:
-        if op == "add":
-            result = num1 + num2
-        elif op == "sub":
-            result = num1 - num2
-        elif op == "mul":
-            result = num1 * num2
-        elif op == "div":
-            if num2 == 0:
-                return {
-                    "num1": num1, "num2": 0, "op": "div",
-                    "result": None,
-                    "answer": "शून्य से भाग संभव नहीं।",
-                    "equation": f"{int(num1)} ÷ 0 = ∞",
-                }
-            result = num1 / num2
-        else:
-            return None
+        result = _OP_FUNCS[op](num1, num2)
     except Exception:
         return None
 
@@ -356,7 +345,7 @@ def extract_math_intent(text: str) -> dict | None:
     equation   = f"{_format_result(num1)} {_op_symbol(op)} {_format_result(num2)} = {result_str}"
     answer     = f"उत्तर {result_str} है।"
 
-    print(f"🧮 Math: {equation}  (from: '{text}')")
+    logger.debug("Math: %s  (from: '%s')", equation, text)
 
     return {
         "num1":     num1,
@@ -35,47 +35,43 @@ Returns:
 """
 
 import re
-from datetime import datetime, timedelta
-
-# ── Hindi + Hinglish number words ─────────────────────────────────────────────
-_NUMS: dict[str, int] = {
-    "शून्य": 0, "zero": 0,
-    "एक": 1,   "ek": 1,    "one": 1,
-    "दो": 2,   "do": 2,    "two": 2,
-    "तीन": 3,  "teen": 3,  "three": 3,
-    "चार": 4,  "char": 4,  "four": 4,
-    "पांच": 5, "पाँच": 5,  "paanch": 5, "panch": 5, "five": 5,
-    "छह": 6,   "chhe": 6,  "six": 6,
-    "सात": 7,  "saat": 7,  "seven": 7,
-    "आठ": 8,   "aath": 8,  "eight": 8,
-    "नौ": 9,   "nau": 9,   "nine": 9,
-    "दस": 10,  "das": 10,  "ten": 10,
-    "ग्यारह": 11, "gyarah": 11, "eleven": 11,
-    "बारह": 12, "barah": 12, "twelve": 12,
-    "तेरह": 13, "terah": 13,
-    "चौदह": 14, "chaudah": 14,
-    "पंद्रह": 15, "pandrah": 15, "fifteen": 15,
-    "सोलह": 16, "solah": 16,
-    "सत्रह": 17, "satrah": 17,
-    "अठारह": 18, "atharah": 18,
-    "उन्नीस": 19, "unnees": 19,
-    "बीस": 20,  "bees": 20,  "twenty": 20,
-    "तीस": 30,  "tees": 30,  "thirty": 30,
-    "चालीस": 40, "chalis": 40, "forty": 40,
-    "पचास": 50, "pachaas": 50, "fifty": 50,
-    "साठ": 60,  "saath": 60,  "sixty": 60,
-}
+import sys
+from datetime import timedelta
 
-# ── Keyword sets ───────────────────────────────────────────────────────────────
-NOTICE_WORDS  = {"नोटिस", "notice", "याद", "reminder", "याद दिलाना", "याद दिलाओ"}
-CANCEL_WORDS  = {"रद्द", "cancel", "band", "बंद", "stop", "हटाओ", "rok"}
-STATUS_WORDS  = {"बाकी", "kitna", "कितना", "कब", "status", "baaki", "बताओ", "बजेगा"}
-AFTER_WORDS   = {"baad", "बाद", "mein", "में", "ke baad", "के बाद", "बाद में"}
-CLOCK_WORDS   = {"baje", "बजे", "bajke", "बजकर", "o'clock"}
+from core.clock            import now_cached
+from intents._numbers      import NUMBER_WORDS
+from utils.keyword_matcher import KeywordMatcher
+
+# ── Hindi + Hinglish number words (shared table) ───────────────────────────────
+_NUMS = NUMBER_WORDS
 
-SECOND_WORDS  = {"सेकंड", "second", "seconds", "sec"}
-MINUTE_WORDS  = {"मिनट", "minute", "minutes", "min"}
-HOUR_WORDS    = {"घंटे", "घंटा", "hour", "hours", "ghante", "ghanta"}
+# ── Keyword sets ───────────────────────────────────────────────────────────────
+NOTICE_WORDS  = frozenset({"नोटिस", "notice", "याद", "reminder", "याद दिलाना", "याद दिलाओ"})
+CANCEL_WORDS  = frozenset({"रद्द", "cancel", "band", "बंद", "stop", "हटाओ", "rok"})
+STATUS_WORDS  = frozenset({"बाकी", "kitna", "कितना", "कब", "status", "baaki", "बताओ", "बजेगा"})
+AFTER_WORDS   = frozenset({"baad", "बाद", "mein", "में", "ke baad", "के बाद", "बाद में"})
+CLOCK_WORDS   = frozenset({"baje", "बजे", "bajke", "बजकर", "o'clock"})
+
+# Unit words are probed with (interned) tokens, so intern them too
+SECOND_WORDS  = frozenset(map(sys.intern, {"सेकंड", "second", "seconds", "sec"}))
+MINUTE_WORDS  = frozenset(map(sys.intern, {"मिनट", "minute", "minutes", "min"}))
+HOUR_WORDS    = frozenset(map(sys.intern, {"घंटे", "घंटा", "hour", "hours", "ghante", "ghanta"}))
+_UNIT_MAP     = ({w: "second" for w in SECOND_WORDS}
+                 | {w: "minute" for w in MINUTE_WORDS}
+                 | {w: "hour"   for w in HOUR_WORDS})
+
+TRIGGERS      = NOTICE_WORDS   # gate keywords, also scanned by core/handlers.py
+
+# One automaton over every keyword set — scanned once per utterance
+_KEYWORDS = KeywordMatcher({
+    "notice": NOTICE_WORDS,
+    "cancel": CANCEL_WORDS,
+    "status": STATUS_WORDS,
+    "clock":  CLOCK_WORDS,
+})
+
+# ── Precompiled patterns ───────────────────────────────────────────────────────
+_RE_CLOCK = re.compile(r'(\d{1,2})[:\.](\d{2})')   # "7:30" / "7.30"
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -83,13 +79,13 @@ HOUR_WORDS    = {"घंटे", "घंटा", "hour", "hours", "ghante", "gha
 # ─────────────────────────────────────────────────────────────────────────────
 
 def _tok_to_num(tok: str) -> int | None:
-    t = tok.strip().lower()
-    if t.isdigit():
-        return int(t)
-    return _NUMS.get(t)
+    # tokens come from lower.split(): already lowercase, no spaces
+    if tok.isdigit():
+        return int(tok)
+    return _NUMS.get(tok)
 
 
-def _find_number(tokens: list[str]) -> tuple[int | None, int]:
+def _find_number(tokens: tuple[str, ...]) -> tuple[int | None, int]:
     for i, tok in enumerate(tokens):
         v = _tok_to_num(tok)
         if v is not None:
@@ -98,38 +94,20 @@ def _find_number(tokens: list[str]) -> tuple[int | None, int]:
 
 
 def _classify_unit(tok: str) -> str | None:
-    t = tok.lower()
-    if t in SECOND_WORDS: return "second"
-    if t in MINUTE_WORDS: return "minute"
-    if t in HOUR_WORDS:   return "hour"
-    return None
+    return _UNIT_MAP.get(tok)
 
 
 def _to_seconds(val: int, unit: str) -> int:
     return val if unit == "second" else val * 60 if unit == "minute" else val * 3600
 
 
-def _is_notice_command(lower: str) -> bool:
-    return any(nw in lower for nw in NOTICE_WORDS)
-
-
-def _is_after_pattern(lower: str) -> bool:
-    """True if text implies 'X time from now' (duration-based)."""
-    return any(aw in lower for aw in AFTER_WORDS)
-
-
-def _is_clock_pattern(lower: str) -> bool:
-    """True if text implies a specific clock time."""
-    return any(cw in lower for cw in CLOCK_WORDS)
-
-
-def _parse_clock_time(tokens: list[str], lower: str) -> tuple[int, int] | None:
+def _parse_clock_time(tokens: tuple[str, ...], lower: str) -> tuple[int, int] | None:
     """
     Try to extract (hour, minute) from tokens.
     Handles: "7 baje", "7:30 baje", "saat baje"
     """
     # "HH:MM" pattern
-    m = re.search(r'(\d{1,2})[:\.](\d{2})', lower)
+    m = _RE_CLOCK.search(lower)
     if m:
         return int(m.group(1)), int(m.group(2))
 
@@ -143,7 +121,7 @@ def _parse_clock_time(tokens: list[str], lower: str) -> tuple[int, int] | None:
 
 def _clock_to_delay(hour: int, minute: int) -> float:
     """Return seconds until the next occurrence of HH:MM (today or tomorrow)."""
-    now  = datetime.now()
+    now  = now_cached()
     target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
     if target <= now:
         target += timedelta(days=1)
@@ -154,35 +132,46 @@ def _clock_to_delay(hour: int, minute: int) -> float:
 # Main parser
 # ─────────────────────────────────────────────────────────────────────────────
 
-def extract_notice_intent(text: str) -> dict | None:
+def extract_notice_intent(
+    text: str,
+    lower: str | None = None,
+    tokens: tuple[str, ...] | None = None,
+) -> dict | None:
     """
     Parse Hindi/Hinglish text for a notice command.
     Returns a dict or None if not a notice command.
+
+    `lower` / `tokens` may be passed in when the caller has already
+    normalised the text (text.lower().strip() and its interned split()).
     """
-    lower  = text.lower().strip()
-    tokens = lower.split()
+    if lower is None:
+        lower = text.lower().strip()
+    hits = _KEYWORDS.scan(lower)
 
     # Gate: must mention notice/reminder
-    if not _is_notice_command(lower):
+    if "notice" not in hits:
         return None
 
+    if tokens is None:
+        tokens = tuple(map(sys.intern, lower.split()))
+
     # ── CANCEL ────────────────────────────────────────────────────────────────
-    if any(cw in lower for cw in CANCEL_WORDS):
+    if "cancel" in hits:
         return {"action": "cancel", "delay": None, "clock_hm": None, "label": ""}
 
     # ── STATUS ────────────────────────────────────────────────────────────────
-    if any(sw in lower for sw in STATUS_WORDS):
+    if "status" in hits:
         return {"action": "status", "delay": None, "clock_hm": None, "label": ""}
 
     # ── CLOCK TIME ("5 baje notice") ──────────────────────────────────────────
-    if _is_clock_pattern(lower):
+    if "clock" in hits:
         hm = _parse_clock_time(tokens, lower)
         if hm:
             h, m = hm
             # Apply AM/PM heuristic: if hour < 6 and no "subah", assume PM
             if h < 6 and "सुबह" not in lower and "subah" not in lower:
                 h += 12
-            h = min(h, 23)
+            h = 23 if h > 23 else h
             delay = _clock_to_delay(h, m)
             label = f"{h:02d}:{m:02d} बजे"
             return {
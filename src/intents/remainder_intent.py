@@ -5,27 +5,39 @@ Parses Hindi speech text to extract alarm/reminder intent,
 then calls set_alarm() from alarm_thread to actually schedule it.
 """
 
+import logging
 import re
-from datetime import datetime, timedelta
-from utils.alarm_thread import set_alarm
+from datetime import timedelta
+from core.clock            import now_cached
+from intents._numbers      import HOUR_WORDS_HINDI
+from utils.alarm_thread    import set_alarm
+from utils.keyword_matcher import KeywordMatcher
 
-# ── Hindi number words ─────────────────────────────────────────────────────────
-HINDI_NUMBERS = {
-    "एक": 1,  "दो": 2,   "तीन": 3,  "चार": 4,
-    "पांच": 5, "पाँच": 5, "छह": 6,   "सात": 7,
-    "आठ": 8,  "नौ": 9,   "दस": 10,  "ग्यारह": 11, "बारह": 12,
-}
+logger = logging.getLogger(__name__)
+
+# ── Alarm trigger keywords (also used by core/handlers.py) ────────────────────
+ALARM_KEYWORDS = ("अलार्म", "जगाना", "उठाना", "याद")
+_ALARM_MATCHER = KeywordMatcher({"alarm": ALARM_KEYWORDS})
+
+# ── Hindi number words (1-12, from the shared table) ─────────────────────────
+HINDI_NUMBERS = HOUR_WORDS_HINDI
+
+
+# ── Precompiled time patterns ─────────────────────────────────────────────────
+_RE_HHMM = re.compile(r'(\d{1,2})[:.](\d{2})')   # "10:30" or "10.30"
+_RE_BARE = re.compile(r'(\d{1,2})')               # bare digit like "10 बजे"
+_RE_WORD = re.compile("|".join(                    # Hindi word like "सात बजे"
+    re.escape(w) for w in sorted(HINDI_NUMBERS, key=len, reverse=True)
+))
 
 
 def word_to_number(text: str) -> int | None:
-    for word, num in HINDI_NUMBERS.items():
-        if word in text:
-            return num
-    return None
+    match = _RE_WORD.search(text)
+    return HINDI_NUMBERS[match.group()] if match else None
 
 
 def detect_date(text: str) -> str:
-    today = datetime.now().date()
+    today = now_cached().date()
     if "परसों" in text:
         return str(today + timedelta(days=2))
     elif "कल" in text:
@@ -44,12 +56,12 @@ def detect_period(text: str) -> str | None:
 
 def extract_time(text: str) -> tuple[int | None, int | None]:
     # "10:30" or "10.30"
-    match = re.search(r'(\d{1,2})[:.:](\d{2})', text)
+    match = _RE_HHMM.search(text)
     if match:
         return int(match.group(1)), int(match.group(2))
 
     # bare digit like "10 बजे"
-    match = re.search(r'(\d{1,2})', text)
+    match = _RE_BARE.search(text)
     if match:
         return int(match.group(1)), 0
 
@@ -71,7 +83,7 @@ def extract_alarm_intent(text: str) -> dict | None:
     lower = text.lower()
 
     # ── Detect alarm action ────────────────────────────────────────────────────
-    if not any(kw in lower for kw in ["अलार्म", "जगाना", "उठाना", "याद"]):
+    if not _ALARM_MATCHER.scan(lower):
         return None   # not an alarm command
 
     result = {
@@ -96,13 +108,13 @@ def extract_alarm_intent(text: str) -> dict | None:
         hour = 0
 
     # Clamp to valid range
-    hour   = max(0, min(23, hour))
-    minute = max(0, min(59, minute))
+    hour   = 0 if hour < 0 else 23 if hour > 23 else hour
+    minute = 0 if minute < 0 else 59 if minute > 59 else minute
 
     alarm_str = f"{hour:02d}:{minute:02d}"
     result["time"] = alarm_str
 
-    print(f"📋 Alarm intent parsed: {result}")
+    logger.debug("Alarm intent parsed: %s", result)
 
     # ── Actually set the alarm ─────────────────────────────────────────────────
     set_alarm(alarm_str)
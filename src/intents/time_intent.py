@@ -1,43 +1,46 @@
-from datetime import datetime
-from core.tts import speak
+from core.clock import now_cached
+from core.tts   import speak
 
-_DAYS_HINDI = {
-    "Monday":    "सोमवार",
-    "Tuesday":   "मंगलवार",
-    "Wednesday": "बुधवार",
-    "Thursday":  "गुरुवार",
-    "Friday":    "शुक्रवार",
-    "Saturday":  "शनिवार",
-    "Sunday":    "रविवार",
-}
+# Indexed by datetime.weekday() (Monday = 0) and datetime.month - 1, so the
+# strings are built without strftime or an English → Hindi lookup.
+_DAYS_HINDI = (
+    "सोमवार", "मंगलवार", "बुधवार", "गुरुवार", "शुक्रवार", "शनिवार", "रविवार",
+)
+_DAYS_SHORT = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
 
-_MONTHS_HINDI = {
-    "January":   "जनवरी",
-    "February":  "फरवरी",
-    "March":     "मार्च",
-    "April":     "अप्रैल",
-    "May":       "मई",
-    "June":      "जून",
-    "July":      "जुलाई",
-    "August":    "अगस्त",
-    "September": "सितंबर",
-    "October":   "अक्टूबर",
-    "November":  "नवंबर",
-    "December":  "दिसंबर",
-}
+_MONTHS_HINDI = (
+    "जनवरी", "फरवरी", "मार्च", "अप्रैल", "मई", "जून",
+    "जुलाई", "अगस्त", "सितंबर", "अक्टूबर", "नवंबर", "दिसंबर",
+)
+_MONTHS_SHORT = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                 "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Trigger keywords — also scanned by core/handlers.py to gate the queries
+TIME_TRIGGERS = ("समय",)
+DATE_TRIGGERS = ("तारीख", "दिन", "आज")
+
+# Built strings are reused until the minute (time) / day (date) changes,
+# so repeated queries skip the strftime calls.
+_TIME_CACHE = {"minute": -1, "hm": "", "say": ""}
+_DATE_CACHE = {"day": -1, "print": "", "say": ""}
 
 
 def check_time_query(text):
     """
     Detects 'समय' in Hindi text, prints and speaks the current time.
     """
-    if "समय" in text:
-        now = datetime.now()
-        h   = now.strftime("%H")
-        m   = now.strftime("%M")
-        current_time = now.strftime("%H:%M:%S")
+    if any(kw in text for kw in TIME_TRIGGERS):
+        now    = now_cached()
+        minute = now.hour * 60 + now.minute
+        if minute != _TIME_CACHE["minute"]:
+            h = now.strftime("%H")
+            m = now.strftime("%M")
+            _TIME_CACHE["hm"]     = f"{h}:{m}"
+            _TIME_CACHE["say"]    = f"अभी समय है {h} बजकर {m} मिनट।"
+            _TIME_CACHE["minute"] = minute
+        current_time = f"{_TIME_CACHE['hm']}:{now.second:02d}"
         print(f"⏰ वर्तमान समय है: {current_time}")
-        speak(f"अभी समय है {h} बजकर {m} मिनट।")
+        speak(_TIME_CACHE["say"])
 
 
 def check_date_query(text):
@@ -45,20 +48,24 @@ def check_date_query(text):
     Detects date/day keywords in Hindi text, prints and speaks today's date.
     Trigger keywords: तारीख, दिन, आज
     """
-    keywords = ["तारीख", "दिन", "आज"]
-    if not any(kw in text for kw in keywords):
+    if not any(kw in text for kw in DATE_TRIGGERS):
         return
 
-    now        = datetime.now()
-    day_en      = now.strftime("%A")          # e.g. "Thursday"
-    day_short   = now.strftime("%a")          # e.g. "Thu"
-    month_short = now.strftime("%b")          # e.g. "Feb"
-    date_num    = now.strftime("%d").lstrip("0") or "0"  # e.g. "20"
-    month_en    = now.strftime("%B")          # e.g. "February"
-    year        = now.strftime("%Y")          # e.g. "2026"
+    now = now_cached()
+    day = now.toordinal()
+    if day != _DATE_CACHE["day"]:
+        wd, mi      = now.weekday(), now.month - 1
+        day_short   = _DAYS_SHORT[wd]             # e.g. "Thu"
+        month_short = _MONTHS_SHORT[mi]           # e.g. "Feb"
+        date_num    = now.day                     # e.g. 20
+        year        = now.year                    # e.g. 2026
+
+        day_hindi   = _DAYS_HINDI[wd]
+        month_hindi = _MONTHS_HINDI[mi]
 
-    day_hindi   = _DAYS_HINDI.get(day_en, day_en)
-    month_hindi = _MONTHS_HINDI.get(month_en, month_en)
+        _DATE_CACHE["print"] = f"📅 आज की तारीख: {day_short}, {date_num} {month_short} {year}"
+        _DATE_CACHE["say"]   = f"आज {day_hindi} है, {date_num} {month_hindi} {year}।"
+        _DATE_CACHE["day"]   = day
 
-    print(f"📅 आज की तारीख: {day_short}, {date_num} {month_short} {year}")
-    speak(f"आज {day_hindi} है, {date_num} {month_hindi} {year}।")
\ No newline at end of file
+    print(_DATE_CACHE["print"])
+    speak(_DATE_CACHE["say"])
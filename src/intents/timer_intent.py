@@ -22,75 +22,78 @@ Returns:
     }
 """
 
+import logging
 import re
+import sys
+from functools import lru_cache
 
-# ── Hindi + Hinglish number words ─────────────────────────────────────────────
-HINDI_NUMBERS: dict[str, int] = {
-    # ones
-    "शून्य": 0,  "zero": 0,
-    "एक": 1,    "ek": 1,    "one": 1,
-    "दो": 2,    "do": 2,    "two": 2,
-    "तीन": 3,   "teen": 3,  "three": 3,
-    "चार": 4,   "char": 4,  "four": 4,
-    "पांच": 5,  "पाँच": 5,  "paanch": 5, "five": 5,
-    "छह": 6,    "chhe": 6,  "six": 6,
-    "सात": 7,   "saat": 7,  "seven": 7,
-    "आठ": 8,    "aath": 8,  "eight": 8,
-    "नौ": 9,    "nau": 9,   "nine": 9,
-    "दस": 10,   "das": 10,  "ten": 10,
-    "ग्यारह": 11, "gyarah": 11, "eleven": 11,
-    "बारह": 12, "barah": 12, "twelve": 12,
-    "तेरह": 13, "terah": 13, "thirteen": 13,
-    "चौदह": 14, "chaudah": 14, "fourteen": 14,
-    "पंद्रह": 15, "pandrah": 15, "fifteen": 15,
-    "सोलह": 16, "solah": 16, "sixteen": 16,
-    "सत्रह": 17, "satrah": 17, "seventeen": 17,
-    "अठारह": 18, "atharah": 18, "eighteen": 18,
-    "उन्नीस": 19, "unnees": 19, "nineteen": 19,
-    "बीस": 20,  "bees": 20,  "twenty": 20,
-    "तीस": 30,  "tees": 30,  "thirty": 30,
-    "चालीस": 40, "chalis": 40, "forty": 40,
-    "पचास": 50, "pachaas": 50, "fifty": 50,
-    "साठ": 60,  "saath": 60, "sixty": 60,
-    "सत्तर": 70, "sattar": 70, "seventy": 70,
-    "अस्सी": 80, "assi": 80, "eighty": 80,
-    "नब्बे": 90, "nabbe": 90, "ninety": 90,
-}
+from intents._numbers      import NUMBER_WORDS
+from utils.keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+# ── Hindi + Hinglish number words (shared table) ───────────────────────────────
+HINDI_NUMBERS = NUMBER_WORDS
+_NUM_KEYS     = frozenset(HINDI_NUMBERS)
 
 # ── Time unit keywords ─────────────────────────────────────────────────────────
-SECOND_WORDS = {
+SECOND_WORDS = frozenset({
     "सेकंड", "सेकेंड", "second", "seconds", "sec",
-}
-MINUTE_WORDS = {
+})
+MINUTE_WORDS = frozenset({
     "मिनट", "मिनटों", "minute", "minutes", "min",
-}
-HOUR_WORDS = {
+})
+HOUR_WORDS = frozenset({
     "घंटे", "घंटा", "घंटों", "hour", "hours", "ghante", "ghanta",
-}
+})
 
 # ── Timer action keywords ──────────────────────────────────────────────────────
-START_WORDS  = {
+START_WORDS  = frozenset({
     "लगाओ", "लगा", "लगा दो", "लगादो",
     "सेट", "set", "set karo",
     "शुरू", "शुरू करो", "शुरू कर दो", "shuru", "start",
     "lagao", "laga", "karo", "kar do", "kardo",
     "चालू", "चलाओ", "चला दो",
-}
-CANCEL_WORDS = {
+})
+CANCEL_WORDS = frozenset({
     "रद्द", "बंद", "बंद करो", "बंद कर दो",
     "cancel", "band", "stop", "rok", "रोको", "रोक",
     "हटाओ", "हटा दो",
-}
-STATUS_WORDS = {
+})
+STATUS_WORDS = frozenset({
     "बाकी", "बाकी है", "kitna", "कितना", "कितना बाकी",
     "status", "remaining", "बचा", "baaki", "बताओ",
     "कितना रहा", "कितना बचा",
-}
+})
 # Vosk often drops the final 'र' from टाइमर → टाइम
 # Also accept Hinglish spellings
-TIMER_WORDS  = {
+TIMER_WORDS  = frozenset({
     "टाइमर", "टाइम", "timer", "taimer", "taim", "time",
-}
+})
+# Strong keywords always trigger; weak ones (टाइम, taim, time) only together
+# with a unit or action word, to avoid false positives on "समय बताओ" queries
+STRONG_TIMER = frozenset({"टाइमर", "timer", "taimer"})
+WEAK_TIMER   = frozenset({"टाइम", "taim", "time"})
+
+# One automaton over every substring-matched keyword set — scanned once per
+# utterance; _has_timer_trigger and extract_timer_intent branch on the tags.
+_KEYWORDS = KeywordMatcher({
+    "strong": STRONG_TIMER,
+    "weak":   WEAK_TIMER,
+    "start":  START_WORDS,
+    "cancel": CANCEL_WORDS,
+    "status": STATUS_WORDS,
+})
+_ACTION_TAGS = frozenset({"start", "cancel", "status"})
+_UNIT_WORDS  = SECOND_WORDS | MINUTE_WORDS | HOUR_WORDS
+_UNIT_MAP    = ({w: "second" for w in SECOND_WORDS}
+                | {w: "minute" for w in MINUTE_WORDS}
+                | {w: "hour"   for w in HOUR_WORDS})
+
+# Substrings at least one of which every timer command contains — a timer
+# keyword or a unit word (see _has_timer_trigger).  Used by core/handlers.py
+# to skip parsing unrelated utterances.
+TRIGGERS = TIMER_WORDS | _UNIT_WORDS
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -99,34 +102,45 @@ TIMER_WORDS  = {
 
 def _word_to_num(token: str) -> int | None:
     """Convert a single Hindi/Hinglish/digit word to integer."""
-    token = token.strip().lower()
-    if token.isdigit():
-        return int(token)
-    return HINDI_NUMBERS.get(token)
+    # tokens come from lower.split(): already lowercase, no spaces.
+    # Number words are checked first: they are far more common than digits.
+    if token in _NUM_KEYS:
+        return HINDI_NUMBERS[token]
+    return int(token) if token.isdigit() else None
 
 
-def _extract_number(tokens: list[str]) -> tuple[int | None, int]:
+def _classify_unit(token: str) -> str | None:
+    """Return 'second', 'minute', or 'hour' for a unit token, else None."""
+    return _UNIT_MAP.get(token)
+
+
+def _find_number_and_unit(tokens: tuple[str, ...]) -> tuple[int | None, str | None]:
     """
-    Scan token list for a number (digit or word).
-    Returns (value, index_of_token) or (None, -1).
+    Single walk over the tokens returning (first number, its unit).
+
+    The unit preferred is the first unit word in the window around the
+    number (one token before → four after); failing that, the first unit
+    anywhere in the sentence — Vosk sometimes reorders tokens slightly.
+    Returns (None, None) if there is no number, (number, None) if no unit.
     """
+    number, num_idx = None, -1
+    first_unit      = None
     for i, tok in enumerate(tokens):
-        val = _word_to_num(tok)
-        if val is not None:
-            return val, i
-    return None, -1
-
-
-def _classify_unit(token: str) -> str | None:
-    """Return 'second', 'minute', or 'hour' for a unit token, else None."""
-    t = token.lower()
-    if t in SECOND_WORDS:
-        return "second"
-    if t in MINUTE_WORDS:
-        return "minute"
-    if t in HOUR_WORDS:
-        return "hour"
-    return None
+        unit = _UNIT_MAP.get(tok)
+        if number is None:
+            val = _word_to_num(tok)
+            if val is not None:
+                number, num_idx = val, i
+                before = _UNIT_MAP.get(tokens[i - 1]) if i else None
+                if before is not None:
+                    return number, before
+            elif unit is not None and first_unit is None:
+                first_unit = unit
+        elif unit is not None:
+            if i <= num_idx + 4:
+                return number, unit
+            return number, first_unit or unit
+    return number, first_unit if number is not None else None
 
 
 def _to_seconds(value: int, unit: str) -> int:
@@ -148,7 +162,7 @@ def _unit_label(value: int, unit: str) -> str:
 # Main parser
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _has_timer_trigger(lower: str, tokens: list[str]) -> bool:
+def _has_timer_trigger(hits: frozenset[str], tokens: tuple[str, ...]) -> bool:
     """
     Return True if the text looks like a timer command.
 
@@ -157,73 +171,69 @@ def _has_timer_trigger(lower: str, tokens: list[str]) -> bool:
       2. Contains a time-unit word (मिनट / घंटे / सेकंड) + an action word
          → catches "एक मिनट का लगाओ" even if Vosk drops 'टाइमर' entirely
     """
-    has_unit   = any(tok in SECOND_WORDS | MINUTE_WORDS | HOUR_WORDS for tok in tokens)
-    has_action = any(sw in lower for sw in START_WORDS | CANCEL_WORDS | STATUS_WORDS)
+    has_unit   = not _UNIT_WORDS.isdisjoint(tokens)
+    has_action = not hits.isdisjoint(_ACTION_TAGS)
     has_number = any(_word_to_num(tok) is not None for tok in tokens)
 
     # Primary: strong timer keywords (टाइमर, timer, taimer) — always trigger
-    STRONG_TIMER = {"टाइमर", "timer", "taimer"}
-    if any(tw in lower for tw in STRONG_TIMER):
+    if "strong" in hits:
         return True
 
     # Weak timer keywords (टाइम, taim, time) — only trigger when combined
     # with a unit word to avoid false positives on "समय बताओ" type queries
-    WEAK_TIMER = {"टाइम", "taim", "time"}
-    if any(tw in lower for tw in WEAK_TIMER):
+    if "weak" in hits:
         return has_unit or has_action
 
     # No timer keyword at all — require unit + (action or number)
     return has_unit and (has_action or has_number)
 
 
-def extract_timer_intent(text: str) -> dict | None:
+@lru_cache(maxsize=512)
+def extract_timer_intent(
+    text: str,
+    lower: str | None = None,
+    tokens: tuple[str, ...] | None = None,
+) -> dict | None:
     """
     Parse Hindi/Hinglish text for a timer command.
 
-    Returns a dict or None if no timer intent found.
+    Returns a dict or None if no timer intent found.  Results are cached
+    per text (users repeat commands verbatim), so treat the dict as
+    read-only.
+
+    `lower` / `tokens` may be passed in when the caller has already
+    normalised the text (text.lower().strip() and its interned split()).
 
     Handles Vosk quirks:
       - "टाइमर" often transcribed as "टाइम"
       - "लगाओ" sometimes heard as "लगा दो" / "शुरू कर दो"
       - Number + unit alone ("एक मिनट का") treated as start intent
     """
-    lower  = text.lower().strip()
-    tokens = lower.split()
+    if lower is None:
+        lower = text.lower().strip()
+    if tokens is None:
+        tokens = tuple(map(sys.intern, lower.split()))   # NUMBER_WORDS keys are interned
+    hits = _KEYWORDS.scan(lower)
 
     # Gate: must look like a timer command
-    if not _has_timer_trigger(lower, tokens):
+    if not _has_timer_trigger(hits, tokens):
         return None
 
     # ── CANCEL ────────────────────────────────────────────────────────────────
-    if any(cw in lower for cw in CANCEL_WORDS):
+    if "cancel" in hits:
         return {"action": "cancel", "seconds": None, "label": ""}
 
     # ── STATUS ────────────────────────────────────────────────────────────────
-    if any(sw in lower for sw in STATUS_WORDS):
+    if "status" in hits:
         return {"action": "status", "seconds": None, "label": ""}
 
     # ── START — extract number + unit ─────────────────────────────────────────
-    number, num_idx = _extract_number(tokens)
+    number, unit = _find_number_and_unit(tokens)
 
     if number is None:
         # Has timer keyword but no number → ask user to repeat
         return {"action": "unclear", "seconds": None, "label": ""}
 
-    # Look for a unit word anywhere in the sentence (not just near the number)
-    # Vosk sometimes reorders tokens slightly
-    unit = None
-    # First try near the number (preferred)
-    search_range = tokens[max(0, num_idx - 1): num_idx + 5]
-    for tok in search_range:
-        unit = _classify_unit(tok)
-        if unit:
-            break
-    # Fallback: scan whole sentence
-    if unit is None:
-        for tok in tokens:
-            unit = _classify_unit(tok)
-            if unit:
-                break
     # Last resort: default to minutes
     if unit is None:
         unit = "minute"
@@ -231,7 +241,7 @@ def extract_timer_intent(text: str) -> dict | None:
     seconds = _to_seconds(number, unit)
     label   = _unit_label(number, unit)
 
-    print(f"⏱️  Timer intent: {number} {unit} = {seconds}s  (from: '{text}')")
+    logger.debug("Timer intent: %s %s = %ds  (from: '%s')", number, unit, seconds, text)
 
     return {
         "action":  "start",
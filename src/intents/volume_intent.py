@@ -38,6 +38,11 @@ Returns:
 """
 
 import re
+import sys
+from functools import lru_cache
+
+from intents._numbers      import NUMBER_WORDS
+from utils.keyword_matcher import KeywordMatcher
 
 # ── Keyword sets (all lowercase) ──────────────────────────────────────────────
 
@@ -47,6 +52,7 @@ VOLUME_TRIGGER = {
     # Hinglish / English
     "volume", "awaz", "awaaz", "sound", "vol",
 }
+TRIGGERS = VOLUME_TRIGGER   # gate keywords, also scanned by core/handlers.py
 
 INCREASE_WORDS = {
     # Hindi
@@ -88,108 +94,97 @@ STATUS_WORDS = {
     "kitna", "kitni", "batao", "status", "level", "check",
 }
 
-# Hindi + Hinglish number words (0-100)
-_NUMS: dict[str, int] = {
-    "शून्य": 0, "zero": 0,
-    "एक": 1,   "ek": 1,    "one": 1,
-    "दो": 2,   "do": 2,    "two": 2,
-    "तीन": 3,  "teen": 3,  "three": 3,
-    "चार": 4,  "char": 4,  "four": 4,
-    "पांच": 5, "पाँच": 5,  "paanch": 5, "panch": 5, "five": 5,
-    "छह": 6,   "chhe": 6,  "six": 6,
-    "सात": 7,  "saat": 7,  "seven": 7,
-    "आठ": 8,   "aath": 8,  "eight": 8,
-    "नौ": 9,   "nau": 9,   "nine": 9,
-    "दस": 10,  "das": 10,  "ten": 10,
-    "पंद्रह": 15, "pandrah": 15, "fifteen": 15,
-    "बीस": 20, "bees": 20, "twenty": 20,
-    "पच्चीस": 25, "pachchees": 25, "twenty five": 25,
-    "तीस": 30, "tees": 30, "thirty": 30,
-    "पैंतीस": 35, "paintees": 35,
-    "चालीस": 40, "chalis": 40, "forty": 40,
-    "पैंतालीस": 45, "paintaalees": 45,
-    "पचास": 50, "pachaas": 50, "fifty": 50,
-    "पचपन": 55, "pachpan": 55,
-    "साठ": 60, "saath": 60, "sixty": 60,
-    "पैंसठ": 65, "painsath": 65,
-    "सत्तर": 70, "sattar": 70, "seventy": 70,
-    "पचहत्तर": 75, "pachhattar": 75,
-    "अस्सी": 80, "assi": 80, "eighty": 80,
-    "पचासी": 85, "pachaasi": 85,
-    "नब्बे": 90, "nabbe": 90, "ninety": 90,
-    "पचानवे": 95, "pachaanave": 95,
-    "सौ": 100, "sau": 100, "hundred": 100,
-}
+# Hindi + Hinglish number words (shared table)
+_NUMS = NUMBER_WORDS
 
 PERCENT_WORDS = {"percent", "pratishat", "प्रतिशत", "%", "par", "पर"}
 
+# One automaton over every keyword set — scanned once per utterance
+_KEYWORDS = KeywordMatcher({
+    "volume":   VOLUME_TRIGGER,
+    "increase": INCREASE_WORDS,
+    "decrease": DECREASE_WORDS,
+    "mute":     MUTE_WORDS,
+    "unmute":   UNMUTE_WORDS,
+    "status":   STATUS_WORDS,
+})
+
+# ── Precompiled patterns ───────────────────────────────────────────────────────
+_PCT_RE = re.compile(r'\b(\d{1,3})\s*%')   # "50%" / "50 %"
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _find_percent(tokens: list[str], lower: str) -> int | None:
+def _find_percent(tokens: tuple[str, ...], lower: str) -> int | None:
     """
     Extract a percentage value from tokens.
     Accepts: "50 percent", "50%", "पचास प्रतिशत", digit strings.
     """
     # Regex: digit optionally followed by %
-    m = re.search(r'\b(\d{1,3})\s*%', lower)
+    m = _PCT_RE.search(lower)
     if m:
         return min(100, max(0, int(m.group(1))))
 
-    # Digit token near a percent word
+    # Number token with a percent word in the window tokens[i-1 : i+3].
+    # Percent-word positions are flagged in one pass, so the window check is
+    # four index probes — no slice or inner any() per token.
+    is_pw = [tok in PERCENT_WORDS for tok in tokens]
+    last  = len(tokens) - 1
     for i, tok in enumerate(tokens):
-        if tok.isdigit():
-            val = int(tok)
-            # Check surrounding tokens for percent word
-            context = tokens[max(0, i-1): i+3]
-            if any(pw in context for pw in PERCENT_WORDS):
-                return min(100, max(0, val))
-            # Also accept bare digit if it's a round number (10,20,...,100)
-            if val % 5 == 0 and 0 <= val <= 100:
-                return val
-
-        # Hindi word number
-        num = _NUMS.get(tok)
-        if num is not None:
-            context = tokens[max(0, i-1): i+3]
-            if any(pw in context for pw in PERCENT_WORDS):
-                return min(100, max(0, num))
+        is_digit = tok.isdigit()
+        val      = int(tok) if is_digit else _NUMS.get(tok)
+        if val is None:
+            continue
+        if ((i and is_pw[i - 1]) or is_pw[i]
+                or (i < last and is_pw[i + 1]) or (i + 1 < last and is_pw[i + 2])):
+            return 100 if val > 100 else val
+        # Also accept bare digit if it's a round number (10,20,...,100)
+        if is_digit and val % 5 == 0 and val <= 100:
+            return val
 
     return None
 
 
-def _is_volume_command(lower: str) -> bool:
-    return any(vt in lower for vt in VOLUME_TRIGGER)
-
-
 # ─────────────────────────────────────────────────────────────────────────────
 # Main parser
 # ─────────────────────────────────────────────────────────────────────────────
 
-def extract_volume_intent(text: str) -> dict | None:
+@lru_cache(maxsize=512)
+def extract_volume_intent(
+    text: str,
+    lower: str | None = None,
+    tokens: tuple[str, ...] | None = None,
+) -> dict | None:
     """
     Parse Hindi/Hinglish text for a volume control command.
     Returns a dict or None if not a volume command.
+    Results are cached per text, so treat the dict as read-only.
+
+    `lower` / `tokens` may be passed in when the caller has already
+    normalised the text (text.lower().strip() and its interned split()).
     """
-    lower  = text.lower().strip()
-    tokens = lower.split()
+    if lower is None:
+        lower = text.lower().strip()
+    if tokens is None:
+        tokens = tuple(map(sys.intern, lower.split()))   # NUMBER_WORDS keys are interned
+    hits = _KEYWORDS.scan(lower)
 
     # Gate: must mention volume/sound
-    if not _is_volume_command(lower):
+    if "volume" not in hits:
         return None
 
     # ── MUTE (check before decrease — "band" is in both) ─────────────────────
     # Unmute must be checked first (has "chalu" which overrides "band")
-    if any(uw in lower for uw in UNMUTE_WORDS):
+    if "unmute" in hits:
         return {"action": "unmute", "percent": None, "step": 10}
 
-    if any(mw in lower for mw in MUTE_WORDS):
+    if "mute" in hits:
         return {"action": "mute", "percent": None, "step": 10}
 
     # ── STATUS ────────────────────────────────────────────────────────────────
-    if any(sw in lower for sw in STATUS_WORDS):
+    if "status" in hits:
         return {"action": "status", "percent": None, "step": 10}
 
     # ── SET exact % ───────────────────────────────────────────────────────────
@@ -198,11 +193,11 @@ def extract_volume_intent(text: str) -> dict | None:
         return {"action": "set", "percent": pct, "step": 10}
 
     # ── INCREASE ──────────────────────────────────────────────────────────────
-    if any(iw in lower for iw in INCREASE_WORDS):
+    if "increase" in hits:
         return {"action": "increase", "percent": None, "step": 10}
 
     # ── DECREASE ──────────────────────────────────────────────────────────────
-    if any(dw in lower for dw in DECREASE_WORDS):
+    if "decrease" in hits:
         return {"action": "decrease", "percent": None, "step": 10}
 
     # Volume keyword present but action unclear
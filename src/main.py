@@ -1,7 +1,7 @@
 """
 main.py — Hindi Voice Assistant Entry Point
 ============================================
-Starts the alarm thread, opens the microphone stream, and runs forever.
+Starts the alarm and ASR threads, opens the microphone stream, and runs forever.
 All logic lives in core/ and utils/ — this file stays under 60 lines.
 
 Run:
@@ -9,13 +9,17 @@ Run:
     python src/main.py
 """
 
-import sounddevice as sd
-import time
+import logging
+import signal
+import sys
+import threading
 from datetime import datetime
 
-from utils.constants      import SAMPLE_RATE, WAKE_WORD, EXIT_WORD
-from utils.alarm_thread   import start_alarm_thread
-from core.recognizer      import callback
+from utils.constants      import WAKE_WORD, EXIT_WORD
+
+# sounddevice, the Vosk model (core.recognizer), the TTS engines and the
+# intent parsers are imported in main(), so importing this module — e.g.
+# from a test or benchmark — does not open audio devices or load the model.
 
 
 def _print_banner() -> None:
@@ -42,20 +46,53 @@ def _print_banner() -> None:
     print()
 
 
-if __name__ == "__main__":
+def main() -> None:
+    # Parser diagnostics are logged at DEBUG, so normal runs skip them.
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
+    import sounddevice as sd
+
+    from utils.alarm_thread   import start_alarm_thread
+    from core.recognizer      import callback, start_asr_thread, set_input_rate
+    from utils.mic            import input_rate
+    from core.handlers        import PROMPTS
+    from core.tts             import prewarm_cache
+
     _print_banner()
 
     # Start background alarm checker thread
     start_alarm_thread()
 
+    # Open the mic at the model's 16 kHz when the device supports it; else at
+    # its native rate, and let the ASR worker resample.
+    mic_rate = input_rate()
+    set_input_rate(mic_rate)
+
+    # Start the ASR worker that consumes audio blocks queued by callback()
+    start_asr_thread()
+
+    # Synthesise fixed prompts into the TTS cache in the background
+    prewarm_cache(PROMPTS)
+
     print("Listening for wake word...\n")
 
+    # The main thread only keeps the stream open: it sleeps until Ctrl+C.
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    # Windows cannot run the SIGINT handler during an untimed wait, so wake
+    # once a second there to let Ctrl+C through.
+    timeout = 1.0 if sys.platform == "win32" else None
+
     with sd.RawInputStream(
-        samplerate=SAMPLE_RATE,
-        blocksize=8000,
+        samplerate=mic_rate,
+        blocksize=mic_rate // 2,     # 0.5 s blocks
         dtype="int16",
         channels=1,
         callback=callback,
     ):
-        while True:
-            time.sleep(0.1)
+        while not stop.wait(timeout):
+            pass
+
+
+if __name__ == "__main__":
+    main()
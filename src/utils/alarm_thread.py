@@ -1,9 +1,10 @@
 """
 alarm_thread.py — Background Alarm Checker
 ============================================
-Runs a daemon thread that checks every second whether any scheduled
-alarm time matches the current HH:MM. When matched, it plays a proper
-alarm sound and announces it via TTS.
+Runs a daemon thread that sleeps until the scheduled alarm time (HH:MM)
+instead of polling the clock every second. set_alarm()/cancel_alarm()
+wake it so it re-reads the schedule. When the time comes, it plays a
+proper alarm sound and announces it via TTS.
 
 Public API:
     start_alarm_thread()  — call once at startup
@@ -14,42 +15,71 @@ Public API:
 
 import threading
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from utils.sounds import play_alarm_sound
 from core.tts import speak
 
 # ── Internal state ─────────────────────────────────────────────────────────────
-_alarm_time: str | None = None
-_alarm_running: bool    = False
+_alarm_time: str | None    = None
+_alarm_epoch: float | None = None   # time.time() at which _alarm_time fires
+_alarm_running: bool       = False
 _lock = threading.Lock()
+_wake = threading.Event()           # set by set_alarm/cancel_alarm
+
+# Longest single sleep.  Re-checking once a minute keeps the alarm on time
+# if the wall clock is adjusted (NTP sync, DST) while we sleep.
+_MAX_WAIT = 60.0
+
+
+def _next_epoch(t: str) -> float:
+    """
+    Epoch seconds of the next "HH:MM" occurrence.  The current minute still
+    counts, so an alarm set for the present minute rings immediately.
+    """
+    hh, mm = map(int, t.split(":"))
+    now    = datetime.now()
+    target = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
+    if target + timedelta(minutes=1) <= now:
+        target += timedelta(days=1)
+    return target.timestamp()
 
 
 # ── Alarm checker loop ─────────────────────────────────────────────────────────
 
 
 def _alarm_checker():
-    global _alarm_time, _alarm_running
+    global _alarm_time, _alarm_epoch
 
     while _alarm_running:
+        # Clear before reading, so a set_alarm() racing with us still wakes
+        # the wait below instead of being lost.
+        _wake.clear()
         with _lock:
-            target = _alarm_time
+            target, epoch = _alarm_time, _alarm_epoch
+
+        if epoch is None:
+            _wake.wait(_MAX_WAIT)
+            continue
 
-        if target:
-            now = datetime.now().strftime("%H:%M")
-            if now == target:
-                msg = f"⏰ अलार्म बज रहा है! समय हो गया {target}"
-                print("\n" + "=" * 45)
-                print(msg)
-                print("=" * 45 + "\n")
-                # Play proper alarm sound, then speak the TTS announcement
-                play_alarm_sound(repeats=4)
-                speak("अलार्म बज रहा है। समय हो गया।")
+        remaining = epoch - time.time()
+        if remaining > 0:
+            _wake.wait(min(remaining, _MAX_WAIT))
+            continue
 
-                with _lock:
-                    _alarm_time = None   # auto-clear after ringing
+        with _lock:
+            if _alarm_epoch != epoch:
+                continue          # changed or cancelled while we slept
+            _alarm_time  = None   # auto-clear after ringing
+            _alarm_epoch = None
 
-        time.sleep(1)
+        msg = f"⏰ अलार्म बज रहा है! समय हो गया {target}"
+        print("\n" + "=" * 45)
+        print(msg)
+        print("=" * 45 + "\n")
+        # Play proper alarm sound, then speak the TTS announcement
+        play_alarm_sound(repeats=4)
+        speak("अलार्म बज रहा है। समय हो गया।")
 
 
 # ── Public API ─────────────────────────────────────────────────────────────────
@@ -70,18 +100,23 @@ def set_alarm(t: str):
     Args:
         t: Time string in "HH:MM" 24-hour format.
     """
-    global _alarm_time
+    global _alarm_time, _alarm_epoch
+    epoch = _next_epoch(t)
     with _lock:
-        _alarm_time = t
+        _alarm_time  = t
+        _alarm_epoch = epoch
+    _wake.set()
     print(f"✅ अलार्म सेट हो गया: {t}")
     speak(f"अलार्म {t} बजे के लिए सेट हो गया।")
 
 
 def cancel_alarm():
     """Cancel the currently scheduled alarm."""
-    global _alarm_time
+    global _alarm_time, _alarm_epoch
     with _lock:
-        _alarm_time = None
+        _alarm_time  = None
+        _alarm_epoch = None
+    _wake.set()
     print("🚫 अलार्म रद्द कर दिया गया।")
     speak("अलार्म रद्द कर दिया गया।")
 
@@ -3,6 +3,9 @@ utils/auth/__init__.py
 Re-exports the public API so callers can still do:
     from utils.auth import authenticate_user
 """
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from utils.auth.pin_auth   import verify_pin
@@ -10,6 +13,10 @@ from utils.auth.voice_auth import (
     enroll_voice, verify_voice, verify_voice_from_audio, load_voice_profile
 )
 
+# Runs the MFCC voice check on the captured PIN audio while the PIN itself is
+# parsed and hashed (the FFT/BLAS work releases the GIL).
+_voice_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="VoiceAuth")
+
 
 def authenticate_user(spoken_pin: str,
                       check_voice: bool = True,
@@ -31,16 +38,27 @@ def authenticate_user(spoken_pin: str,
     """
     result = {"pin_ok": False, "voice_ok": False, "authorized": False, "reason": ""}
 
+    # Start the voice check on the buffered audio before the PIN check
+    voice_fut   = None
+    voice_abort = threading.Event()
+    if check_voice and audio is not None and len(audio) > 0:
+        voice_fut = _voice_pool.submit(verify_voice_from_audio, audio, voice_abort)
+
     # Step 1 — PIN
     result["pin_ok"] = verify_pin(spoken_pin)
     if not result["pin_ok"]:
+        if voice_fut is not None:
+            # Result no longer needed: drop the job if it has not started,
+            # else have it stop before the MFCC / verdict print
+            voice_abort.set()
+            voice_fut.cancel()
         result["reason"] = "❌ गलत पासवर्ड (Wrong PIN)"
         return result
 
     # Step 2 — Voice (informational only — PIN alone is enough to authorize)
     if check_voice:
-        if audio is not None and len(audio) > 0:
-            result["voice_ok"] = verify_voice_from_audio(audio)
+        if voice_fut is not None:
+            result["voice_ok"] = voice_fut.result()
         else:
             result["voice_ok"] = verify_voice()
 
@@ -9,12 +9,34 @@ Example:
 """
 
 import hashlib
+import hmac
+import re
 from utils.constants import AUTH_PIN_HASH, HINDI_PIN_WORDS
 
+# Stored hash as raw bytes, decoded once — compared in constant time below.
+_AUTH_PIN_DIGEST = bytes.fromhex(AUTH_PIN_HASH)
 
-def _hash_pin(pin: str) -> str:
-    """Return SHA-256 hex digest of the PIN string."""
-    return hashlib.sha256(pin.encode()).hexdigest()
+# digit word → digit character
+_PIN_WORD_DIGITS = {word: str(d) for word, d in HINDI_PIN_WORDS.items()}
+
+# One whole whitespace-delimited token: a digit word or a run of digits.
+# Longest words first so the alternation never stops on a shorter prefix.
+# Case-insensitive, so the transcript is never lowercased as a whole —
+# only an English word not already lowercase ("One") is, in verify_pin.
+_PIN_TOKEN_RE = re.compile(
+    r"(?<!\S)(?:"
+    + "|".join(map(re.escape, sorted(_PIN_WORD_DIGITS, key=len, reverse=True)))
+    + r"|\d+)(?!\S)",
+    re.IGNORECASE,
+)
+
+# Devanagari numerals (Vosk may emit "१२३४") → ASCII
+_DEVANAGARI_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
+
+
+def _hash_pin(pin: str) -> bytes:
+    """Return the raw SHA-256 digest of the PIN string."""
+    return hashlib.sha256(pin.encode()).digest()
 
 
 def verify_pin(spoken_text: str) -> bool:
@@ -27,18 +49,16 @@ def verify_pin(spoken_text: str) -> bool:
         • Hinglish     : "ek do teen char"
         • Raw digits   : "1234" or "1 2 3 4"
         • Mixed        : "एक 2 तीन 4"
+        • Devanagari   : "१२३४"
     """
-    spoken_text = spoken_text.strip().lower()
-    tokens      = spoken_text.split()
-    pin_digits  = []
-
-    for token in tokens:
-        if token in HINDI_PIN_WORDS:
-            pin_digits.append(str(HINDI_PIN_WORDS[token]))
-        elif token.isdigit():
-            pin_digits.extend(list(token))   # "1234" → ['1','2','3','4']
-
-    if not pin_digits:
+    tokens = _PIN_TOKEN_RE.findall(spoken_text)
+    if not tokens:
         return False
 
-    return _hash_pin("".join(pin_digits)) == AUTH_PIN_HASH
+    # Digit runs pass through as-is: "1234" → "1234"
+    pin = "".join([
+        _PIN_WORD_DIGITS.get(t) or (t if t[0].isdigit() else _PIN_WORD_DIGITS.get(t.lower(), ""))
+        for t in tokens
+    ])
+    pin = pin.translate(_DEVANAGARI_DIGITS)
+    return hmac.compare_digest(_hash_pin(pin), _AUTH_PIN_DIGEST)
@@ -4,45 +4,156 @@ voice_auth.py — MFCC-based Offline Voice Authentication
 Records a short audio sample, extracts MFCC features, and compares
 them against an enrolled voice profile using cosine similarity.
 
+MFCCs are computed by a vectorised NumPy/SciPy front-end with the same
+parameters as python_speech_features.mfcc() (25 ms / 10 ms frames,
+512-pt FFT, 26 mel filters, 13 cepstra, lifter 22, log-energy c0), so
+profiles enrolled with either implementation stay comparable.
+
 All processing is fully offline — no internet, no cloud API.
 
 Public API:
-    enroll_voice(duration)     — record and save a voice profile (run once)
-    load_voice_profile()       — load profile from disk
+    enroll_voice(duration)     — record and save a voice profile (run once;
+                                 append=True adds another user)
+    load_voice_profile()       — load (cached, unit-norm) profiles from disk
     verify_voice(duration)     — record + compare; returns True/False
 """
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import numpy as np
-import sounddevice as sd
 
 from utils.constants import SAMPLE_RATE, VOICE_PROFILE_PATH, VOICE_AUTH_THRESHOLD
+from utils.mic import open_mic
+
+# ── Optional SciPy FFT (pocketfft, SIMD) — NumPy's rfft otherwise ────────────
+try:
+    from scipy.fft import rfft as _rfft
+except ImportError:
+    from numpy.fft import rfft as _rfft
 
-# ── Optional MFCC library ─────────────────────────────────────────────────────
+# ── Optional WebRTC VAD — energy-based end-pointing otherwise ─────────────────
 try:
-    from python_speech_features import mfcc as compute_mfcc
-    MFCC_AVAILABLE = True
+    import webrtcvad as _webrtcvad
+    _WEBRTCVAD_AVAILABLE = True
 except ImportError:
-    MFCC_AVAILABLE = False
-    print("⚠️  python_speech_features not installed — voice auth DISABLED.")
-    print("    pip install python_speech_features")
+    _WEBRTCVAD_AVAILABLE = False
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# MFCC front-end — python_speech_features.mfcc() defaults, precomputed once
+# ─────────────────────────────────────────────────────────────────────────────
+
+_PREEMPH    = 0.97
+_FRAME_LEN  = int(0.025 * SAMPLE_RATE + 0.5)   # 25 ms
+_FRAME_STEP = int(0.010 * SAMPLE_RATE + 0.5)   # 10 ms
+_NFFT       = 512
+_NFILT      = 26
+_NUMCEP     = 13
+_CEPLIFTER  = 22
+_EPS        = np.finfo(float).eps
+# |X|²/NFFT of the [-1, 1) signal == |X|² of the int16 signal × this
+_PSPEC_SCALE = 1.0 / (_NFFT * 32768.0 ** 2)
+
+
+def _mel_filterbank() -> np.ndarray:
+    """Triangular mel filters, shape (NFFT//2 + 1, NFILT) — ready for pspec @ fb."""
+    hz2mel  = lambda hz: 2595 * np.log10(1 + hz / 700.0)
+    mel2hz  = lambda mel: 700 * (10 ** (mel / 2595.0) - 1)
+    mels    = np.linspace(hz2mel(0), hz2mel(SAMPLE_RATE / 2), _NFILT + 2)
+    bins    = np.floor((_NFFT + 1) * mel2hz(mels) / SAMPLE_RATE)
+
+    fb = np.zeros((_NFFT // 2 + 1, _NFILT))
+    for j in range(_NFILT):
+        lo, mid, hi = bins[j], bins[j + 1], bins[j + 2]
+        up   = np.arange(int(lo), int(mid))
+        down = np.arange(int(mid), int(hi))
+        fb[up, j]   = (up - lo) / (mid - lo)
+        fb[down, j] = (hi - down) / (hi - mid)
+    return fb
+
+
+def _cepstral_matrix() -> np.ndarray:
+    """Orthonormal DCT-II (first NUMCEP columns) with the lifter folded in."""
+    n = np.arange(_NFILT)
+    k = np.arange(_NUMCEP)
+    dct = np.cos(np.pi * np.outer(2 * n + 1, k) / (2 * _NFILT))
+    dct *= np.sqrt(2.0 / _NFILT)
+    dct[:, 0] = np.sqrt(1.0 / _NFILT)
+    lift = 1 + (_CEPLIFTER / 2.0) * np.sin(np.pi * k / _CEPLIFTER)
+    return dct * lift
+
+
+_MEL_FB  = _mel_filterbank()
+_CEP_MAT = _cepstral_matrix()
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Internal helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
+# End-pointing: recording stops once speech has been heard and is followed
+# by _VAD_HANGOVER_S of silence, instead of always running the full duration.
+_VAD_FRAME       = int(SAMPLE_RATE * 0.03)        # 30 ms — a WebRTC VAD frame size
+_VAD_HANGOVER_S  = 0.5
+_VAD_MODE        = 2                              # WebRTC aggressiveness (0–3)
+# Energy fallback: speech = at least 10% of the loudest frame so far and
+# above an absolute floor (≈ −40 dBFS) so room noise never counts.
+_VAD_REL_RMS     = 0.1
+_VAD_MIN_RMS     = 300.0
+
+_vad = _webrtcvad.Vad(_VAD_MODE) if _WEBRTCVAD_AVAILABLE else None
+
+# Extra recordings enroll_voice() allows for passes that fail and are repeated
+_ENROLL_RETRIES = 2
+
+
 def _record_audio(duration: float) -> np.ndarray:
-    """Block and record `duration` seconds from the default microphone."""
-    print(f"🎙️  Recording for {duration:.1f}s...")
-    audio = sd.rec(
-        int(duration * SAMPLE_RATE),
-        samplerate=SAMPLE_RATE,
-        channels=1,
-        dtype="int16",
-    )
-    sd.wait()
-    return audio.flatten()
+    """
+    Record from the default microphone until the speaker stops (see
+    _VAD_HANGOVER_S) or `duration` seconds have passed, whichever is first.
+    """
+    print(f"🎙️  Recording for up to {duration:.1f}s...")
+    total    = int(duration * SAMPLE_RATE)
+    hangover = int(_VAD_HANGOVER_S * SAMPLE_RATE)
+    audio    = np.empty(total, dtype=np.int16)
+    got = silent = 0
+    heard, peak = False, 0.0
+
+    with open_mic() as mic:
+        while got < total:
+            n = min(_VAD_FRAME, total - got)
+            frame = audio[got:got + n]
+            frame[:] = mic.read(n)
+            got += n
+            if n < _VAD_FRAME:
+                break                             # final partial frame
+
+            if _vad is not None:
+                speech = _vad.is_speech(frame.tobytes(), SAMPLE_RATE)
+            else:
+                rms    = float(np.sqrt(np.mean(np.square(frame, dtype=np.float32))))
+                peak   = max(peak, rms)
+                speech = rms >= _VAD_MIN_RMS and rms >= _VAD_REL_RMS * peak
+
+            if speech:
+                heard, silent = True, 0
+            elif heard:
+                silent += n
+                if silent >= hangover:
+                    break
+
+    return audio[:got]
+
+
+# int16 PCM → float32 in [-1, 1)
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def _to_float32(audio: np.ndarray) -> np.ndarray:
+    """Scale int16 PCM to float32 in a single allocation (no astype temp)."""
+    return np.multiply(audio, _INT16_SCALE, dtype=np.float32)
 
 
 def _trim_silence(audio: np.ndarray,
@@ -67,21 +178,22 @@ def _trim_silence(audio: np.ndarray,
         return audio
 
     frame_size = int(SAMPLE_RATE * frame_ms / 1000)
-    audio_f    = audio.astype(np.float32) / 32768.0
-
-    # Compute per-frame RMS
-    n_frames = len(audio_f) // frame_size
+    n_frames   = len(audio) // frame_size
     if n_frames == 0:
         return audio
 
-    frames = audio_f[: n_frames * frame_size].reshape(n_frames, frame_size)
-    rms    = np.sqrt(np.mean(frames ** 2, axis=1))   # shape: (n_frames,)
-    peak   = rms.max()
+    # Per-frame energy straight from the int16 samples (a reshaped view, no
+    # float copy of the clip); einsum accumulates the squares without
+    # materialising them.  Only ratios to the peak matter, so the 1/32768
+    # scale, the mean and the sqrt all cancel: compare sums of squares
+    # against threshold² × peak.
+    frames = audio[: n_frames * frame_size].reshape(n_frames, frame_size)
+    energy = np.einsum("ij,ij->i", frames, frames, dtype=np.float32)   # (n_frames,)
+    peak   = energy.max()
     if peak == 0:
         return audio
 
-    voiced = rms >= (energy_threshold * peak)         # True where speech present
-    voiced_indices = np.where(voiced)[0]
+    voiced_indices = np.flatnonzero(energy >= (energy_threshold ** 2) * peak)
     if voiced_indices.size == 0:
         return audio
 
@@ -90,22 +202,84 @@ def _trim_silence(audio: np.ndarray,
     return audio[first:last]
 
 
+def _mfcc_mean(pcm: np.ndarray) -> np.ndarray:
+    """
+    Mean MFCC vector (13,) over all frames of an int16 PCM signal.
+
+    Pre-emphasis reads the int16 samples straight into the zero-padded
+    frame buffer, framing is a strided view of it, then one batched rfft
+    and the mel filterbank product.  The int16 → [-1, 1) scaling is folded
+    into the power-spectrum normalisation, so the samples are never
+    converted on their own.
+
+    DCT+lifter is linear, so the mean of the per-frame cepstra equals the
+    DCT of the mean log-mel vector: the frames are averaged first and the
+    DCT runs once, on 26 values.  Likewise c0 is the mean log energy.
+    """
+    n = len(pcm)
+    if n <= _FRAME_LEN:
+        n_frames = 1
+    else:
+        n_frames = 1 + -(-(n - _FRAME_LEN) // _FRAME_STEP)
+
+    # s[i] = x[i] - 0.97·x[i-1], computed in place — no temporaries
+    padded = np.zeros((n_frames - 1) * _FRAME_STEP + _FRAME_LEN)
+    padded[0] = pcm[0]
+    np.multiply(pcm[:-1], -_PREEMPH, out=padded[1:n], dtype=np.float64)
+    padded[1:n] += pcm[1:]
+    frames = np.lib.stride_tricks.sliding_window_view(padded, _FRAME_LEN)[::_FRAME_STEP]
+
+    spec   = np.abs(_rfft(frames, _NFFT, axis=1))
+    pspec  = np.square(spec, out=spec)
+    pspec *= _PSPEC_SCALE
+    energy = pspec.sum(axis=1)
+    feat   = pspec @ _MEL_FB
+
+    log_mel = np.log(np.maximum(feat, _EPS, out=feat), out=feat)
+    vec     = log_mel.mean(axis=0) @ _CEP_MAT
+    vec[0]  = np.log(np.maximum(energy, _EPS, out=energy), out=energy).mean()
+    return vec
+
+
 def _extract_mfcc(audio: np.ndarray) -> np.ndarray | None:
-    """Return mean MFCC vector (shape: 13,) or None if library missing."""
-    if not MFCC_AVAILABLE:
+    """Return mean MFCC vector (shape: 13,) or None if the clip is empty."""
+    return _extract_mfcc_cached(np.ascontiguousarray(audio, dtype=np.int16).tobytes())
+
+
+# Keyed by the PCM bytes, so re-verifying the same buffer (e.g. a retried
+# check) skips trim + MFCC.  lru_cache is thread-safe: the voice pool, the
+# enrollment pool and direct callers all share it.
+@lru_cache(maxsize=4)
+def _extract_mfcc_cached(pcm: bytes) -> np.ndarray | None:
+    trimmed = _trim_silence(np.frombuffer(pcm, dtype=np.int16))   # drop silent leading/trailing
+    if len(trimmed) == 0:
         return None
-    audio        = _trim_silence(audio)          # drop silent leading/trailing
-    audio_f      = audio.astype(np.float32) / 32768.0
-    features     = compute_mfcc(audio_f, samplerate=SAMPLE_RATE, numcep=13)
-    return np.mean(features, axis=0)
+    vec = _mfcc_mean(trimmed)
+    vec.flags.writeable = False                  # shared by later cache hits
+    return vec
+
 
+def _unit(v: np.ndarray) -> np.ndarray:
+    """Scale `v` (or each row of it) to unit L2 norm; zero rows stay zero."""
+    n = np.linalg.norm(v, axis=-1, keepdims=True)
+    return np.divide(v, n, out=np.zeros(v.shape), where=n > 0)
 
-def _cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
-    """Cosine similarity in [0, 1] between two 1-D vectors."""
-    na, nb = np.linalg.norm(a), np.linalg.norm(b)
-    if na == 0 or nb == 0:
+
+def _cosine_similarity(unit_profiles: np.ndarray, sample: np.ndarray) -> float:
+    """
+    Best cosine similarity between a raw MFCC sample and the unit-norm
+    enrolled profiles (N, 13) — one matrix-vector product for all of them.
+    """
+    ns2 = np.vdot(sample, sample)       # squared norm, no linalg.norm dispatch
+    if ns2 <= 0.0:
         return 0.0
-    return float(np.dot(a, b) / (na * nb))
+    return float((unit_profiles @ sample).max() / np.sqrt(ns2))
+
+
+# Unit-norm enrolled profiles (N, 13) and the file mtime they were loaded at
+# (see load_voice_profile)
+_profile_cache: np.ndarray | None = None
+_profile_mtime: float | None      = None
 
 
 def _profile_path() -> str:
@@ -118,7 +292,7 @@ def _profile_path() -> str:
 # Public API
 # ─────────────────────────────────────────────────────────────────────────────
 
-def enroll_voice(duration: float = 4.0, passes: int = 3) -> bool:
+def enroll_voice(duration: float = 4.0, passes: int = 3, append: bool = False) -> bool:
     """
     Record multiple passes of the user's PIN phrase and save the averaged
     MFCC profile to disk.  Call this ONCE during initial setup.
@@ -127,60 +301,93 @@ def enroll_voice(duration: float = 4.0, passes: int = 3) -> bool:
         duration: Seconds to record per pass.
         passes:   Number of repetitions to average (default 3).
                   More passes → more stable profile → better recognition.
+        append:   Add this profile as another row (e.g. a second user)
+                  instead of replacing the enrolled ones.
 
     Returns True on success, False on failure.
     """
-    if not MFCC_AVAILABLE:
-        print("❌ Enrollment skipped: python_speech_features not available.")
-        return False
-
-    vectors = []
-    for i in range(passes):
-        print(f"\n🎙️  Pass {i + 1}/{passes} — अपना PIN बोलिए (Speak your PIN)...")
-        audio = _record_audio(duration)
-        vec   = _extract_mfcc(audio)
-        if vec is None:
-            print(f"   ⚠️  Pass {i + 1} failed — skipping.")
-            continue
-        vectors.append(vec)
-        print(f"   ✅ Pass {i + 1} recorded.")
-        if i < passes - 1:
-            input("   Enter दबाएं और फिर PIN बोलें... (Press Enter, then speak PIN...)")
-
-    if not vectors:
+    global _profile_cache, _profile_mtime
+    vectors = np.empty((passes, _NUMCEP), dtype=np.float32)
+    count   = 0
+    # MFCC extraction of a pass runs in the background while the user reads
+    # the prompt and presses Enter for the next one; its result is checked
+    # before that next pass is recorded, and a failed pass is repeated.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="Enroll") as pool:
+        for _ in range(passes + _ENROLL_RETRIES):
+            if count == passes:
+                break
+            print(f"\n🎙️  Pass {count + 1}/{passes} — अपना PIN बोलिए (Speak your PIN)...")
+            future = pool.submit(_extract_mfcc, _record_audio(duration))
+            if count < passes - 1:
+                input("   Enter दबाएं और फिर PIN बोलें... (Press Enter, then speak PIN...)")
+            vec = future.result()
+            if vec is None:
+                print(f"   ⚠️  Pass {count + 1} failed — please repeat it.")
+                continue
+            vectors[count] = vec
+            count += 1
+            print(f"   ✅ Pass {count} recorded.")
+
+    if count == 0:
         print("❌ No valid passes recorded. Enrollment failed.")
         return False
 
-    profile = np.mean(vectors, axis=0)   # average across all passes
-
+    # Average across all passes; stored unit-norm (cosine ignores scale),
+    # one row per enrolled profile
+    profile = _unit(vectors[:count].mean(axis=0))[np.newaxis, :]
+    if append:
+        existing = load_voice_profile()
+        if existing is not None:
+            profile = np.vstack((existing, profile))
+
+    # float16 on disk: rows are unit-norm, so ~3 significant digits move a
+    # cosine score by < 1e-3 — far inside the threshold's margin.  Upcast
+    # again on load (see _unit).
+    profile = profile.astype(np.float16)
     path = _profile_path()
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    np.save(path, profile)
-    print(f"\n✅ Voice profile saved ({len(vectors)}/{passes} passes averaged) → {path}")
+    # Write beside the target and rename over it: a running assistant
+    # polling the mtime never sees (or caches) a half-written file
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, profile)
+    os.replace(tmp, path)
+    _profile_cache = _unit(profile)
+    _profile_mtime = os.stat(path).st_mtime
+    print(f"\n✅ Voice profile saved ({count}/{passes} passes averaged) → {path}")
     return True
 
 
 def load_voice_profile() -> np.ndarray | None:
-    """Load the enrolled MFCC profile from disk. Returns None if not found."""
-    path = _profile_path()
-    if not os.path.exists(path):
+    """
+    Return the enrolled MFCC profiles as an (N, 13) matrix of unit-norm
+    rows, or None if not found.  The file is re-read only when its mtime
+    changes (e.g. after running voice_enroll.py while the assistant is up);
+    otherwise the cached array is returned after a single stat().
+    """
+    global _profile_cache, _profile_mtime
+    try:
+        mtime = os.stat(_profile_path()).st_mtime
+    except FileNotFoundError:
+        _profile_cache = _profile_mtime = None
         return None
-    return np.load(path)
+    if _profile_cache is None or mtime != _profile_mtime:
+        # Older single-vector, unnormalised profiles are upgraded here; the
+        # float16 rows come back as float64 from _unit
+        _profile_cache = _unit(np.atleast_2d(np.load(_profile_path())))
+        _profile_mtime = mtime
+    return _profile_cache
 
 
 def verify_voice(duration: float = 3.0) -> bool:
     """
-    Record a short sample and compare with the enrolled profile.
+    Record a short sample and compare with the enrolled profile(s).
 
     Returns:
         True  — similarity ≥ VOICE_AUTH_THRESHOLD  (authorized)
-        True  — if MFCC library missing or no profile (fail-open)
+        True  — if no profile (fail-open)
         False — similarity below threshold
     """
-    if not MFCC_AVAILABLE:
-        print("⚠️  Voice auth skipped (library missing). Allowing by default.")
-        return True
-
     profile = load_voice_profile()
     if profile is None:
         print("⚠️  No voice profile found. Run enroll_voice() first. Allowing.")
@@ -198,24 +405,26 @@ def verify_voice(duration: float = 3.0) -> bool:
     return score >= VOICE_AUTH_THRESHOLD
 
 
-def verify_voice_from_audio(audio: np.ndarray) -> bool:
+def verify_voice_from_audio(audio: np.ndarray,
+                            cancel: threading.Event | None = None) -> bool:
     """
-    Compare a PRE-RECORDED audio array with the enrolled profile.
+    Compare a PRE-RECORDED audio array with the enrolled profile(s).
     Use this when the microphone is already open in a RawInputStream
     (calling sd.rec() again would conflict or record silence).
 
     Args:
-        audio: int16 numpy array of raw PCM samples at SAMPLE_RATE
+        audio:  int16 numpy array of raw PCM samples at SAMPLE_RATE
+        cancel: When set (the caller no longer wants the verdict), the check
+                stops before the MFCC and before reporting, and quietly
+                returns False.
 
     Returns:
         True  — similarity ≥ VOICE_AUTH_THRESHOLD  (authorized)
-        True  — if MFCC library missing, no profile, or audio too short (fail-open)
-        False — similarity below threshold
+        True  — if no profile, or audio too short (fail-open)
+        False — similarity below threshold, or cancelled
     """
-    if not MFCC_AVAILABLE:
-        print("⚠️  Voice auth skipped (library missing). Allowing by default.")
-        return True
-
+    if cancel is not None and cancel.is_set():
+        return False
     profile = load_voice_profile()
     if profile is None:
         print("⚠️  No voice profile found. Run enroll_voice() first. Allowing.")
@@ -230,7 +439,7 @@ def verify_voice_from_audio(audio: np.ndarray) -> bool:
     print("🔍 आवाज़ की जाँच हो रही है (Verifying voice from PIN audio)...")
     sample = _extract_mfcc(audio)
 
-    if sample is None:
+    if sample is None or (cancel is not None and cancel.is_set()):
         return False
 
     score = _cosine_similarity(profile, sample)
@@ -60,3 +60,15 @@ ASR_CONFIDENCE_THRESHOLD = 0.65
 # Hindi words are typically 2+ characters; 3 is a safe minimum.
 # Set to 1 to disable the word-length gate entirely.
 ASR_MIN_WORD_LENGTH = 3
+
+# ── TTS Cache ─────────────────────────────────────────────────────────────────
+# Synthesised gTTS MP3s are cached on disk keyed by sha1(text), so fixed
+# prompts ("टाइमर रद्द कर दिया।", the PIN prompt, …) skip the network
+# round-trip after the first time they are spoken.
+TTS_CACHE_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "tts_cache"
+)
+
+# Maximum number of cached MP3 files.  When exceeded, the least-recently
+# used files (oldest mtime) are pruned.
+TTS_CACHE_MAX_FILES = 200
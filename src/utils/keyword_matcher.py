@@ -0,0 +1,79 @@
+"""
+utils/keyword_matcher.py — Single-pass Multi-keyword Scanner
+=============================================================
+Matches a whole table of tagged keywords against a string in ONE pass
+using an Aho–Corasick automaton, instead of one `kw in text` substring
+search per keyword.
+
+Backend:
+  • pyahocorasick (optional, C extension) — linear-time DFA scan
+  • fallback: one precompiled alternation regex per tag (stdlib `re`)
+    when pyahocorasick is not installed
+
+Usage:
+    from utils.keyword_matcher import KeywordMatcher
+
+    matcher = KeywordMatcher({
+        "exit":  ("धन्यवाद",),
+        "alarm": ("अलार्म", "alarm"),
+    })
+    hits = matcher.scan("अलार्म कब है")   # → frozenset({"alarm"})
+"""
+
+import re
+from collections.abc import Iterable, Mapping
+
+# ── Optional Aho–Corasick backend ─────────────────────────────────────────────
+try:
+    import ahocorasick as _ahocorasick
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _AHOCORASICK_AVAILABLE = False
+
+
+class KeywordMatcher:
+    """
+    Scan text for many tagged keywords at once.
+
+    Args:
+        table: Mapping of tag → iterable of keyword strings.  A keyword may
+               appear under several tags; a match reports all of them.
+    """
+
+    def __init__(self, table: Mapping[str, Iterable[str]]) -> None:
+        # keyword → frozenset of tags it belongs to
+        tags_by_kw: dict[str, set[str]] = {}
+        for tag, keywords in table.items():
+            for kw in keywords:
+                tags_by_kw.setdefault(kw, set()).add(tag)
+
+        self._tags_by_kw: dict[str, frozenset[str]] = {
+            kw: frozenset(tags) for kw, tags in tags_by_kw.items()
+        }
+
+        self._automaton = None
+        self._patterns: list[tuple[str, re.Pattern]] = []
+        if _AHOCORASICK_AVAILABLE and self._tags_by_kw:
+            automaton = _ahocorasick.Automaton()
+            for kw, tags in self._tags_by_kw.items():
+                automaton.add_word(kw, tags)
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            # One search per tag: any match will do, so overlapping keywords
+            # within a tag don't matter.  Longest-first keeps it deterministic.
+            for tag, keywords in table.items():
+                kws = sorted(set(keywords), key=len, reverse=True)
+                if kws:
+                    pattern = re.compile("|".join(map(re.escape, kws)))
+                    self._patterns.append((tag, pattern))
+
+    def scan(self, text: str) -> frozenset[str]:
+        """Return the set of tags whose keywords occur anywhere in `text`."""
+        if self._automaton is None:
+            return frozenset(tag for tag, pattern in self._patterns if pattern.search(text))
+
+        hits: set[str] = set()
+        for _end, tags in self._automaton.iter(text):
+            hits |= tags
+        return frozenset(hits)
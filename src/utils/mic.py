@@ -0,0 +1,121 @@
+"""
+utils/mic.py — Shared Microphone Input Stream
+==============================================
+One PortAudio input stream for the short recordings (voice auth, notices),
+opened on first use and reused, so each recording skips stream set-up
+instead of paying it per sd.rec() call.  The stream only runs while a
+recording holds it: it is started on entry to open_mic() and stopped on
+exit, rather than left capturing while idle.  (main.py's recognizer
+stream stays open throughout, so a recording runs alongside it.)
+
+The device is opened at input_rate() — SAMPLE_RATE when the mic supports
+it, else its native rate — and reads are resampled to SAMPLE_RATE, the
+same negotiation and conversion the recognizer stream uses.
+
+Public API:
+    input_rate()      — rate the default mic opens at (negotiated once)
+    open_mic()        — context manager: exclusive access to the running
+                        stream; its read(n) returns n samples at SAMPLE_RATE
+    record(duration)  — fixed-length int16 recording (1-D array)
+"""
+
+import atexit
+import math
+import threading
+from contextlib import contextmanager
+from collections.abc import Iterator
+
+import numpy as np
+import sounddevice as sd
+
+from utils.constants import SAMPLE_RATE
+from utils.resample import StreamResampler
+
+_BLOCK = 1600   # 100 ms at 16 kHz
+
+_rate: int | None = None
+_stream: sd.InputStream | None = None
+_lock = threading.Lock()
+
+
+def input_rate() -> int:
+    """
+    Rate the default input device is opened at: SAMPLE_RATE when the device
+    supports it, otherwise its native default rate.  Queried once.
+    """
+    global _rate
+    if _rate is None:
+        try:
+            sd.check_input_settings(samplerate=SAMPLE_RATE, channels=1, dtype="int16")
+            _rate = SAMPLE_RATE
+        except (sd.PortAudioError, ValueError):
+            _rate = int(sd.query_devices(kind="input")["default_samplerate"])
+    return _rate
+
+
+def _close_stream() -> None:
+    global _stream
+    with _lock:
+        if _stream is not None:
+            _stream.close()
+            _stream = None
+
+
+def _get_stream() -> sd.InputStream:
+    """Return the shared (stopped) InputStream, opening it on first call."""
+    global _stream
+    if _stream is None:
+        _stream = sd.InputStream(
+            samplerate=input_rate(),
+            channels=1,
+            dtype="int16",
+            latency="low",
+        )
+        atexit.register(_close_stream)
+    return _stream
+
+
+class _MicReader:
+    """Reads from the running stream in SAMPLE_RATE samples."""
+
+    def __init__(self, stream: sd.InputStream, rate: int) -> None:
+        self._stream = stream
+        self._ratio  = rate / SAMPLE_RATE
+        self._rs     = StreamResampler(rate, SAMPLE_RATE) if rate != SAMPLE_RATE else None
+        self._extra  = np.zeros(0, dtype=np.int16)   # resampled, not yet returned
+
+    def read(self, n: int) -> np.ndarray:
+        """Block until `n` int16 samples at SAMPLE_RATE are available."""
+        if self._rs is None:
+            block, _overflowed = self._stream.read(n)
+            return block[:, 0]
+        while len(self._extra) < n:
+            want = math.ceil((n - len(self._extra)) * self._ratio)
+            block, _overflowed = self._stream.read(max(1, want))
+            self._extra = np.concatenate((self._extra, self._rs.process(block[:, 0])))
+        out, self._extra = self._extra[:n], self._extra[n:]
+        return out
+
+
+@contextmanager
+def open_mic() -> Iterator[_MicReader]:
+    """Hold the microphone for one recording; reads start from 'now'."""
+    with _lock:
+        stream = _get_stream()
+        stream.start()
+        try:
+            yield _MicReader(stream, input_rate())
+        finally:
+            stream.stop()
+
+
+def record(duration: float) -> np.ndarray:
+    """Record `duration` seconds into a preallocated int16 buffer."""
+    audio = np.empty(int(duration * SAMPLE_RATE), dtype=np.int16)
+    got = 0
+    with open_mic() as mic:
+        while got < len(audio):
+            n = min(_BLOCK, len(audio) - got)
+            audio[got:got + n] = mic.read(n)
+            got += n
+    return audio
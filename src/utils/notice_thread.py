@@ -18,13 +18,11 @@ import time
 import wave
 import tempfile
 import threading
-import platform
-import subprocess
-import numpy as np
-import sounddevice as sd
 
 from utils.constants import SAMPLE_RATE
+from utils.mic import record
 from utils.sounds import play_notification_sound
+from core.tts import speak
 
 # ── Internal state ─────────────────────────────────────────────────────────────
 _notice_thread: threading.Thread | None = None
@@ -35,31 +33,13 @@ _notice_file:    str | None   = None   # path to temp WAV
 _notice_eta:     float | None = None   # monotonic time when notice fires
 _notice_label:   str          = ""     # human-readable "10 मिनट बाद"
 
+_MAX_WAIT = 60.0                       # longest single sleep in the worker
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Audio helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _speak_tts(text: str) -> None:
-    """Non-blocking offline TTS."""
-    try:
-        if platform.system() == "Windows":
-            safe = text.replace('"', '\\"')
-            subprocess.Popen(
-                ["powershell", "-Command",
-                 f'Add-Type -AssemblyName System.Speech; '
-                 f'(New-Object System.Speech.Synthesis.SpeechSynthesizer).Speak("{safe}")'],
-                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-            )
-        else:
-            subprocess.Popen(
-                ["espeak-ng", "-v", "hi", text],
-                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-            )
-    except Exception:
-        pass
-
-
 def record_notice(duration: float = 7.0) -> str | None:
     """
     Record `duration` seconds from the microphone and save to a temp WAV file.
@@ -69,13 +49,7 @@ def record_notice(duration: float = 7.0) -> str | None:
     """
     try:
         print(f"🎙️  Recording notice ({duration:.0f}s)...")
-        audio = sd.rec(
-            int(duration * SAMPLE_RATE),
-            samplerate=SAMPLE_RATE,
-            channels=1,
-            dtype="int16",
-        )
-        sd.wait()
+        audio = record(duration)
 
         # Write to a temp file
         tmp = tempfile.NamedTemporaryFile(
@@ -85,7 +59,7 @@ def record_notice(duration: float = 7.0) -> str | None:
             wf.setnchannels(1)
             wf.setsampwidth(2)          # int16 = 2 bytes
             wf.setframerate(SAMPLE_RATE)
-            wf.writeframes(audio.tobytes())
+            wf.writeframes(audio)       # buffer protocol — no tobytes() copy
 
         print(f"✅ Notice recorded → {tmp.name}")
         return tmp.name
@@ -127,12 +101,21 @@ def _notice_worker(filepath: str, delay: float, cancel_ev: threading.Event) -> N
 
     print(f"📅 Notice scheduled in {delay:.0f}s → {filepath}")
 
-    cancelled = cancel_ev.wait(timeout=delay)
+    # Sleep in ≤ _MAX_WAIT slices, re-checking the monotonic deadline after
+    # each wake so a long delay survives suspend/resume
+    deadline  = time.monotonic() + delay
+    cancelled = False
+    while not cancelled:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        cancelled = cancel_ev.wait(timeout=min(remaining, _MAX_WAIT))
 
     with _lock:
-        _notice_eta  = None
-        _notice_file = None
-        _notice_label = ""
+        if _cancel_event is cancel_ev:      # not already replaced by a newer notice
+            _notice_eta  = None
+            _notice_file = None
+            _notice_label = ""
 
     if cancelled:
         print("🚫 Notice cancelled.")
@@ -147,8 +130,8 @@ def _notice_worker(filepath: str, delay: float, cancel_ev: threading.Event) -> N
     # Play notification chime to alert the user, then announce + play recording
     play_notification_sound()
     time.sleep(0.3)          # brief gap between chime and TTS
-    _speak_tts("नोटिस सुनिए।")
-    time.sleep(0.9)          # brief pause before playback
+    speak("नोटिस सुनिए।")    # shared TTS engine (persistent espeak/PowerShell)
+    time.sleep(0.3)          # brief pause before playback
     _play_wav(filepath)
     _delete_file(filepath)   # delete immediately after playback
 
@@ -169,14 +152,11 @@ def schedule_notice(filepath: str, delay: float, label: str = "") -> None:
     """
     global _notice_thread, _cancel_event, _notice_file, _notice_eta, _notice_label
 
-    # Cancel any existing notice
-    if _notice_thread and _notice_thread.is_alive():
-        _cancel_event.set()
-        _notice_thread.join(timeout=1.0)
-
-    _cancel_event = threading.Event()
-
+    # Cancel any existing notice — no join: the old worker wakes on its own
+    # event, deletes its file and leaves the new notice's state alone
     with _lock:
+        _cancel_event.set()
+        _cancel_event = threading.Event()
         _notice_file  = filepath
         _notice_eta   = time.monotonic() + delay
         _notice_label = label
@@ -195,13 +175,16 @@ def cancel_notice() -> bool:
     Cancel the pending notice.
     Returns True if a notice was running, False if nothing to cancel.
     """
-    global _notice_thread, _cancel_event
+    global _notice_file, _notice_eta, _notice_label
 
-    if _notice_thread and _notice_thread.is_alive():
-        _cancel_event.set()
-        _notice_thread.join(timeout=1.0)
+    with _lock:
+        if _cancel_event.is_set() or not (_notice_thread and _notice_thread.is_alive()):
+            return False
+        _cancel_event.set()         # worker wakes, deletes the file, exits
+        _notice_eta   = None
+        _notice_file  = None
+        _notice_label = ""
         return True
-    return False
 
 
 def get_notice_status() -> dict:
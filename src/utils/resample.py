@@ -0,0 +1,95 @@
+"""
+utils/resample.py — Streaming Sample-Rate Conversion
+=====================================================
+Converts int16 PCM that arrives in blocks (a mic stream) from one rate to
+another.  Filter state carries over between blocks, so the output is the
+same as resampling the whole signal in one go: no edge transients at block
+boundaries and no sample-count drift from per-block truncation.
+
+Backend:
+  • scipy (optional) — polyphase FIR (upfirdn) with the same Kaiser
+    low-pass resample_poly() designs; input history is carried over
+  • fallback: linear interpolation on a continuous global time grid
+
+Usage:
+    from utils.resample import StreamResampler
+
+    rs  = StreamResampler(44100, 16000)
+    out = rs.process(block)      # int16 in → int16 out, any block size
+"""
+
+import math
+
+import numpy as np
+
+# ── Optional polyphase backend (scipy) ────────────────────────────────────────
+try:
+    from scipy.signal import firwin as _firwin, upfirdn as _upfirdn
+    _SCIPY_AVAILABLE = True
+except ImportError:
+    _SCIPY_AVAILABLE = False
+
+
+class StreamResampler:
+    """
+    Resample a block stream of int16 PCM from `rate_in` to `rate_out`.
+
+    Output sample m sits at input time m * rate_in / rate_out (plus the
+    filter's fixed group delay, under 1 ms at 44.1 → 16 kHz, on the
+    polyphase path).  The output depends only on the samples fed, not on
+    how they were split into blocks.
+    """
+
+    def __init__(self, rate_in: int, rate_out: int) -> None:
+        g = math.gcd(rate_in, rate_out)
+        self.up, self.down = rate_out // g, rate_in // g
+
+        if _SCIPY_AVAILABLE:
+            # Same design as scipy.signal.resample_poly's default filter
+            max_rate = max(self.up, self.down)
+            half_len = 10 * max_rate
+            self._h = _firwin(2 * half_len + 1, 1.0 / max_rate,
+                              window=("kaiser", 5.0)) * self.up
+        else:
+            self._h = None
+
+        self._hist  = np.zeros(0, dtype=np.float64)   # kept input samples
+        self._start = 0                               # absolute index of _hist[0]
+        self._next  = 0                               # next output index to emit
+
+    def process(self, pcm: np.ndarray) -> np.ndarray:
+        """Feed one int16 block; return the int16 output it completes."""
+        buf = np.concatenate((self._hist, pcm))
+        end = self._start + len(buf)                  # absolute index past last input
+        if end == 0:
+            return np.zeros(0, dtype=np.int16)
+        up, down = self.up, self.down
+
+        if self._h is not None:
+            # Causal polyphase: y[m] = Σ h[k]·x_up[m·down − k].  Every input
+            # x_up index ≤ m·down is known once m·down ≤ (end−1)·up.
+            last = (end - 1) * up // down
+            z    = _upfirdn(self._h, buf, up, down)
+            # _start is a multiple of `down`, so local outputs sit on the
+            # global grid: local k ↔ global k + _start·up/down
+            offset = self._start * up // down
+            out    = z[self._next - offset:last + 1 - offset]
+            # Keep the input the next output still reaches back to, aligned
+            # down to a multiple of `down`
+            need = max(0, ((last + 1) * down - (len(self._h) - 1)) // up)
+        else:
+            # Output m interpolates between input floor(m·down/up) and the
+            # sample after it, which must already have arrived.
+            last = ((end - 1) * up - 1) // down if end > 1 else -1
+            m    = np.arange(self._next, last + 1)
+            pos  = m * down
+            i    = pos // up - self._start
+            frac = (pos % up) / up
+            out  = buf[i] * (1.0 - frac) + buf[np.minimum(i + 1, len(buf) - 1)] * frac
+            need = (last + 1) * down // up
+
+        need         = max(self._start, need - need % down)
+        self._hist   = buf[need - self._start:]
+        self._start  = need
+        self._next   = last + 1
+        return np.clip(np.rint(out), -32768, 32767).astype(np.int16)
@@ -13,6 +13,10 @@ Both functions are blocking by default (they return after playback finishes).
 Use threading.Thread(..., daemon=True).start() if non-blocking playback is needed.
 """
 
+import atexit
+import threading
+from functools import lru_cache
+
 import numpy as np
 import sounddevice as sd
 
@@ -23,36 +27,148 @@ _SR = 44100   # sample rate for all generated audio
 # Low-level helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _tone(freq: float, duration: float, amplitude: float = 0.6) -> np.ndarray:
-    """Return a sine-wave tone as a float32 array."""
-    t = np.linspace(0, duration, int(_SR * duration), endpoint=False)
-    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+def _tone(freq: float, duration: float, amplitude: float = 0.6,
+          out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Return a sine-wave tone as a float32 array, written into `out` (length
+    int(_SR * duration)) when given.  Phase, sin and gain all run in place.
+    """
+    n = int(_SR * duration)
+    if out is None:
+        out = np.empty(n, dtype=np.float32)
+    np.multiply(np.arange(n, dtype=np.float32), np.float32(2 * np.pi * freq / _SR), out=out)
+    np.sin(out, out=out)
+    out *= np.float32(amplitude)
+    return out
 
 
-def _silence(duration: float) -> np.ndarray:
-    """Return a block of silence as a float32 array."""
-    return np.zeros(int(_SR * duration), dtype=np.float32)
+def _render(notes: list[tuple[float | None, float, float]]) -> np.ndarray:
+    """
+    Synthesise (freq, duration, amplitude) notes back to back into one
+    preallocated float32 buffer; freq=None is a gap of silence.  Each tone
+    is enveloped in place, so there are no per-note arrays to concatenate.
+    """
+    lengths = [int(_SR * duration) for _, duration, _ in notes]
+    buf = np.zeros(sum(lengths), dtype=np.float32)
+    pos = 0
+    for (freq, duration, amplitude), n in zip(notes, lengths):
+        if freq is not None:
+            _envelope(_tone(freq, duration, amplitude, out=buf[pos:pos + n]), inplace=True)
+        pos += n
+    return buf
+
+
+@lru_cache(maxsize=8)
+def _ramp(n: int, up: bool) -> np.ndarray:
+    """
+    Read-only float32 raised-cosine ramp 0→1 (up) or 1→0 of `n` samples.
+    Unlike a linear ramp its slope is zero at both ends, so the fade
+    itself adds no corner for small speakers to click on.
+    """
+    ramp = 0.5 * (1.0 - np.cos(np.linspace(0, np.pi, n)))
+    if not up:
+        ramp = ramp[::-1]
+    ramp = ramp.astype(np.float32)
+    ramp.flags.writeable = False
+    return ramp
 
 
-def _envelope(audio: np.ndarray, attack: float = 0.01, release: float = 0.05) -> np.ndarray:
-    """Apply a simple linear attack/release envelope to avoid click artefacts."""
-    audio = audio.copy()
+def _envelope(audio: np.ndarray, attack: float = 0.01, release: float = 0.05,
+              inplace: bool = False) -> np.ndarray:
+    """
+    Apply a raised-cosine attack/release envelope to avoid click artefacts.
+
+    Pass inplace=True when `audio` is a fresh single-use buffer (e.g. straight
+    from _tone) to skip the defensive copy.
+    """
+    if not inplace:
+        audio = audio.copy()
     a_samples = int(_SR * attack)
     r_samples = int(_SR * release)
     if a_samples > 0:
-        audio[:a_samples] *= np.linspace(0, 1, a_samples)
+        audio[:a_samples] *= _ramp(a_samples, True)
     if r_samples > 0:
-        audio[-r_samples:] *= np.linspace(1, 0, r_samples)
+        audio[-r_samples:] *= _ramp(r_samples, False)
     return audio
 
 
-def _play(audio: np.ndarray) -> None:
-    """Play a float32 numpy array through the default output device."""
-    try:
-        sd.play(audio, samplerate=_SR)
-        sd.wait()
-    except Exception:
-        pass
+# Output stream opened on first playback and kept running, so alerts skip
+# the PortAudio open/close that sd.play() + sd.wait() pay on every call.
+_out_stream: sd.OutputStream | None = None
+_out_lock = threading.Lock()
+
+
+def _close_out_stream() -> None:
+    global _out_stream
+    with _out_lock:
+        if _out_stream is not None:
+            _out_stream.close()
+            _out_stream = None
+
+
+def _get_out_stream() -> sd.OutputStream:
+    """Return the shared started OutputStream, opening it on first call."""
+    global _out_stream
+    if _out_stream is None:
+        stream = sd.OutputStream(samplerate=_SR, channels=1, dtype="float32")
+        stream.start()
+        _out_stream = stream
+        atexit.register(_close_out_stream)
+    return _out_stream
+
+
+def _play(audio: np.ndarray, repeats: int = 1) -> None:
+    """
+    Play a float32 numpy array `repeats` times through the default output
+    device.  Blocks until the last block has been handed to the device.
+    """
+    global _out_stream
+    with _out_lock:
+        try:
+            stream = _get_out_stream()
+            for _ in range(repeats):
+                stream.write(audio)
+        except Exception:
+            # Device gone or stream broken — reopen on the next alert
+            if _out_stream is not None:
+                try:
+                    _out_stream.close()
+                except Exception:
+                    pass
+                _out_stream = None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Precomputed sounds — every frequency/duration is a constant, so both
+# buffers are synthesised once at import instead of on every playback
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _build_alarm_burst() -> np.ndarray:
+    """One klaxon burst: high note → low note → gap → high note → gap."""
+    return _render([
+        (1050, 0.25, 0.75),   # high-frequency burst
+        (700,  0.25, 0.75),   # low-frequency burst
+        (None, 0.08, 0.0),    # short gap
+        (1050, 0.20, 0.75),   # another hi for urgency
+        (None, 0.12, 0.0),
+    ])
+
+
+def _build_chime() -> np.ndarray:
+    """Major-chord arpeggio: C5(523 Hz) → E5(659 Hz) → G5(784 Hz)."""
+    return _render([
+        (523,  0.22, 0.55),   # C5
+        (None, 0.05, 0.0),
+        (659,  0.22, 0.55),   # E5
+        (None, 0.05, 0.0),
+        (784,  0.35, 0.55),   # G5
+    ])
+
+
+_ALARM_BURST = _build_alarm_burst()
+_CHIME       = _build_chime()
+_ALARM_BURST.flags.writeable = False
+_CHIME.flags.writeable       = False
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -67,21 +183,7 @@ def play_alarm_sound(repeats: int = 3) -> None:
     `repeats` controls how many burst groups play (default 3 → ≈ 2.7 s total).
     """
     try:
-        burst_parts = []
-        for _ in range(repeats):
-            # High-frequency burst
-            hi = _envelope(_tone(1050, 0.25, amplitude=0.75))
-            # Low-frequency burst
-            lo = _envelope(_tone(700,  0.25, amplitude=0.75))
-            # Short gap
-            gap = _silence(0.08)
-            # Another hi burst for urgency
-            hi2 = _envelope(_tone(1050, 0.20, amplitude=0.75))
-            gap2 = _silence(0.12)
-            burst_parts.extend([hi, lo, gap, hi2, gap2])
-
-        audio = np.concatenate(burst_parts)
-        _play(audio)
+        _play(_ALARM_BURST, repeats)
     except Exception:
         pass
 
@@ -98,13 +200,6 @@ def play_notification_sound() -> None:
     Total duration ≈ 0.9 s.
     """
     try:
-        # Major-chord arpeggio: C5(523 Hz) → E5(659 Hz) → G5(784 Hz)
-        c5  = _envelope(_tone(523, 0.22, amplitude=0.55))
-        e5  = _envelope(_tone(659, 0.22, amplitude=0.55))
-        g5  = _envelope(_tone(784, 0.35, amplitude=0.55))
-        gap = _silence(0.05)
-
-        audio = np.concatenate([c5, gap, e5, gap, g5])
-        _play(audio)
+        _play(_CHIME)
     except Exception:
         pass
@@ -1,7 +1,10 @@
 """
 timer_thread.py — Non-blocking Background Timer
 ================================================
-Manages a single active timer in a daemon thread.
+Manages a single active timer on one long-lived scheduler thread that
+sleeps on a Condition until the earliest deadline in a heap.  Starting or
+cancelling a timer is a heap push / state reset plus a notify — no thread
+is created per timer and no caller ever joins one.
 When the timer finishes it plays a proper alarm sound and speaks the
 completion message.
 
@@ -12,6 +15,8 @@ Public API:
     is_running()           — True if a timer is active
 """
 
+import heapq
+import itertools
 import threading
 import time
 import math
@@ -20,53 +25,68 @@ from utils.sounds import play_alarm_sound
 from core.tts import speak
 
 # ── Internal state ─────────────────────────────────────────────────────────────
-_timer_thread: threading.Thread | None = None
-_cancel_event  = threading.Event()
-_start_time: float | None = None
-_duration: float | None   = None
-_lock = threading.Lock()
+_cv = threading.Condition()                 # guards the heap and writes to _active
+_heap: list[tuple[float, int]] = []         # (monotonic deadline, timer id)
+_ids = itertools.count(1)
+_scheduler: threading.Thread | None = None
 
+# The active timer as one (deadline, id) tuple — the same object that sits in
+# the heap; any other heap entry is stale.  Replaced by a single reference
+# store, so readers (get_remaining, is_running) never take _cv and can never
+# see a deadline paired with the wrong id.
+_active: tuple[float, int] | None = None
 
-# ─────────────────────────────────────────────────────────────────────────────
-# TTS + Beep helpers (all offline)
-# ─────────────────────────────────────────────────────────────────────────────
-
+# Longest single sleep.  The deadline is re-checked against the monotonic
+# clock after every wake, so a long timer stays on time across a suspend/
+# resume or a timed wait that returns early or late.
+_MAX_WAIT = 60.0
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Timer worker
+# Scheduler thread
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _timer_worker(seconds: float, cancel_ev: threading.Event):
-    global _start_time, _duration
-
-    with _lock:
-        _start_time = time.monotonic()
-        _duration   = seconds
-
-    print(f"⏱️  Timer started: {seconds:.0f}s")
-
-    # Wait for either the duration or a cancel signal
-    cancelled = cancel_ev.wait(timeout=seconds)
-
-    if cancelled:
-        print("🚫 Timer cancelled.")
-        with _lock:
-            _start_time = None
-            _duration   = None
-        return
-
-    # Timer finished naturally
-    print("\n" + "🔔 " * 10)
-    print("⏰  टाइमर खत्म हो गया!")
-    print("🔔 " * 10 + "\n")
-
-    play_alarm_sound(repeats=3)
-    speak("टाइमर खत्म हो गया।")
-
-    with _lock:
-        _start_time = None
-        _duration   = None
+def _next_due() -> int:
+    """Block (holding _cv) until the active timer is due; pop and return its id."""
+    while True:
+        # Replaced/cancelled timers are dropped lazily as they surface
+        while _heap and _heap[0] is not _active:
+            heapq.heappop(_heap)
+        if not _heap:
+            _cv.wait()
+            continue
+        remaining = _heap[0][0] - time.monotonic()
+        if remaining <= 0:
+            return heapq.heappop(_heap)[1]
+        _cv.wait(timeout=min(remaining, _MAX_WAIT))
+
+
+def _scheduler_loop() -> None:
+    global _active
+    while True:
+        with _cv:
+            timer_id = _next_due()
+
+        print("\n" + "🔔 " * 10)
+        print("⏰  टाइमर खत्म हो गया!")
+        print("🔔 " * 10 + "\n")
+
+        play_alarm_sound(repeats=3)
+        speak("टाइमर खत्म हो गया।")
+
+        with _cv:
+            if _active is not None and _active[1] == timer_id:   # not replaced while ringing
+                _active = None
+
+
+def _ensure_scheduler() -> None:
+    """Start the scheduler thread on first use (caller holds _cv)."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = threading.Thread(
+            target=_scheduler_loop, daemon=True, name="TimerScheduler",
+        )
+        _scheduler.start()
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -76,28 +96,20 @@ def _timer_worker(seconds: float, cancel_ev: threading.Event):
 def start_timer(seconds: float):
     """
     Start a new timer for `seconds` seconds.
-    If a timer is already running it is cancelled first.
+    If a timer is already running it is replaced.
 
     Args:
         seconds: Duration in seconds (float).
     """
-    global _timer_thread, _cancel_event
-
-    # Cancel any existing timer
-    if _timer_thread and _timer_thread.is_alive():
-        _cancel_event.set()
-        _timer_thread.join(timeout=1.0)
+    global _active
 
-    # Fresh cancel event for the new timer
-    _cancel_event = threading.Event()
+    with _cv:
+        _ensure_scheduler()
+        _active = (time.monotonic() + seconds, next(_ids))
+        heapq.heappush(_heap, _active)
+        _cv.notify()
 
-    _timer_thread = threading.Thread(
-        target=_timer_worker,
-        args=(seconds, _cancel_event),
-        daemon=True,
-        name="TimerWorker",
-    )
-    _timer_thread.start()
+    print(f"⏱️  Timer started: {seconds:.0f}s")
 
 
 def cancel_timer() -> bool:
@@ -105,33 +117,49 @@ def cancel_timer() -> bool:
     Cancel the running timer.
     Returns True if a timer was running, False if there was nothing to cancel.
     """
-    global _timer_thread, _cancel_event
+    global _active
 
-    if _timer_thread and _timer_thread.is_alive():
-        _cancel_event.set()
-        _timer_thread.join(timeout=1.0)
-        with _lock:
-            _start_time_val = _start_time   # will already be None after join
-        print("🚫 Timer cancelled by user.")
-        return True
-    return False
+    with _cv:
+        if _active is None:
+            return False
+        _active = None
+        _cv.notify()            # let the scheduler drop the stale entry
+    print("🚫 Timer cancelled by user.")
+    return True
 
 
 def get_remaining() -> float | None:
     """
     Return remaining seconds (float) or None if no timer is active.
     """
-    with _lock:
-        if _start_time is None or _duration is None:
-            return None
-        elapsed = time.monotonic() - _start_time
-        remaining = _duration - elapsed
-        return max(0.0, remaining)
+    active = _active
+    if active is None:
+        return None
+    return max(0.0, active[0] - time.monotonic())
 
 
 def is_running() -> bool:
     """True if a timer is currently active."""
-    return _timer_thread is not None and _timer_thread.is_alive()
+    return _active is not None
+
+
+# format_remaining() templates, keyed by which of (hours, minutes, seconds)
+# are non-zero; seconds are shown when non-zero or when nothing else is
+_NO_TIMER = "कोई टाइमर नहीं चल रहा।"
+_TMPL_S   = "%d सेकंड बाकी है।"
+_TMPL_HMS = {
+    (h, m, sec): " ".join(
+        unit for flag, unit in (
+            (h, "%(h)d घंटे"), (m, "%(m)d मिनट"), (sec or not (h or m), "%(s)d सेकंड"),
+        ) if flag
+    ) + " बाकी है।"
+    for h in (False, True) for m in (False, True) for sec in (False, True)
+}
+
+# Last (whole seconds, string) returned.  The text only changes once a
+# second, so repeat polls within that second reuse it.  One tuple store —
+# a racing caller at worst rebuilds the same string.
+_last_fmt: tuple[int, str] = (-1, "")
 
 
 def format_remaining() -> str:
@@ -141,18 +169,20 @@ def format_remaining() -> str:
     """
     rem = get_remaining()
     if rem is None:
-        return "कोई टाइमर नहीं चल रहा।"
-
-    total = int(math.ceil(rem))
-    hours, remainder = divmod(total, 3600)
-    minutes, seconds = divmod(remainder, 60)
-
-    parts = []
-    if hours:
-        parts.append(f"{hours} घंटे")
-    if minutes:
-        parts.append(f"{minutes} मिनट")
-    if seconds or not parts:
-        parts.append(f"{seconds} सेकंड")
-
-    return " ".join(parts) + " बाकी है।"
+        return _NO_TIMER
+
+    global _last_fmt
+    total = math.ceil(rem)
+    last  = _last_fmt
+    if last[0] == total:
+        return last[1]
+
+    if total < 60:                      # the common case: seconds only
+        text = _TMPL_S % total
+    else:
+        hours, remainder = divmod(total, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        tmpl = _TMPL_HMS[hours > 0, minutes > 0, seconds > 0]
+        text = tmpl % {"h": hours, "m": minutes, "s": seconds}
+    _last_fmt = (total, text)
+    return text
@@ -2,7 +2,7 @@
 utils/volume_control.py — Offline System Volume Control
 ========================================================
 Cross-platform volume control:
-  • Windows  : pycaw (preferred) → fallback to nircmd → fallback to PowerShell
+  • Windows  : pycaw (preferred) → fallback to nircmd → fallback to winmm waveOut
   • Linux/Pi : amixer (ALSA)
 
 All offline. No internet. Non-blocking.
@@ -15,10 +15,12 @@ Public API:
     mute()                → None
     unmute()              → None
     is_muted()            → bool
+    set_state(pct, muted) → int | None  (volume and/or mute in one call)
 """
 
 import platform
 import subprocess
+import threading
 
 _OS = platform.system()   # "Windows" or "Linux"
 
@@ -27,8 +29,11 @@ _OS = platform.system()   # "Windows" or "Linux"
 # ─────────────────────────────────────────────────────────────────────────────
 
 if _OS == "Windows":
+    import ctypes
+
     try:
         from ctypes import cast, POINTER
+        import comtypes
         from comtypes import CLSCTX_ALL
         from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
         _PYCAW = True
@@ -37,11 +42,28 @@ if _OS == "Windows":
         _PYCAW = False
         print("🔊 Volume backend: PowerShell (Windows fallback)")
 
+    # COM interface pointers belong to the thread that created them, so the
+    # activated IAudioEndpointVolume is cached per thread and reused
+    _vol_tls = threading.local()
+
     def _get_vol_interface():
-        """Lazy COM init — must be called from the thread that uses it."""
-        devices   = AudioUtilities.GetSpeakers()
-        interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-        return cast(interface, POINTER(IAudioEndpointVolume))
+        """Lazy COM init — cached for the calling thread after the first call."""
+        iface = getattr(_vol_tls, "iface", None)
+        if iface is None:
+            if not getattr(_vol_tls, "com_ready", False):
+                try:
+                    comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+                except OSError:
+                    pass            # apartment already initialised (main thread)
+                _vol_tls.com_ready = True
+            devices   = AudioUtilities.GetSpeakers()
+            interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+            iface = _vol_tls.iface = cast(interface, POINTER(IAudioEndpointVolume))
+        return iface
+
+    def _drop_vol_interface() -> None:
+        """Forget the cached interface (e.g. default device changed)."""
+        _vol_tls.iface = None
 
     def _ps_run(script: str) -> str:
         """Run a PowerShell one-liner and return stdout."""
@@ -56,7 +78,7 @@ if _OS == "Windows":
             try:
                 return round(_get_vol_interface().GetMasterVolumeLevelScalar() * 100)
             except Exception:
-                pass
+                _drop_vol_interface()
         # PowerShell fallback: use nircmd or WScript
         try:
             out = _ps_run(
@@ -74,7 +96,7 @@ if _OS == "Windows":
                 _get_vol_interface().SetMasterVolumeLevelScalar(pct / 100.0, None)
                 return pct
             except Exception:
-                pass
+                _drop_vol_interface()
         # nircmd fallback (0-65535 scale)
         try:
             subprocess.run(
@@ -82,13 +104,13 @@ if _OS == "Windows":
                 check=False, capture_output=True,
             )
         except FileNotFoundError:
-            # PowerShell WScript key-press fallback (approximate)
-            _ps_run(
-                f"$o=New-Object -ComObject WScript.Shell;"
-                f"for($i=0;$i-lt 50;$i++){{$o.SendKeys([char]174)}};"
-                f"$s=[math]::Round({pct}/2);"
-                f"for($i=0;$i-lt $s;$i++){{$o.SendKeys([char]175)}}"
-            )
+            # winmm fallback: sets the wave-out device level (not master),
+            # in-process — one DWORD with the 16-bit left/right levels
+            try:
+                level = int(pct / 100 * 0xFFFF)
+                ctypes.windll.winmm.waveOutSetVolume(0, (level << 16) | level)
+            except (OSError, AttributeError):
+                pass
         return pct
 
     def mute() -> None:
@@ -97,7 +119,7 @@ if _OS == "Windows":
                 _get_vol_interface().SetMute(1, None)
                 return
             except Exception:
-                pass
+                _drop_vol_interface()
         subprocess.run(["nircmd", "mutesysvolume", "1"],
                        check=False, capture_output=True)
 
@@ -107,7 +129,7 @@ if _OS == "Windows":
                 _get_vol_interface().SetMute(0, None)
                 return
             except Exception:
-                pass
+                _drop_vol_interface()
         subprocess.run(["nircmd", "mutesysvolume", "0"],
                        check=False, capture_output=True)
 
@@ -116,37 +138,102 @@ if _OS == "Windows":
             try:
                 return bool(_get_vol_interface().GetMute())
             except Exception:
-                pass
+                _drop_vol_interface()
         return False
 
+    def set_state(pct: int | None = None, muted: bool | None = None) -> int | None:
+        pct = None if pct is None else max(0, min(100, pct))
+        if _PYCAW:
+            try:
+                iface = _get_vol_interface()
+                if pct is not None:
+                    iface.SetMasterVolumeLevelScalar(pct / 100.0, None)
+                if muted is not None:
+                    iface.SetMute(int(muted), None)
+                return pct
+            except Exception:
+                _drop_vol_interface()
+        if pct is not None:
+            set_volume(pct)
+        if muted is not None:
+            (mute if muted else unmute)()
+        return pct
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Linux / Raspberry Pi backend — amixer (ALSA)
 # ─────────────────────────────────────────────────────────────────────────────
 
 else:
     import re as _re
+    import time as _time
 
     _AMIXER_CONTROL = "Master"   # change to "PCM" if Master doesn't work on Pi
 
-    def _amixer(args: list[str]) -> str:
-        result = subprocess.run(
-            ["amixer", "sset", _AMIXER_CONTROL] + args,
-            capture_output=True, text=True,
+    # First channel's "[NN%] ... [on|off]" — volume and switch from one read
+    _STATE_RE  = _re.compile(rb'\[(\d+)%\].*?\[(on|off)\]', _re.S)
+    _PCT_RE    = _re.compile(rb'\[(\d+)%\]')
+    _STATE_TTL = 0.2             # seconds a parsed amixer state stays valid
+
+    _state_lock  = threading.Lock()
+    _state_cache: tuple[float, int, bool] | None = None   # (monotonic, pct, muted)
+
+    def _run_amixer(args: list[str]) -> bytes:
+        """
+        Run amixer and return its raw stdout.  A bare Popen (no text decoding,
+        no stderr pipe, no reader thread) lets subprocess use posix_spawn.
+        """
+        proc = subprocess.Popen(
+            ["amixer", "-M"] + args,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
         )
-        return result.stdout
+        with proc:
+            return proc.stdout.read()
+
+    def _parse_state(out: bytes) -> tuple[int, bool] | None:
+        """(volume %, muted) from `amixer sget`/`sset` output, None if absent."""
+        m = _STATE_RE.search(out)
+        if m:
+            return int(m.group(1)), m.group(2) == b"off"
+        # Controls without a playback switch print no [on]/[off]
+        m = _PCT_RE.search(out)
+        return (int(m.group(1)), False) if m else None
+
+    def _store_state(state: tuple[int, bool] | None) -> None:
+        global _state_cache
+        with _state_lock:
+            _state_cache = None if state is None else (_time.monotonic(), *state)
+
+    def _amixer(args: list[str]) -> tuple[int, bool] | None:
+        """
+        Run `amixer -M sset` and return the new (volume %, muted).  sset
+        prints the control's state just like sget, so that output refreshes
+        the cache and the next get_volume()/is_muted() needs no fork.
+        -M uses the mapped (perceptual, dB-linear) volume scale throughout.
+        """
+        state = _parse_state(_run_amixer(["sset", _AMIXER_CONTROL] + args))
+        _store_state(state)
+        return state
+
+    def _read_state() -> tuple[int, bool]:
+        """(volume %, muted) from one `amixer sget`, reused for _STATE_TTL s."""
+        global _state_cache
+        with _state_lock:
+            now = _time.monotonic()
+            if _state_cache is not None and now - _state_cache[0] < _STATE_TTL:
+                return _state_cache[1], _state_cache[2]
+            out = _run_amixer(["sget", _AMIXER_CONTROL])
+            pct, muted = _parse_state(out) or (50, False)
+            _state_cache = (now, pct, muted)
+            return pct, muted
 
     def get_volume() -> int:
-        out = subprocess.run(
-            ["amixer", "sget", _AMIXER_CONTROL],
-            capture_output=True, text=True,
-        ).stdout
-        m = _re.search(r'\[(\d+)%\]', out)
-        return int(m.group(1)) if m else 50
+        return _read_state()[0]
 
     def set_volume(pct: int) -> int:
         pct = max(0, min(100, pct))
-        _amixer([f"{pct}%"])
-        return pct
+        state = _amixer([f"{pct}%"])
+        # Report what ALSA actually applied (mapped steps may round)
+        return state[0] if state else pct
 
     def mute() -> None:
         _amixer(["mute"])
@@ -155,11 +242,19 @@ else:
         _amixer(["unmute"])
 
     def is_muted() -> bool:
-        out = subprocess.run(
-            ["amixer", "sget", _AMIXER_CONTROL],
-            capture_output=True, text=True,
-        ).stdout
-        return "[off]" in out
+        return _read_state()[1]
+
+    def set_state(pct: int | None = None, muted: bool | None = None) -> int | None:
+        args = []
+        if pct is not None:
+            pct = max(0, min(100, pct))
+            args.append(f"{pct}%")
+        if muted is not None:
+            args.append("mute" if muted else "unmute")
+        if not args:
+            return None
+        state = _amixer(args)            # amixer takes level + switch in one call
+        return pct if pct is None or state is None else state[0]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -169,10 +264,10 @@ else:
 def increase_volume(step: int = 10) -> int:
     """Increase volume by `step` percent. Returns new volume."""
     current = get_volume()
-    return set_volume(current + step)
+    return set_state(pct=current + step)
 
 
 def decrease_volume(step: int = 10) -> int:
     """Decrease volume by `step` percent. Returns new volume."""
     current = get_volume()
-    return set_volume(current - step)
+    return set_state(pct=current - step)
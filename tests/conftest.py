@@ -0,0 +1,38 @@
+"""
+Test setup: modules import from src/ the same way main.py runs them.
+
+The tests never open an audio device.  When sounddevice cannot load
+(no PortAudio library, e.g. on CI), a bare placeholder module is installed
+so hardware-free code (parsers, MFCC maths, schedulers) still imports.
+"""
+
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+try:
+    import sounddevice  # noqa: F401
+except (ImportError, OSError):
+    _sd = types.ModuleType("sounddevice")
+    _sd.InputStream = _sd.RawInputStream = _sd.OutputStream = type("Stream", (), {})
+    _sd.PortAudioError = type("PortAudioError", (Exception,), {})
+    sys.modules["sounddevice"] = _sd
+
+
+_MODEL_DIR = os.path.join(os.path.dirname(__file__), "..", "models", "vosk-model-small-hi-0.22")
+
+
+@pytest.fixture(scope="session")
+def recognizer():
+    """core.recognizer; importing it loads the Vosk model from models/."""
+    pytest.importorskip("vosk")
+    if not os.path.isdir(_MODEL_DIR):
+        pytest.skip("Vosk model not present")
+    from utils import constants
+    constants.MODEL_PATH = _MODEL_DIR
+    from core import recognizer
+    return recognizer
@@ -0,0 +1,48 @@
+"""utils.auth.authenticate_user: PIN + background voice check."""
+
+import threading
+
+import numpy as np
+
+import utils.auth as auth
+from utils.auth import voice_auth
+
+
+def test_wrong_pin_silences_a_voice_check_already_running(monkeypatch):
+    started, release, finished = threading.Event(), threading.Event(), threading.Event()
+    out = []
+
+    def slow_mfcc(audio):
+        started.set()
+        release.wait(timeout=2)
+        return np.ones(13)
+
+    def tracked_verify(*args, **kwargs):
+        try:
+            return real_verify(*args, **kwargs)
+        finally:
+            finished.set()
+
+    real_verify = voice_auth.verify_voice_from_audio
+    monkeypatch.setattr(voice_auth, "load_voice_profile", lambda: np.ones((1, 13)) / np.sqrt(13))
+    monkeypatch.setattr(voice_auth, "_extract_mfcc", slow_mfcc)
+    monkeypatch.setattr(voice_auth, "print", lambda *a, **k: out.append(a[0]), raising=False)
+    monkeypatch.setattr(auth, "verify_voice_from_audio", tracked_verify)
+    monkeypatch.setattr(auth, "verify_pin", lambda text: started.wait(timeout=2) and False)
+
+    result = auth.authenticate_user("गलत", audio=np.zeros(16000, np.int16))
+    release.set()
+    assert finished.wait(timeout=2)
+
+    assert not result["authorized"]
+    assert not any("similarity" in line for line in out)
+
+
+def test_cancelled_before_start_does_no_work(monkeypatch):
+    def no_profile_load():
+        raise AssertionError("profile loaded after cancel")
+
+    monkeypatch.setattr(voice_auth, "load_voice_profile", no_profile_load)
+    cancel = threading.Event()
+    cancel.set()
+    assert voice_auth.verify_voice_from_audio(np.zeros(16000, np.int16), cancel) is False
@@ -0,0 +1,30 @@
+"""intents.math_intent: trie-based number parsing and operator detection."""
+
+import pytest
+
+from intents import math_intent
+from intents.math_intent import extract_math_intent
+
+
+def test_operator_words_are_lowercase():
+    # _detect_operator scans the lowercased utterance, so an uppercase key
+    # could never match.
+    assert all(w == w.lower() for w in math_intent.ALL_OP_WORDS)
+
+
+@pytest.mark.parametrize("text, num1, op, num2, result", [
+    ("twenty one plus 4",             21,   "add", 4,    25),     # multi-word key
+    ("दो सौ पांच प्लस एक हजार दो सौ", 205,  "add", 1200, 1405),   # compounds
+    ("पांच सात गुणा",                 5,    "mul", 7,    35),     # no run-together
+    ("3.5 x 2",                       3.5,  "mul", 2,    7),
+    ("Ten Minus Three",               10,   "sub", 3,    7),
+])
+def test_parses_numbers_and_operator(text, num1, op, num2, result):
+    r = extract_math_intent(text)
+    assert (r["num1"], r["op"], r["num2"], r["result"]) == (num1, op, num2, result)
+
+
+def test_division_by_zero_and_missing_number():
+    assert extract_math_intent("दस भाग शून्य")["result"] is None
+    assert extract_math_intent("पांच प्लस")["num2"] is None
+    assert extract_math_intent("आज मौसम कैसा है") is None
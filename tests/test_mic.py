@@ -0,0 +1,64 @@
+"""utils.mic: recordings at the negotiated device rate, stream stopped after."""
+
+import numpy as np
+import pytest
+
+from utils import mic
+from utils.constants import SAMPLE_RATE
+
+
+class _FakeStream:
+    def __init__(self, samplerate, **_kw):
+        self.rate    = samplerate
+        self.active  = False
+        self.pos     = 0
+        self.starts  = 0
+
+    def start(self):
+        self.active = True
+        self.starts += 1
+
+    def stop(self):
+        self.active = False
+
+    def close(self):
+        pass
+
+    def read(self, n):
+        assert self.active, "read from a stopped stream"
+        t = (self.pos + np.arange(n)) / self.rate
+        self.pos += n
+        pcm = (8000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+        return pcm[:, None], False
+
+
+@pytest.fixture
+def fake_mic(monkeypatch):
+    opened = []
+
+    def _open(**kw):
+        opened.append(_FakeStream(**kw))
+        return opened[-1]
+
+    monkeypatch.setattr(mic.sd, "InputStream", _open, raising=False)
+    monkeypatch.setattr(mic, "_stream", None)
+    monkeypatch.setattr(mic, "_rate", 44100)
+    monkeypatch.setattr(mic.atexit, "register", lambda fn: None)
+    return opened
+
+
+def test_record_resamples_from_device_rate_and_stops(fake_mic):
+    audio = mic.record(0.5)
+    audio2 = mic.record(0.25)
+
+    assert len(fake_mic) == 1                     # stream reused
+    stream = fake_mic[0]
+    assert stream.rate == 44100
+    assert not stream.active                      # stopped between recordings
+    assert stream.starts == 2
+
+    assert audio.dtype == np.int16
+    assert len(audio) == SAMPLE_RATE // 2
+    assert len(audio2) == SAMPLE_RATE // 4
+    # 440 Hz survives the conversion at roughly its input amplitude
+    assert 7000 < np.abs(audio[2000:]).max() <= 8100
@@ -0,0 +1,75 @@
+"""
+Intent parsers on the text the recognizer hands them: NFC normalisation,
+the shared number table, and the per-text parse caches.
+"""
+
+import unicodedata
+
+import pytest
+
+from intents._numbers      import NUMBER_WORDS, HOUR_WORDS_HINDI
+from intents.math_intent   import extract_math_intent
+from intents.timer_intent  import extract_timer_intent
+from intents.volume_intent import extract_volume_intent
+
+@pytest.fixture(scope="module")
+def normalize(recognizer):
+    return recognizer._normalize
+
+
+# ── Number table ──────────────────────────────────────────────────────────────
+
+def test_number_table_is_read_only_and_keeps_both_spellings():
+    with pytest.raises(TypeError):
+        NUMBER_WORDS["नया"] = 1
+    # anusvara and chandrabindu are different spellings, not NFC/NFD forms
+    assert NUMBER_WORDS["पांच"] == NUMBER_WORDS["पाँच"] == 5
+    assert NUMBER_WORDS["twenty one"] == 21
+    assert all(w == unicodedata.normalize("NFC", w) for w in NUMBER_WORDS)
+
+
+def test_hour_words_are_devanagari_one_to_twelve():
+    assert HOUR_WORDS_HINDI["बारह"] == 12
+    assert all(1 <= v <= 12 and not w.isascii() for w, v in HOUR_WORDS_HINDI.items())
+
+
+# ── NFC / NFD transcripts ─────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("form", ["NFC", "NFD"])
+def test_paanch_in_either_form_reaches_the_parsers(normalize, form):
+    def heard(s):
+        return normalize(unicodedata.normalize(form, s))
+
+    assert extract_timer_intent(heard("पाँच मिनट का टाइमर लगाओ"))["seconds"] == 300
+    assert extract_math_intent(heard("पाँच प्लस दो"))["result"] == 7
+    assert extract_volume_intent(heard("आवाज़ पचास प्रतिशत करो"))["percent"] == 50
+
+
+def test_precomposed_nukta_letters_are_normalised(normalize):
+    # U+095C ड़ and U+095B ज़ as single code points — NFC decomposes both,
+    # matching how "जोड़" and "आवाज़" are spelled in the keyword tables.
+    assert extract_math_intent("पाँच जोड़ो सात") is None
+    assert extract_math_intent(normalize("पाँच जोड़ो सात"))["result"] == 12
+    assert extract_volume_intent(normalize("आवाज़ बढ़ाओ"))["action"] == "increase"
+
+
+def test_ascii_transcript_is_returned_as_is(normalize):
+    text = "timer five minute"
+    assert normalize(text) is text
+
+
+# ── Per-text parse caches ─────────────────────────────────────────────────────
+
+def test_repeat_parses_reuse_the_cached_result():
+    first = extract_timer_intent("दो मिनट का टाइमर")
+    assert first == {"action": "start", "seconds": 120, "label": "2 मिनट"}
+    assert extract_timer_intent("दो मिनट का टाइमर") is first
+    assert extract_volume_intent("volume kam karo") is extract_volume_intent("volume kam karo")
+
+
+def test_caller_supplied_lower_and_tokens_match_own_normalisation():
+    text   = "Volume Pachaas Percent"
+    lower  = text.lower().strip()
+    tokens = tuple(lower.split())
+    assert extract_volume_intent(text, lower, tokens) == extract_volume_intent(text)
+    assert extract_volume_intent(text)["percent"] == 50
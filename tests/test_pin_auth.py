@@ -0,0 +1,36 @@
+"""utils.auth.pin_auth: spoken PIN → digits → constant-time digest compare."""
+
+import hashlib
+
+import pytest
+
+from utils.auth import pin_auth
+from utils.constants import AUTH_PIN_HASH
+
+
+@pytest.fixture
+def pin_5906(monkeypatch):
+    monkeypatch.setattr(pin_auth, "_AUTH_PIN_DIGEST", hashlib.sha256(b"5906").digest())
+
+
+def test_stored_digest_is_the_configured_hash():
+    assert pin_auth._AUTH_PIN_DIGEST.hex() == AUTH_PIN_HASH
+    assert pin_auth._hash_pin("1234") == hashlib.sha256(b"1234").digest()
+
+
+@pytest.mark.parametrize("spoken", [
+    "पाँच नौ शून्य छह",
+    "पांच नौ शून्य छह",
+    "Five nine ZERO six",
+    "5906",
+    "5 9 0 6",
+    "पाँच 9 zero ६",
+    "५९०६",
+])
+def test_accepted_spoken_forms(pin_5906, spoken):
+    assert pin_auth.verify_pin(spoken)
+
+
+@pytest.mark.parametrize("spoken", ["", "पाँच नौ शून्य", "5907", "fivenine zero six", "मेरा पिन"])
+def test_rejected(pin_5906, spoken):
+    assert not pin_auth.verify_pin(spoken)
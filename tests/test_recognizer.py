@@ -0,0 +1,26 @@
+"""core.recognizer: the real-time callback and the ASR worker's reporting."""
+
+import logging
+import queue
+import threading
+
+
+def test_full_queue_drops_are_counted_and_reported_by_the_worker(recognizer, monkeypatch, caplog):
+    q = queue.Queue(maxsize=1)
+    monkeypatch.setattr(recognizer, "_audio_q", q)
+    monkeypatch.setattr(recognizer, "_dropped", 0)
+    printed = []
+    monkeypatch.setattr(recognizer, "print", lambda *a, **k: printed.append(a), raising=False)
+
+    for _ in range(3):
+        recognizer.callback(b"\0\0" * 4, 4, None, None)
+    assert q.qsize() == 1 and recognizer._dropped == 2
+    assert printed == []                        # no stdout I/O on the audio thread
+
+    processed = threading.Event()
+    monkeypatch.setattr(recognizer, "_resampler", None)
+    monkeypatch.setattr(recognizer, "_process_block", lambda buf: processed.set())
+    with caplog.at_level(logging.WARNING, logger=recognizer.__name__):
+        threading.Thread(target=recognizer._asr_worker, daemon=True).start()
+        assert processed.wait(timeout=2)
+    assert "2 audio block(s) dropped" in caplog.text
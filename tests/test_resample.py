@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from utils import resample
+from utils.resample import StreamResampler
+
+RATE_IN, RATE_OUT = 44100, 16000
+
+
+def _sine(seconds: float, freq: float = 440.0) -> np.ndarray:
+    t = np.arange(int(RATE_IN * seconds)) / RATE_IN
+    return (10000 * np.sin(2 * np.pi * freq * t)).astype(np.int16)
+
+
+def _in_blocks(rs: StreamResampler, x: np.ndarray, sizes) -> np.ndarray:
+    out, i = [], 0
+    for n in sizes:
+        out.append(rs.process(x[i:i + n]))
+        i += n
+    out.append(rs.process(x[i:]))
+    return np.concatenate(out)
+
+
+@pytest.fixture(params=[True, False], ids=["polyphase", "interp"])
+def backend(request, monkeypatch):
+    if request.param and not resample._SCIPY_AVAILABLE:
+        pytest.skip("scipy not installed")
+    monkeypatch.setattr(resample, "_SCIPY_AVAILABLE", request.param)
+
+
+def test_blocked_output_matches_one_shot(backend):
+    x = _sine(3.0)
+    whole = StreamResampler(RATE_IN, RATE_OUT).process(x)
+
+    rng     = np.random.default_rng(0)
+    blocked = _in_blocks(StreamResampler(RATE_IN, RATE_OUT), x,
+                         rng.integers(1, 30000, size=12))
+    assert np.array_equal(blocked, whole)
+    # No drift: 3 s in → 3 s out, to within the last sample
+    assert abs(len(blocked) - 3 * RATE_OUT) <= 1
+
+
+def test_sine_in_half_second_blocks_has_no_discontinuities(backend):
+    x   = _sine(2.0)
+    out = _in_blocks(StreamResampler(RATE_IN, RATE_OUT), x,
+                     [RATE_IN // 2] * 3).astype(np.int64)
+
+    # A 440 Hz, 10000-peak sine moves at most 2π·440/16000·10000 ≈ 1728
+    # per output sample; a block-edge glitch would show up as a larger step.
+    max_step = 2 * np.pi * 440 / RATE_OUT * 10000
+    assert np.abs(np.diff(out)).max() <= max_step + 20
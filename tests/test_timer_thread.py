@@ -0,0 +1,65 @@
+"""utils.timer_thread: heap scheduler — fire, replace, cancel, formatting."""
+
+import threading
+import time
+
+import pytest
+
+from utils import timer_thread
+
+
+@pytest.fixture
+def rings(monkeypatch):
+    fired = []
+    done  = threading.Event()
+
+    def _speak(text):
+        fired.append(text)
+        done.set()
+
+    monkeypatch.setattr(timer_thread, "play_alarm_sound", lambda repeats=1: None)
+    monkeypatch.setattr(timer_thread, "speak", _speak)
+    monkeypatch.setattr(timer_thread, "print", lambda *a, **k: None, raising=False)
+    yield fired, done
+    timer_thread.cancel_timer()
+
+
+def test_timer_fires_once_and_clears(rings):
+    fired, done = rings
+    timer_thread.start_timer(0.05)
+    assert timer_thread.is_running()
+    assert done.wait(2.0)
+    time.sleep(0.05)
+    assert fired == ["टाइमर खत्म हो गया।"]
+    assert not timer_thread.is_running()
+    assert timer_thread.get_remaining() is None
+
+
+def test_replaced_timer_rings_only_for_the_new_deadline(rings):
+    fired, done = rings
+    timer_thread.start_timer(0.1)
+    timer_thread.start_timer(0.3)
+    start = time.monotonic()
+    assert done.wait(2.0)
+    assert time.monotonic() - start >= 0.25
+    time.sleep(0.2)
+    assert len(fired) == 1
+
+
+def test_cancelled_timer_never_rings(rings):
+    fired, done = rings
+    timer_thread.start_timer(0.1)
+    assert timer_thread.cancel_timer()
+    assert not timer_thread.cancel_timer()
+    assert not done.wait(0.3)
+    assert fired == []
+
+
+def test_format_remaining(rings):
+    assert timer_thread.format_remaining() == "कोई टाइमर नहीं चल रहा।"
+    timer_thread.start_timer(3725 - 0.5)
+    assert timer_thread.format_remaining() == "1 घंटे 2 मिनट 5 सेकंड बाकी है।"
+    timer_thread.start_timer(120 - 0.5)
+    assert timer_thread.format_remaining() == "2 मिनट बाकी है।"
+    timer_thread.start_timer(42 - 0.5)
+    assert timer_thread.format_remaining() == "42 सेकंड बाकी है।"
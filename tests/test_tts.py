@@ -0,0 +1,131 @@
+import io
+import threading
+import time
+
+import pytest
+
+from core import tts
+
+
+class _FakeProc:
+    def __init__(self, argv, **kwargs):
+        self.argv  = argv
+        self.stdin = io.BytesIO()
+
+    def poll(self):
+        return None
+
+
+def test_espeak_reads_lines_not_stdin_until_eof(monkeypatch):
+    procs = []
+
+    def fake_popen(argv, **kwargs):
+        procs.append(_FakeProc(argv, **kwargs))
+        return procs[-1]
+
+    monkeypatch.setattr(tts.subprocess, "Popen", fake_popen)
+    monkeypatch.setattr(tts, "_espeak_proc", None)
+
+    tts._speak_espeak("नमस्ते", blocking=False)
+    tts._speak_espeak("दो\nलाइन", blocking=False)
+
+    assert len(procs) == 1                                  # process reused
+    assert procs[0].argv == ["espeak-ng", "-v", "hi"]       # no --stdin
+    assert procs[0].stdin.getvalue() == "नमस्ते\nदो लाइन\n".encode("utf-8")
+
+
+def test_repeat_of_playing_text_is_spoken_again(monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    spoken = []
+
+    def fake_do_speak(text):
+        spoken.append(text)
+        started.set()
+        release.wait(timeout=2)
+
+    monkeypatch.setattr(tts, "_do_speak", fake_do_speak)
+    monkeypatch.setattr(tts, "print", lambda *a: None, raising=False)
+
+    tts.speak("दोबारा बोलिए", blocking=False)
+    assert started.wait(timeout=2)          # first copy is now playing
+    tts.speak("दोबारा बोलिए", blocking=False)
+    tts.speak("दोबारा बोलिए", blocking=False)   # still queued → merged
+    release.set()
+    tts.speak("बस", blocking=True)
+
+    assert spoken == ["दोबारा बोलिए", "दोबारा बोलिए", "बस"]
+
+
+def test_backed_up_misses_are_cached_one_by_one(monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    synthesised, spoken = [], []
+
+    def fake_do_speak(text):
+        spoken.append(text)
+        started.set()
+        release.wait(timeout=2)
+
+    def fake_synthesize_cached(text):
+        synthesised.append(text)
+        return True
+
+    monkeypatch.setattr(tts, "_do_speak", fake_do_speak)
+    monkeypatch.setattr(tts, "_synthesize_cached", fake_synthesize_cached)
+    monkeypatch.setattr(tts, "_is_cached", lambda text: False)
+    monkeypatch.setattr(tts, "_PYGAME_AVAILABLE", True)
+    monkeypatch.setattr(tts, "print", lambda *a: None, raising=False)
+
+    tts.speak("पहला", blocking=False)
+    assert started.wait(timeout=2)
+    for text in ("दूसरा", "तीसरा", "चौथा"):     # back up behind the first
+        tts.speak(text, blocking=False)
+    release.set()
+    deadline = time.monotonic() + 2
+    while len(spoken) < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert sorted(synthesised) == sorted(["दूसरा", "तीसरा", "चौथा"])   # never joined
+    assert spoken == ["पहला", "दूसरा", "तीसरा", "चौथा"]
+
+
+def test_blocking_espeak_waits_for_its_own_process(monkeypatch):
+    runs = []
+    monkeypatch.setattr(tts.subprocess, "run", lambda argv, **kw: runs.append(argv))
+    monkeypatch.setattr(tts.subprocess, "Popen",
+                        lambda *a, **k: pytest.fail("blocking call used the shared process"))
+    monkeypatch.setattr(tts, "_espeak_proc", None)
+
+    tts._speak_espeak("सूचना\nबोलिए", blocking=True)
+
+    assert runs == [["espeak-ng", "-v", "hi", "सूचना बोलिए"]]
+
+
+def test_blocking_caller_does_not_wait_for_texts_queued_behind_it(monkeypatch):
+    started, release, later = threading.Event(), threading.Event(), threading.Event()
+    spoken = []
+
+    def fake_do_speak(text):
+        spoken.append(text)
+        if text == "पहला":
+            started.set()
+            release.wait(timeout=2)
+        elif text == "टाइमर":
+            later.wait(timeout=2)               # still playing while "प्रॉम्प्ट" returns
+
+    monkeypatch.setattr(tts, "_do_speak", fake_do_speak)
+    monkeypatch.setattr(tts, "_is_cached", lambda text: True)
+    monkeypatch.setattr(tts, "print", lambda *a: None, raising=False)
+
+    tts.speak("पहला", blocking=False)
+    assert started.wait(timeout=2)
+    returned = threading.Event()
+    caller = threading.Thread(target=lambda: (tts.speak("प्रॉम्प्ट"), returned.set()))
+    caller.start()
+    time.sleep(0.05)                            # "प्रॉम्प्ट" is queued first
+    tts.speak("टाइमर", blocking=False)          # same batch, behind the prompt
+    release.set()
+
+    assert returned.wait(timeout=2)
+    assert spoken[-1] == "टाइमर" and not later.is_set()
+    later.set()
+    caller.join(timeout=2)
@@ -0,0 +1,64 @@
+"""utils.auth.voice_auth: the NumPy MFCC front-end against the reference."""
+
+import numpy as np
+import pytest
+
+from utils.auth import voice_auth
+from utils.constants import SAMPLE_RATE
+
+
+def _clip(n: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    t   = np.arange(n) / SAMPLE_RATE
+    return (6000 * np.sin(2 * np.pi * 220 * t) + rng.normal(0, 800, n)).astype(np.int16)
+
+
+@pytest.mark.parametrize("n", [300, 400, 401, 555, SAMPLE_RATE])
+def test_mfcc_mean_matches_python_speech_features(n):
+    psf = pytest.importorskip("python_speech_features")
+    pcm = _clip(n)
+    ref = psf.mfcc(pcm / 32768.0, samplerate=SAMPLE_RATE, nfft=512).mean(axis=0)
+    np.testing.assert_allclose(voice_auth._mfcc_mean(pcm), ref, rtol=1e-9, atol=1e-9)
+
+
+def test_extract_mfcc_trims_silence_and_caches():
+    voiced = _clip(SAMPLE_RATE // 2)
+    padded = np.concatenate((np.zeros(8000, np.int16), voiced, np.zeros(8000, np.int16)))
+    vec = voice_auth._extract_mfcc(padded)
+    assert voice_auth._extract_mfcc(padded) is vec          # cache hit
+    assert not vec.flags.writeable
+    np.testing.assert_allclose(vec, voice_auth._mfcc_mean(voice_auth._trim_silence(padded)))
+    assert voice_auth._extract_mfcc(np.zeros(0, np.int16)) is None
+
+
+def test_enroll_reports_each_pass_and_repeats_a_failed_one(monkeypatch, tmp_path):
+    clips = iter([np.zeros(0, np.int16), _clip(8000), _clip(9000), _clip(10000)])
+    out   = []
+    monkeypatch.setattr(voice_auth, "_record_audio", lambda duration: next(clips))
+    monkeypatch.setattr(voice_auth, "print", lambda *a, **k: out.append(" ".join(map(str, a))),
+                        raising=False)
+    monkeypatch.setattr("builtins.input", lambda prompt="": out.append("<enter>"))
+    monkeypatch.setattr(voice_auth, "VOICE_PROFILE_PATH", str(tmp_path / "profile.npy"))
+    monkeypatch.setattr(voice_auth, "_profile_cache", None)
+    monkeypatch.setattr(voice_auth, "_profile_mtime", None)
+
+    assert voice_auth.enroll_voice(passes=3)
+
+    status = [line.strip() for line in out if line.startswith(("   ✅", "   ⚠️", "<enter>"))]
+    assert status == [
+        "<enter>", "⚠️  Pass 1 failed — please repeat it.",
+        "<enter>", "✅ Pass 1 recorded.",
+        "<enter>", "✅ Pass 2 recorded.",
+        "✅ Pass 3 recorded.",
+    ]
+    assert np.load(tmp_path / "profile.npy").shape == (1, 13)
+
+
+def test_mfcc_cache_is_safe_under_concurrent_eviction():
+    from concurrent.futures import ThreadPoolExecutor
+
+    clips = [_clip(4000 + 160 * k) for k in range(12)]   # more clips than cache slots
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        vecs = list(pool.map(voice_auth._extract_mfcc, clips * 20))
+    for clip, vec in zip(clips * 20, vecs):
+        np.testing.assert_allclose(vec, voice_auth._mfcc_mean(voice_auth._trim_silence(clip)))
@@ -12,9 +12,12 @@ as close as possible, giving the highest similarity score.
 
 Usage:
     cd Offline-Voice-Assistant
-    python voice_enroll.py
+    python voice_enroll.py                        # 3 passes × 4 s
+    python voice_enroll.py --passes 1 --duration 5
+    python voice_enroll.py --append               # add a second user
 """
 
+import argparse
 import sys
 import os
 
@@ -25,12 +28,23 @@ from utils.auth.voice_auth import enroll_voice
 from utils.constants       import VOICE_PROFILE_PATH
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record and save a voice profile.")
+    parser.add_argument("--passes", type=int, default=3,
+                        help="number of recordings to average (default 3)")
+    parser.add_argument("--duration", type=float, default=4.0,
+                        help="max seconds per recording (default 4.0)")
+    parser.add_argument("--append", action="store_true",
+                        help="add to the enrolled profiles instead of replacing them")
+    args = parser.parse_args()
+    if args.passes < 1:
+        parser.error("--passes must be at least 1")
+
     print("=" * 55)
     print("🎤  Voice Enrollment — Hindi Voice Assistant")
     print("=" * 55)
     print()
-    print("यह स्क्रिप्ट आपकी आवाज़ को 3 बार रिकॉर्ड करेगी।")
-    print("(This script records your voice 3 times and averages them.)")
+    print(f"यह स्क्रिप्ट आपकी आवाज़ को {args.passes} बार रिकॉर्ड करेगी।")
+    print(f"(This script records your voice {args.passes} times and averages them.)")
     print()
     print("⚠️  महत्वपूर्ण — IMPORTANT:")
     print("   हर बार अपना PIN बोलें (the words you use as your alarm PIN)")
@@ -45,7 +59,7 @@ if __name__ == "__main__":
     input("तैयार हैं? Enter दबाएं... (Ready? Press Enter...)")
     print()
 
-    success = enroll_voice(duration=4.0, passes=3)
+    success = enroll_voice(duration=args.duration, passes=args.passes, append=args.append)
 
     if success:
         print()
@@ -57,5 +71,5 @@ if __name__ == "__main__":
     else:
         print()
         print("❌ नामांकन विफल। (Enrollment failed.)")
-        print("   Make sure python_speech_features is installed:")
-        print("   pip install python_speech_features")
+        print("   Make sure the microphone works and numpy/scipy are installed:")
+        print("   pip install -r requirements.txt")